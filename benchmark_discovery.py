@@ -0,0 +1,71 @@
+# Copyright Notice:
+# Copyright 2016 Distributed Management Task Force, Inc. All rights reserved.
+# License: BSD 3-Clause License. For full text see link: https://github.com/DMTF/Redfish-Service-Conformance-Check/LICENSE.md
+
+# Name: benchmark_discovery
+# Description: This module times the discovery of the relative uris of a service
+#   (SUT.collect_relative_uris) on synthetic services of increasing size, without a SUT: the GET
+#   requests of the crawler are answered from an in memory resource tree. The time per resource
+#   should stay about the same as the number of resources grows.
+#   Usage: python benchmark_discovery.py [number of resources ...]
+
+import sys
+import time
+import os
+import rf_utility
+from rf_sut import SUT
+
+# map python 2 vs 3 imports
+if (sys.version_info < (3, 0)):
+    from StringIO import StringIO
+else:
+    from io import StringIO
+
+###################################################################################################
+# Name: build_service(resources)
+#   Builds the resources of a synthetic service: a system with a log service whose Entries
+#   collection has the requested number of log entries (linked back to the system)
+# Returns:
+#   dict of uri : json payload
+###################################################################################################
+def build_service(resources):
+    service = dict()
+    service['/redfish/v1/'] = {'@odata.id' : '/redfish/v1/', 'Systems' : {'@odata.id' : '/redfish/v1/Systems'}}
+    service['/redfish/v1/Systems'] = {'@odata.id' : '/redfish/v1/Systems', 'Members' : [{'@odata.id' : '/redfish/v1/Systems/1'}]}
+    service['/redfish/v1/Systems/1'] = {'@odata.id' : '/redfish/v1/Systems/1', 'LogServices' : {'@odata.id' : '/redfish/v1/Systems/1/LogServices'}}
+    service['/redfish/v1/Systems/1/LogServices'] = {'@odata.id' : '/redfish/v1/Systems/1/LogServices', 'Members' : [{'@odata.id' : '/redfish/v1/Systems/1/LogServices/Log'}]}
+    service['/redfish/v1/Systems/1/LogServices/Log'] = {'@odata.id' : '/redfish/v1/Systems/1/LogServices/Log', 'Entries' : {'@odata.id' : '/redfish/v1/Systems/1/LogServices/Log/Entries'}}
+    entries = ['/redfish/v1/Systems/1/LogServices/Log/Entries/%s' % entry for entry in range(resources)]
+    service['/redfish/v1/Systems/1/LogServices/Log/Entries'] = {'@odata.id' : '/redfish/v1/Systems/1/LogServices/Log/Entries', 'Members' : [{'@odata.id' : entry} for entry in entries]}
+    for entry in entries:
+        service[entry] = {'@odata.id' : entry, 'Links' : {'OriginOfCondition' : {'@odata.id' : '/redfish/v1/Systems/1'}}}
+    return service
+
+###################################################################################################
+# Name: time_discovery(resources)
+#   Crawls a synthetic service with the requested number of resources
+# Returns:
+#   seconds of the crawl, number of relative uris found
+###################################################################################################
+def time_discovery(resources):
+    service = build_service(resources)
+    sut = SUT({'DnsName' : 'benchmark', 'LoginName' : '', 'Password' : '', 'DisplayName' : 'benchmark'})
+    sut.http_GET = lambda uri, rq_headers, auth_on_off, read_body = True: (service.get(uri), {'content-type' : 'application/json'}, rf_utility.HTTP_OK if uri in service else rf_utility.HTTP_NOT_FOUND)
+
+    # the crawler prints every uri it finds
+    stdout = sys.stdout
+    sys.stdout = StringIO()
+    try:
+        start = time.time()
+        sut.collect_relative_uris('/redfish/v1/')
+        elapsed = time.time() - start
+    finally:
+        sys.stdout = stdout
+    return elapsed, len(sut.relative_uris)
+
+if __name__ == "__main__":
+    sizes = [int(size) for size in sys.argv[1:]] or [2500, 5000, 10000, 20000]
+    print('%10s %10s %10s %14s' % ('resources', 'uris', 'seconds', 'us/resource'))
+    for resources in sizes:
+        elapsed, uris = time_discovery(resources)
+        print('%10s %10s %10.3f %14.1f' % (resources, uris, elapsed, elapsed * 1000000 / max(uris, 1)))
@@ -42,6 +42,8 @@ class Log:
         self.WARN = 'WARN'
         self.FAIL = 'FAIL'
         self.INCOMPLETE = 'PASS (Incomplete). Check Log for details' # to remove
+        # assertion skipped when its deadline (or the run deadline) expired, see SUT.run_assertion()
+        self.TIMEOUT = 'TIMEOUT'
 
         # Redfish latest spec url
         self.RedfishSpecHyperlinkPath = 'https://www.dmtf.org/sites/default/files/standards/documents/DSP0266_1.0.2.pdf'
@@ -54,6 +56,9 @@ class Log:
         # Following will get set based on the SUT DisplayName from the properties.json when the tool runs...
         # Path of SUTs destination log folder within the general logs folder
         self.SUT_log_Folder = None
+        # optional function returning notes on the requests of the current assertion (for example 
+        # retried requests) which are logged with the assertion status, set by rfs_test.run()
+        self.request_notes = None
 
     ###############################################################################################
     # Name: init_xl
@@ -72,6 +77,7 @@ class Log:
         self.xl_WARN = PatternFill(fill_type='solid', start_color=colors.YELLOW, end_color=colors.YELLOW)
         self.xl_FAIL = PatternFill(fill_type='solid', start_color=colors.RED, end_color=colors.RED)
         self.xl_INCOMPLETE = PatternFill(fill_type='solid', start_color=colors.GREEN, end_color=colors.GREEN) # to remove or fix
+        self.xl_TIMEOUT = PatternFill(fill_type='solid', start_color='FFC0C0C0', end_color='FFC0C0C0')
         
         ## alignment and word wrap - used when writing the log header to the top of the spreadsheet
         self.xl_Alignment = Alignment(horizontal='center',\
@@ -96,7 +102,8 @@ class Log:
             self.PASS : 0,\
             self.WARN : 0,\
             self.FAIL : 0,\
-            self.INCOMPLETE : 0
+            self.INCOMPLETE : 0,\
+            self.TIMEOUT : 0
         }
 
         ## set to ID of Assertion currently being run - this becomes the 'key' into the spreadsheet 
@@ -287,6 +294,8 @@ class Log:
                 asx_handle.cell(row=zrow, column=self.Assertion_ID_column).fill = self.xl_FAIL
             elif (pwf_stat == self.INCOMPLETE):
                 asx_handle.cell(row=zrow, column=self.Assertion_ID_column).fill = self.xl_PASS
+            elif (pwf_stat == self.TIMEOUT):
+                asx_handle.cell(row=zrow, column=self.Assertion_ID_column).fill = self.xl_TIMEOUT
 
             self.save_assertions_xl()
      
@@ -386,6 +395,7 @@ class Log:
             self.Assertion_Counter[self.FAIL] = 0
             self.Assertion_Counter[self.WARN] = 0
             self.Assertion_Counter[self.INCOMPLETE] = 0
+            self.Assertion_Counter[self.TIMEOUT] = 0
 
             # 
             ## End open/initialize log files
@@ -393,7 +403,7 @@ class Log:
         elif (log_control == 'CLOSE'):
             self.AssertionID = None
             # log the tally of pass/warn/fail stats and close the log files
-            completion_str = '\n Assertions Stats:\n Passed= %s Warn= %s Failed= %s \n Total Assertions Run= %s' % (str(self.Assertion_Counter[self.PASS] + self.Assertion_Counter[self.INCOMPLETE]), str(self.Assertion_Counter[self.WARN]), str(self.Assertion_Counter[self.FAIL]), str(self.Assertion_Counter[self.PASS] + self.Assertion_Counter[self.INCOMPLETE] + self.Assertion_Counter[self.WARN] + self.Assertion_Counter[self.FAIL]))
+            completion_str = '\n Assertions Stats:\n Passed= %s Warn= %s Failed= %s Timed out= %s \n Total Assertions Run= %s' % (str(self.Assertion_Counter[self.PASS] + self.Assertion_Counter[self.INCOMPLETE]), str(self.Assertion_Counter[self.WARN]), str(self.Assertion_Counter[self.FAIL]), str(self.Assertion_Counter[self.TIMEOUT]), str(self.Assertion_Counter[self.PASS] + self.Assertion_Counter[self.INCOMPLETE] + self.Assertion_Counter[self.WARN] + self.Assertion_Counter[self.FAIL] + self.Assertion_Counter[self.TIMEOUT]))
 
             self.assertion_log('line', completion_str)
             self.assertion_log('XL_LOG_HEADER', completion_str)
@@ -421,7 +431,7 @@ class Log:
         
         # pass fail to the text log file and color code the assertion row in the assertion spreadsheet
         # and increment pass/warn/fail counters
-        elif (log_control == self.PASS) or (log_control == self.WARN) or (log_control == self.FAIL) or (log_control == self.INCOMPLETE):
+        elif (log_control == self.PASS) or (log_control == self.WARN) or (log_control == self.FAIL) or (log_control == self.INCOMPLETE) or (log_control == self.TIMEOUT):
             # mark/color the assertion id column of the spreadsheet and get the description text
             # for the assertion 
             assertion_description = self.assert_xl(assertion_id, log_control)
@@ -435,6 +445,14 @@ class Log:
 
             self.TextLogHandle.write(log_string)
             print(log_string)
+
+            # notes on the requests of this assertion, so retried requests are visible in the results
+            if self.request_notes:
+                request_notes = self.request_notes()
+                if request_notes:
+                    self.TextLogHandle.write(request_notes + '\n')
+                    print(request_notes + '\n')
+                    self.assertion_log('XL_COMMENT', request_notes)
                 
             # increment the pass/warn/fail counter
             self.Assertion_Counter[log_control] += 1
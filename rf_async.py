@@ -0,0 +1,518 @@
+# Copyright Notice:
+# Copyright 2016 Distributed Management Task Force, Inc. All rights reserved.
+# License: BSD 3-Clause License. For full text see link: https://github.com/DMTF/Redfish-Service-Conformance-Check/LICENSE.md
+
+# File: rf_async.py
+#   This module contains the asyncio transport of the tool (python 3.5+): a minimal HTTP/1.1 client
+#   on asyncio streams with a per-SUT pool of keep-alive streams and a per-SUT concurrency limit,
+#   and async counterparts of the http__XXX() request functions in rf_utility. Response headers,
+#   redirects, cookies, gzip and json are handled by the same helpers as the synchronous requests,
+#   so both transports return the same (payload, headers, status) results.
+#   A single event loop can drive the requests of several SUTs, each SUT is limited by its own
+#   AsyncConnectionPool
+
+import sys
+import time
+import asyncio
+import json
+from urllib.parse import urlparse
+
+import rf_utility
+
+# status codes which never carry a response body
+NO_BODY_STATUS = (204, 304)
+
+# connection errors after which a GET, HEAD or OPTIONS request on a reused (idle) stream is retried
+# on a new stream, if the status line of the response was not read
+STALE_STREAM_ERRORS = (ConnectionError, EOFError)
+
+###################################################################################################
+# Name: open_stream(scheme, host, port)
+# Description:
+#   default stream opener of AsyncConnectionPool; opens a tcp stream to the service with
+#   asyncio.open_connection(), using the shared ssl context of rf_utility for https.
+#   A different opener (for example a proxy tunnel or an alternative event loop library) with the
+#   same signature can be given to AsyncConnectionPool
+# Returns:
+#   (reader, writer) pair of the stream
+###################################################################################################
+async def open_stream(scheme, host, port) :
+    if scheme == 'http':
+        return await asyncio.open_connection(host, port)
+    return await asyncio.open_connection(host, port, ssl = rf_utility.get_ssl_context(), server_hostname = host)
+#
+## end open_stream
+
+###################################################################################################
+# Class: ReplayStreamWriter
+#   stream writer of a replay stream: each request written to it is answered from the
+#   rf_utility.TrafficReplay by feeding the recorded response to the reader of the stream
+###################################################################################################
+class ReplayStreamWriter():
+    def __init__(self, replay, reader):
+        self.replay = replay
+        self.reader = reader
+        self.closing = False
+
+    def write(self, request):
+        head, _, rq_body = request.partition(b'\r\n\r\n')
+        lines = head.decode('iso-8859-1').split('\r\n')
+        http_req, url_path = lines[0].split(' ')[:2]
+        header_list = [line.split(':', 1) for line in lines[1:]]
+        header_list = [(key.strip(), value.strip()) for key, value in header_list]
+        response = self.replay.match(http_req, url_path, header_list, rq_body if rq_body else None)
+        if response == None:
+            # the request failed when it was recorded
+            self.reader.feed_eof()
+            return
+        status, reason, r_header_list, r_body = response
+        if http_req == 'HEAD' or status in NO_BODY_STATUS:
+            r_body = b''
+        r_head = ['HTTP/1.1 %s %s' % (status, reason)] + ['%s: %s' % (key, value) for key, value in r_header_list]
+        self.reader.feed_data(('\r\n'.join(r_head) + '\r\n\r\n').encode('iso-8859-1') + r_body)
+
+    async def drain(self):
+        pass
+
+    def is_closing(self):
+        return self.closing
+
+    def close(self):
+        self.closing = True
+
+###################################################################################################
+# Name: replay_opener(replay)
+# Description:
+#   returns a stream opener for AsyncConnectionPool which answers the requests from the
+#   rf_utility.TrafficReplay replay instead of connecting to the service
+###################################################################################################
+def replay_opener(replay) :
+    async def open_replay_stream(scheme, host, port) :
+        reader = asyncio.StreamReader()
+        return reader, ReplayStreamWriter(replay, reader)
+    return open_replay_stream
+#
+## end replay_opener
+
+###################################################################################################
+# Class: AsyncResponse
+#   Response recieved thru the asyncio transport; the body is read completely when the response
+#   is received
+###################################################################################################
+class AsyncResponse():
+    def __init__(self, status, reason, header_list, body, will_close):
+        self.status = status
+        self.reason = reason
+        self.header_list = header_list
+        self.body = body
+        self.will_close = will_close
+
+    def getheaders(self):
+        return self.header_list
+
+    def getheader(self, name, default = None):
+        for key, value in self.header_list:
+            if key.lower() == name.lower():
+                return value
+        return default
+
+###################################################################################################
+# Class: AsyncConnectionPool
+#   Keep-alive streams of a SUT for the asyncio transport, keyed by (scheme, netloc).
+#   The semaphore limits the requests in flight to the SUT (MaxConcurrentRequests). Streams and
+#   semaphore belong to the event loop running the requests, they are dropped when the pool is used
+#   from another event loop
+###################################################################################################
+class AsyncConnectionPool():
+    def __init__(self, sut_prop, max_concurrency = 8, opener = None):
+        self.sut_prop = sut_prop
+        self.max_concurrency = max_concurrency
+        self.opener = opener if opener else open_stream
+        self.idle_streams = dict()
+        self.semaphore = None
+        self.loop = None
+        # SessionAuth of the SUT, shared with the ConnectionPool of the synchronous requests
+        self.session_auth = None
+        # wall clock time the current assertion of the SUT has to complete by, or None
+        self.deadline = None
+        # TrafficRecorder, current assertion id and RequestMetrics, shared with the ConnectionPool of the 
+        # synchronous requests
+        self.recorder = None
+        self.assertion_id = None
+        self.metrics = None
+        self.stats = {'created' : 0, 'reused' : 0, 'reconnected' : 0, 'closed_by_server' : 0, 'retried' : 0}
+
+    ###############################################################################################
+    # Name: limit()
+    #   returns the semaphore limiting the requests in flight to this SUT
+    ###############################################################################################
+    def limit(self):
+        self.bind_loop()
+        if self.semaphore == None:
+            self.semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self.semaphore
+
+    ###############################################################################################
+    # Name: bind_loop()
+    #   binds the pool to the running event loop, dropping streams of a previous event loop
+    ###############################################################################################
+    def bind_loop(self):
+        loop = asyncio.get_event_loop()
+        if self.loop is not loop:
+            self.close_all()
+            self.semaphore = None
+            self.loop = loop
+
+    ###############################################################################################
+    # Name: remaining()
+    #   returns the seconds left until the deadline of the SUT requests, None if there is none
+    ###############################################################################################
+    def remaining(self):
+        deadline = self.deadline
+        if deadline == None:
+            return None
+        return deadline - time.time()
+
+    ###############################################################################################
+    # Name: get_stream(scheme, netloc)
+    #   returns an idle stream to scheme://netloc or opens a new one
+    # Returns:
+    #   (reader, writer), reused: True if the stream was taken from the idle streams
+    ###############################################################################################
+    async def get_stream(self, scheme, netloc):
+        self.bind_loop()
+        idle = self.idle_streams.get((scheme, netloc))
+        while idle:
+            reader, writer = idle.pop()
+            if not reader.at_eof() and not writer.is_closing():
+                self.stats['reused'] += 1
+                return (reader, writer), True
+            self.stats['closed_by_server'] += 1
+            writer.close()
+        stream = await self.open(scheme, netloc)
+        return stream, False
+
+    ###############################################################################################
+    # Name: open(scheme, netloc)
+    #   opens a new stream to scheme://netloc within the ConnectTimeout
+    ###############################################################################################
+    async def open(self, scheme, netloc):
+        url = urlparse('//' + netloc)
+        port = url.port if url.port else (80 if scheme == 'http' else 443)
+        connect_timeout, read_timeout = rf_utility.http__timeouts(self)
+        stream = await asyncio.wait_for(self.opener(scheme, url.hostname, port), connect_timeout)
+        self.stats['created'] += 1
+        return stream
+
+    ###############################################################################################
+    # Name: release(scheme, netloc, stream, response)
+    #   returns the stream to the idle streams unless the service is closing it
+    ###############################################################################################
+    def release(self, scheme, netloc, stream, response):
+        if response.will_close or len(self.idle_streams.get((scheme, netloc), ())) >= self.max_concurrency:
+            self.discard(stream)
+            return
+        self.idle_streams.setdefault((scheme, netloc), []).append(stream)
+
+    ###############################################################################################
+    # Name: discard(stream)
+    #   closes a stream which can not be reused
+    ###############################################################################################
+    def discard(self, stream):
+        if stream:
+            try:
+                stream[1].close()
+            except RuntimeError:
+                # event loop of the stream is closed already
+                pass
+
+    ###############################################################################################
+    # Name: close_all()
+    #   closes all idle streams
+    ###############################################################################################
+    def close_all(self):
+        for streams in self.idle_streams.values():
+            for stream in streams:
+                self.discard(stream)
+        self.idle_streams = dict()
+
+    ###############################################################################################
+    # Name: report()
+    #   returns a one line summary of the stream usage for the log
+    ###############################################################################################
+    def report(self):
+        return 'Async streams: %s created, %s reused, %s reconnected, %s closed by server, %s requests retried' % \
+            (self.stats['created'], self.stats['reused'], self.stats['reconnected'], self.stats['closed_by_server'], self.stats['retried'])
+
+###################################################################################################
+# Name: read_response(reader, http_req, timings = None)
+# Description:
+#   reads a HTTP/1.1 response (status line, headers and body) from the stream. The body is
+#   delimited by Content-Length, chunked transfer encoding or the end of the stream. The seconds
+#   until the status line and of reading the rest of the response are set in timings['ttfb'] and
+#   timings['download'] if a timings dict is given
+# Returns:
+#   AsyncResponse
+###################################################################################################
+async def read_response(reader, http_req, timings = None) :
+    if timings == None:
+        timings = dict()
+    start = time.time()
+    status_line = await reader.readline()
+    if not status_line:
+        raise EOFError('connection closed by the service')
+    timings['ttfb'] = time.time() - start
+    start = time.time()
+    version, status, reason = (status_line.decode('iso-8859-1').rstrip('\r\n').split(' ', 2) + ['', ''])[:3]
+    status = int(status)
+
+    header_list = list()
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        key, _, value = line.decode('iso-8859-1').partition(':')
+        header_list.append((key.strip(), value.strip()))
+    r_headers = rf_utility.http__response_headers(header_list)
+
+    connection = r_headers.get('connection', '').lower()
+    will_close = (connection == 'close') or (version == 'HTTP/1.0' and connection != 'keep-alive')
+
+    body = b''
+    if http_req == 'HEAD' or status in NO_BODY_STATUS or status < 200:
+        pass
+    elif 'chunked' in r_headers.get('transfer-encoding', '').lower():
+        chunks = list()
+        while True:
+            size = int((await reader.readline()).split(b';')[0].strip(), 16)
+            if size == 0:
+                # trailer headers end with an empty line
+                while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                    pass
+                break
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+        body = b''.join(chunks)
+    elif 'content-length' in r_headers:
+        body = await reader.readexactly(int(r_headers['content-length']))
+    else:
+        body = await reader.read()
+        will_close = True
+
+    timings['download'] = time.time() - start
+    return AsyncResponse(status, reason, header_list, body, will_close)
+#
+## end read_response
+
+###################################################################################################
+# Name: http__send_request_async(sut_prop, http_req, resource_uri, rq_headers, rq_body, auth_on_off, async_pool, retry_auth = True)
+# Description:
+#   async counterpart of rf_utility.http__send_request(): writes the request to a stream of the
+#   pool and reads the response. A GET, HEAD or OPTIONS request on a reused stream which was
+#   closed by the service while idle (no status line was read) is retried once on a new stream;
+#   other requests may have been carried out by the service and fail. A request rejected with
+#   401 for the SUT session token is retried once with a new session. The seconds of opening a new
+#   stream (tcp connect and tls handshake) and of the response are set in the timings dict if one
+#   is given
+# Returns:
+#   url: the parsed url of the request
+#   response: AsyncResponse, None on failure
+###################################################################################################
+async def http__send_request_async(sut_prop, http_req, resource_uri, rq_headers, rq_body, auth_on_off, async_pool, retry_auth = True, timings = None) :
+    if (rq_headers == None):
+        rq_headers = rf_utility.create_request_headers()
+
+    # if dsn name is not prepended to the uri, then prepend uri with https protocol and dnsname as per redfish service requirement
+    if sut_prop['DnsName'] not in resource_uri:
+        url = urlparse("https://" + sut_prop['DnsName'] + resource_uri)
+    else:
+        url = urlparse(resource_uri)
+
+    # setup auth header: session token or login name and password for the sut_prop...
+    # creating the session is a blocking request, it is run in the default executor
+    session_auth = async_pool.session_auth
+    if session_auth and session_auth.token == None and auth_on_off == 'on':
+        session_token = await asyncio.get_event_loop().run_in_executor(None, rf_utility.http__set_request_auth, sut_prop, rq_headers, auth_on_off, async_pool)
+    else:
+        session_token = rf_utility.http__set_request_auth(sut_prop, rq_headers, auth_on_off, async_pool)
+
+    if isinstance(rq_body, str):
+        rq_body = rq_body.encode('utf-8')
+
+    # same default headers as http.client
+    request = ['%s %s HTTP/1.1' % (http_req, (url.path if url.path else '/') + ('?' + url.query if url.query else '')), 'Host: %s' % url.netloc]
+    header_keys = [key.lower() for key in rq_headers.keys()]
+    if 'accept-encoding' not in header_keys:
+        request.append('Accept-Encoding: identity')
+    for key, value in rq_headers.items():
+        request.append('%s: %s' % (key, value))
+    if rq_body != None and 'content-length' not in header_keys:
+        request.append('Content-Length: %s' % len(rq_body))
+    request = ('\r\n'.join(request) + '\r\n\r\n').encode('iso-8859-1') + (rq_body if rq_body else b'')
+
+    stream = None
+    try:
+        start = time.time()
+        stream, reused = await async_pool.get_stream(url.scheme, url.netloc)
+        if not reused and timings != None:
+            timings['connect'] = time.time() - start
+        # 'ttfb' is set once the status line is read
+        response_timings = dict()
+        try:
+            stream[1].write(request)
+            await stream[1].drain()
+            response = await asyncio.wait_for(read_response(stream[0], http_req, response_timings), rf_utility.http__timeouts(async_pool)[1])
+        except STALE_STREAM_ERRORS:
+            if not reused or http_req.upper() not in rf_utility.IDEMPOTENT_METHODS or 'ttfb' in response_timings:
+                raise
+            # idle stream was closed by the service, retry once on a new stream
+            async_pool.discard(stream)
+            async_pool.stats['reconnected'] += 1
+            start = time.time()
+            stream = await async_pool.open(url.scheme, url.netloc)
+            if timings != None:
+                timings['connect'] = time.time() - start
+            stream[1].write(request)
+            await stream[1].drain()
+            response = await asyncio.wait_for(read_response(stream[0], http_req, response_timings), rf_utility.http__timeouts(async_pool)[1])
+        if timings != None:
+            timings.update(response_timings)
+    except Exception:
+        exc_str = sys.exc_info()[0]
+        print ('OPERATIONAL ERROR: %s Request for %s FAILED with exeption: %s' % (http_req, url.path, exc_str))
+        async_pool.discard(stream)
+        return url, None
+
+    # response is read completely, the stream can be reused
+    async_pool.release(url.scheme, url.netloc, stream, response)
+
+    # the session of the SUT timed out or was deleted, re-issue the request once with a new session
+    if session_token and retry_auth and response.status == rf_utility.HTTP_UNAUTHORIZED:
+        if await asyncio.get_event_loop().run_in_executor(None, session_auth.renew, session_token):
+            return await http__send_request_async(sut_prop, http_req, resource_uri, rq_headers, rq_body, auth_on_off, async_pool, retry_auth = False, timings = timings)
+    return url, response
+#
+## end http__send_request_async
+
+###################################################################################################
+# Name: http__req_common_async(sut_prop, http_req, resource_uri, rq_headers, rq_body, auth_on_off, cookie_info, async_pool)
+# Description:
+#   async counterpart of rf_utility.http__req_common(); the request waits for the concurrency
+#   limit of the SUT before it is issued. Failed GET/HEAD/OPTIONS requests and 503 responses to
+#   them are retried as in rf_utility.http__req_common()
+# Returns:
+#   r_payload, r_headers, r_status as rf_utility.http__req_common()
+###################################################################################################
+async def http__req_common_async(sut_prop, http_req, resource_uri, rq_headers, rq_body, auth_on_off, cookie_info = None, async_pool = None) :
+    retries = 0
+    while True:
+        rf_utility.http__check_deadline(async_pool, http_req, resource_uri)
+        start = time.time()
+        timings = dict()
+        async with async_pool.limit():
+            url, r_response = await http__send_request_async(sut_prop, http_req, resource_uri, rq_headers, rq_body, auth_on_off, async_pool, timings = timings)
+        status = r_response.status if r_response else None
+        elapsed = time.time() - start
+        if async_pool.recorder:
+            async_pool.recorder.record(http_req, resource_uri, rq_headers, rq_body, r_response, r_response.body if r_response else None, start, retries, async_pool.assertion_id, timings = timings)
+        delay = rf_utility.http__retry_delay(http_req, status, r_response.getheader('Retry-After') if r_response else None, retries)
+        if delay == None:
+            break
+        rf_utility.http__add_metrics(async_pool, http_req, resource_uri, status, elapsed, timings)
+        remaining = rf_utility.http__check_deadline(async_pool, http_req, resource_uri)
+        if remaining != None and delay >= remaining:
+            raise rf_utility.DeadlineExceeded('deadline expires before the retry of %s %s' % (http_req, resource_uri))
+        retries += 1
+        async_pool.stats['retried'] += 1
+        await asyncio.sleep(delay)
+
+    if not r_response:
+        rf_utility.http__add_metrics(async_pool, http_req, resource_uri, None, elapsed, timings)
+        return None, None, None
+
+    r_headers = rf_utility.http__response_headers(r_response.getheaders())
+
+    #handle any http redirect...
+    redirected_resource_uri = rf_utility.http__redirect_path(r_headers, r_response.status, resource_uri)
+    if redirected_resource_uri:
+        rf_utility.http__add_metrics(async_pool, http_req, resource_uri, r_response.status, elapsed, timings)
+        return await http__req_common_async(sut_prop, http_req, redirected_resource_uri, rq_headers, rq_body, auth_on_off, cookie_info, async_pool)
+
+    rf_utility.http__track_cookie(cookie_info, r_headers, http_req, resource_uri)
+
+    decode_start = time.time()
+    r_payload = rf_utility.http__decode_payload(r_response.body, r_headers, resource_uri, timings = timings)
+    rf_utility.http__add_metrics(async_pool, http_req, resource_uri, r_response.status, elapsed + time.time() - decode_start, timings)
+
+    return (r_payload, r_headers, r_response.status)
+#
+## end http__req_common_async
+
+###################################################################################################
+# Name: http__GET_async(), http__HEAD_async(), http__OPTIONS_async(), http__TRACE_async(),
+#       http__POST_async(), http__PATCH_async(), http__PUT_async(), http__DELETE_async()
+#   async counterparts of the http__XXX() request functions in rf_utility. POST, PATCH, PUT and
+#   DELETE take the request body as a python dictionary (converted to json)
+# Returns:
+#   - Response payload dict or string depending on 'content-type' in request header
+#   - Response Headers dict: header keys in lower case
+#   - Response Status code: http status code returned from the request
+###################################################################################################
+def http__GET_async(sut_prop, resource_uri, rq_headers, auth_on_off, cookie_info = None, async_pool = None) :
+    if (rq_headers == None):
+        rq_headers = rf_utility.create_request_headers()
+    return http__req_common_async(sut_prop, "GET", resource_uri, rq_headers, None, auth_on_off, cookie_info, async_pool)
+
+def http__HEAD_async(sut_prop, resource_uri, rq_headers, auth_on_off, cookie_info = None, async_pool = None) :
+    if (rq_headers == None):
+        rq_headers = rf_utility.create_request_headers()
+    return http__req_common_async(sut_prop, "HEAD", resource_uri, rq_headers, None, auth_on_off, cookie_info, async_pool)
+
+def http__OPTIONS_async(sut_prop, resource_uri, rq_headers, rq_body, auth_on_off, cookie_info = None, async_pool = None) :
+    if (rq_headers == None):
+        rq_headers = rf_utility.create_request_headers()
+    return http__req_common_async(sut_prop, "OPTIONS", resource_uri, rq_headers, rq_body, auth_on_off, cookie_info, async_pool)
+
+def http__TRACE_async(sut_prop, resource_uri, rq_headers, rq_body, auth_on_off, cookie_info = None, async_pool = None) :
+    if (rq_headers == None):
+        rq_headers = rf_utility.create_request_headers()
+    return http__req_common_async(sut_prop, "TRACE", resource_uri, rq_headers, rq_body, auth_on_off, cookie_info, async_pool)
+
+def http__modify_resource_async(sut_prop, rq_type, resource_uri, rq_headers, rq_body, auth_on_off, async_pool = None) :
+    if (rq_headers == None):
+        rq_headers = rf_utility.create_request_headers()
+    # make sure the request is json format..
+    rq_body = json.dumps(rq_body)
+    return http__req_common_async(sut_prop, rq_type, resource_uri, rq_headers, rq_body, auth_on_off, async_pool = async_pool)
+
+def http__POST_async(sut_prop, resource_uri, rq_headers, rq_body, auth_on_off, async_pool = None) :
+    return http__modify_resource_async(sut_prop, "POST", resource_uri, rq_headers, rq_body, auth_on_off, async_pool)
+
+def http__PATCH_async(sut_prop, resource_uri, rq_headers, rq_body, auth_on_off, async_pool = None) :
+    return http__modify_resource_async(sut_prop, "PATCH", resource_uri, rq_headers, rq_body, auth_on_off, async_pool)
+
+def http__PUT_async(sut_prop, resource_uri, rq_headers, rq_body, auth_on_off, async_pool = None) :
+    return http__modify_resource_async(sut_prop, "PUT", resource_uri, rq_headers, rq_body, auth_on_off, async_pool)
+
+def http__DELETE_async(sut_prop, resource_uri, rq_headers, auth_on_off, async_pool = None) :
+    return http__modify_resource_async(sut_prop, "DELETE", resource_uri, rq_headers, None, auth_on_off, async_pool)
+#
+## end http__XXX_async
+
+###################################################################################################
+# Name: run_many(coroutines)
+#   runs the coroutines (for example requests to several SUTs) concurrently on one event loop and
+#   waits for all of them
+# Returns:
+#   list of the results in the order of coroutines
+###################################################################################################
+def run_many(coroutines) :
+    async def gather():
+        return await asyncio.gather(*coroutines)
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(gather())
+    finally:
+        loop.close()
+#
+## end run_many
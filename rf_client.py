@@ -317,6 +317,44 @@ def get_eventservice_params() :
 
     return Event_Subscription, Submit_Test_Event
 
+###############################################################################################
+# Name: get_connection_settings()
+#   Read the config json file for the HTTP(S) connection settings. The settings are optional,
+#   an empty dict is returned for a missing section so the defaults apply
+# Return:
+#   dict of connection settings, exit(0) on syntax error reading json file
+###############################################################################################
+def get_connection_settings() :
+    # keys into the json file
+    Connection_key = "RedfishServiceCheckTool_Connection"
+
+    script_dir = os.path.dirname(__file__)
+    file_name = os.path.join(script_dir, Server_Auth_Json_File )
+    connection_settings = dict()
+
+    try:
+        with open(file_name) as data_file:
+            try:
+                data = json.load(data_file)
+            except ValueError as err:
+                print("Error trying to load JSON from %s - check your JSON syntax" % file_name)
+                print(err)
+                data_file.close()
+                exit(0)
+            else:
+                if Connection_key in data:
+                    connection_settings = data[Connection_key]
+                else:
+                    print("Note: %s not found in %s, using default connection settings" % (Connection_key, file_name))
+
+            data_file.close()
+
+    except ValueError:
+        print ('Operational ERROR: Opening/parsing the JSON configuration file %s' % file_name)
+        exit(0)
+
+    return connection_settings
+
 ###############################################################################################
 # Name: retrieve_schemas_in_local_directory(schemas_uri, dest_directory, proxy_dict)
 #   Takes schemas remote uri, proxy settings, and local destination directory path and retrieves 
@@ -732,9 +770,28 @@ def setup_sut_obj(sut):
 ###############################################################################################
 def setup_tool(sut_prop):
     ## create a unique log header 
-    print('Setting up Redfish Service Check Tool Revision: %s : %s:%s' % (RedfishServiceCheck_Revision, sut_prop['DisplayName'],sut_prop['DnsName'])) 
+    print('Setting up Redfish Service Check Tool Revision: %s : %s:%s' % (RedfishServiceCheck_Revision, sut_prop['DisplayName'],sut_prop['DnsName']))
+    # one ssl context for all https connections of this run
+    connection_settings = get_connection_settings()
+    rf_utility.init_ssl_context(connection_settings.get('TLS'))
+    rf_utility.init_retry_settings(connection_settings.get('Retry'))
+    rf_utility.init_timeout_settings(connection_settings.get('Timeouts'))
+    rf_utility.init_capture_settings(connection_settings.get('Capture'))
+    rf_utility.init_discovery_settings(connection_settings.get('Discovery'))
+    rf_utility.init_cache_settings(connection_settings.get('Cache'))
     # tool initiates service object
     sut = init_sut_obj(sut_prop)
+    # record the requests of the setup and of the assertions
+    if rf_utility.capture_settings['RecordTraffic'] == 'yes':
+        capture_path = get_capture_path(sut_prop)
+        print('Recording the requests to SUT %s to %s' % (sut_prop['DnsName'], capture_path))
+        sut.start_recording(capture_path)
+    # revalidate the resources found by the previous run instead of GETting all of them
+    if rf_utility.discovery_settings['IncrementalRecrawl'] == 'yes':
+        sut.set_crawl_cache_folder(get_sut_log_folder(sut_prop))
+    # keep the resources of this run in the snapshot file of the SUT instead of in memory
+    if rf_utility.cache_settings['SnapshotStore'] == 'yes':
+        sut.open_snapshot(get_sut_log_folder(sut_prop))
     # setup sut obj for sut
     if setup_sut_obj(sut):
         print('\nRedfish Service Check Tool setup for SUT %s successfully completed' % (sut_prop['DnsName'] ))
@@ -743,6 +800,26 @@ def setup_tool(sut_prop):
         print('\nSetup of client tool was not successful, Redfish Service Check Tool will exit...')
         exit(0)
 
+###############################################################################################
+# Name: get_sut_log_folder(sut_prop)
+#   Returns the log folder of the SUT: logs/<DisplayName>, created if it does not exist
+###############################################################################################
+def get_sut_log_folder(sut_prop):
+    log_folder = os.path.join(os.path.dirname(__file__), 'logs', sut_prop['DisplayName'])
+    if not os.path.isdir(log_folder):
+        os.makedirs(log_folder)
+        os.chmod(log_folder,0o777)
+    return log_folder
+
+###############################################################################################
+# Name: get_capture_path(sut_prop)
+#   Returns the path of the traffic capture file of this run of the SUT, in the log folder of the
+#   SUT: logs/<DisplayName>/<date-time>_traffic.jsonl.gz
+###############################################################################################
+def get_capture_path(sut_prop):
+    dstr = str(datetime.now().strftime("%Y%m%d-%H%M%S"))
+    return os.path.join(get_sut_log_folder(sut_prop), dstr + '_traffic.jsonl.gz')
+
 ###############################################################################################
 # Name: main
 # Start up function. Invokes appropriate setup functions to run Redfish Service Check Tool
@@ -756,6 +833,7 @@ def main():
             sut = setup_tool(sut_prop)  
             print('Running assertions on SUT %s...' %(sut_prop['DnsName']))   
             rfs_test.run(sut)
+            sut.close()
         else:
             print('No SUT found in properties.json. Please add an SUT following the format provided in readme.txt and try running the Redfish Service Check Tool again')
             exit(0)
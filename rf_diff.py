@@ -0,0 +1,275 @@
+# Copyright Notice:
+# Copyright 2016 Distributed Management Task Force, Inc. All rights reserved.
+# License: BSD 3-Clause License. For full text see link: https://github.com/DMTF/Redfish-Service-Conformance-Check/LICENSE.md
+
+# Name: rf_diff
+# Description: This module compares two snapshots of a service saved in its snapshot file (see
+#   rf_store.SnapshotFile, SnapshotStore "yes") and reports the resources added, removed and
+#   changed between them and the properties that changed, e.g. before and after a firmware
+#   upgrade. The resources are compared by the content hash written with each row, so only the
+#   resources whose hash differs are read back; those are compared by the hashes of their
+#   subtrees (a Merkle tree of the payload), skipping the objects and arrays that did not change.
+#   Usage: python rf_diff.py <snapshot file> [old snapshot] [new snapshot] [--ignore Property,...]
+#   (the last two snapshots of the file by default; --ignore skips properties that change on
+#   every run, e.g. DateTime)
+
+import sys
+import json
+import time
+import hashlib
+import rf_store
+
+# map python 2 vs 3 imports
+if (sys.version_info < (3, 0)):
+    str_types = (str, unicode)
+else:
+    str_types = (str,)
+
+###################################################################################################
+# Name: subtree_hashes(value, ignore, hashes)
+#   Hashes the objects and arrays of a json payload bottom up: the digest of an object is the
+#   digest of its (property, value) pairs in property order, the digest of an array the digest of
+#   its elements, where a value is its repr (a number, string, true, false or null) or the digest
+#   of the object or array. Properties named in ignore are left out.
+# Returns:
+#   repr or digest of value; hashes is filled with id(object or array) : digest
+###################################################################################################
+def subtree_hashes(value, ignore, hashes):
+    if isinstance(value, dict):
+        digest = hashlib.sha1(b'{')
+        for key in sorted(value):
+            if key not in ignore:
+                digest.update(repr(key).encode('utf-8') + b':' + subtree_hashes(value[key], ignore, hashes) + b',')
+    elif isinstance(value, list):
+        digest = hashlib.sha1(b'[')
+        for element in value:
+            digest.update(subtree_hashes(element, ignore, hashes) + b',')
+    else:
+        return repr(value).encode('utf-8')
+    hashes[id(value)] = b'#' + digest.digest()
+    return hashes[id(value)]
+
+###################################################################################################
+# Name: pointer(path)
+# Returns:
+#   the JSON pointer (RFC 6901) of a list of property names and array indexes
+###################################################################################################
+def pointer(path):
+    return ''.join(['/' + str(step).replace('~', '~0').replace('/', '~1') for step in path])
+
+###################################################################################################
+# Name: member_ids(value)
+# Returns:
+#   list of the @odata.id of the elements of an array of links (e.g. Members), None if the
+#   elements are not all links or an @odata.id is repeated
+###################################################################################################
+def member_ids(value):
+    ids = [element.get('@odata.id') if isinstance(element, dict) else None for element in value]
+    if not ids or not all(isinstance(odata_id, str_types) for odata_id in ids) or len(set(ids)) != len(ids):
+        return None
+    return ids
+
+###################################################################################################
+# Class: PayloadDiff
+#   Compares the payloads of a resource in the old and the new snapshot, descending only into
+#   the objects and arrays whose subtree hashes differ
+###################################################################################################
+class PayloadDiff():
+    def __init__(self, ignore = ()):
+        self.ignore = set(ignore)
+
+    ###############################################################################################
+    # Name: compare(old, new)
+    # Returns:
+    #   list of (JSON pointer, 'added' | 'removed' | 'changed', old value, new value) of the
+    #   properties and array elements that differ, empty if the payloads are the same
+    ###############################################################################################
+    def compare(self, old, new):
+        self.old_hashes = dict()
+        self.new_hashes = dict()
+        changes = []
+        if subtree_hashes(old, self.ignore, self.old_hashes) != subtree_hashes(new, self.ignore, self.new_hashes):
+            self.compare_values([], old, new, changes)
+        self.old_hashes = self.new_hashes = None
+        return changes
+
+    ###############################################################################################
+    # Name: differs(old, new)
+    # Returns:
+    #   True if the values differ: by subtree hash for objects and arrays, by type and value else
+    ###############################################################################################
+    def differs(self, old, new):
+        if isinstance(old, (dict, list)) and type(old) is type(new):
+            return self.old_hashes[id(old)] != self.new_hashes[id(new)]
+        return type(old) is not type(new) or old != new
+
+    def compare_values(self, path, old, new, changes):
+        if isinstance(old, dict) and isinstance(new, dict):
+            for key in old:
+                if key not in new and key not in self.ignore:
+                    changes.append((pointer(path + [key]), 'removed', old[key], None))
+            for key in new:
+                if key in self.ignore:
+                    continue
+                if key not in old:
+                    changes.append((pointer(path + [key]), 'added', None, new[key]))
+                elif self.differs(old[key], new[key]):
+                    self.compare_values(path + [key], old[key], new[key], changes)
+        elif isinstance(old, list) and isinstance(new, list):
+            self.compare_lists(path, old, new, changes)
+        else:
+            changes.append((pointer(path), 'changed', old, new))
+
+    ###############################################################################################
+    # Name: compare_lists(path, old, new, changes)
+    #   Arrays of links (e.g. Members) are matched by @odata.id, so a member added or removed in
+    #   the middle does not show every following member as changed; other arrays are matched by
+    #   index. Elements are reported at their index in the old (removed) or new array.
+    ###############################################################################################
+    def compare_lists(self, path, old, new, changes):
+        old_ids = member_ids(old)
+        new_ids = member_ids(new)
+        if old_ids != None and new_ids != None:
+            new_index = dict([(odata_id, index) for index, odata_id in enumerate(new_ids)])
+            for index, odata_id in enumerate(old_ids):
+                if odata_id not in new_index:
+                    changes.append((pointer(path + [index]), 'removed', old[index], None))
+                elif self.differs(old[index], new[new_index[odata_id]]):
+                    self.compare_values(path + [new_index[odata_id]], old[index], new[new_index[odata_id]], changes)
+            old_index = set(old_ids)
+            for index, odata_id in enumerate(new_ids):
+                if odata_id not in old_index:
+                    changes.append((pointer(path + [index]), 'added', None, new[index]))
+            return
+        for index in range(min(len(old), len(new))):
+            if self.differs(old[index], new[index]):
+                self.compare_values(path + [index], old[index], new[index], changes)
+        for index in range(len(new), len(old)):
+            changes.append((pointer(path + [index]), 'removed', old[index], None))
+        for index in range(len(old), len(new)):
+            changes.append((pointer(path + [index]), 'added', None, new[index]))
+#
+## end PayloadDiff
+
+###################################################################################################
+# Class: SnapshotDiff
+#   The differences between two snapshots: the uris added and removed, and for each changed
+#   resource its (old status, new status) and the property changes (see PayloadDiff.compare())
+###################################################################################################
+class SnapshotDiff():
+    def __init__(self, old, new):
+        self.old = old
+        self.new = new
+        self.added = []
+        self.removed = []
+        self.changed = []
+        self.unchanged = 0
+        # resources read back from the file because their hashes differ (or were not written)
+        self.compared = 0
+        self.elapsed = 0
+
+    ###############################################################################################
+    # Name: report()
+    #   Returns a one line summary of the differences for the log
+    ###############################################################################################
+    def report(self):
+        return ('Snapshot diff: snapshot %s to %s: %s resources added, %s removed, %s changed, %s unchanged (%s compared in %.2f seconds)' % \
+            (self.old, self.new, len(self.added), len(self.removed), len(self.changed), self.unchanged, self.compared, self.elapsed))
+
+    ###############################################################################################
+    # Name: lines()
+    #   Returns the lines of the full report: a line per resource added or removed, a line per
+    #   changed resource followed by a line per changed property
+    ###############################################################################################
+    def lines(self):
+        lines = [self.report()]
+        lines.extend(['+ %s' % uri for uri in self.added])
+        lines.extend(['- %s' % uri for uri in self.removed])
+        for uri, status, changes in self.changed:
+            lines.append('~ %s' % uri + (' (status %s -> %s)' % status if status[0] != status[1] else ''))
+            for path, change, old, new in changes:
+                if change == 'added':
+                    lines.append('    + %s: %s' % (path, json.dumps(new)))
+                elif change == 'removed':
+                    lines.append('    - %s: %s' % (path, json.dumps(old)))
+                else:
+                    lines.append('    ~ %s: %s -> %s' % (path, json.dumps(old), json.dumps(new)))
+        return lines
+#
+## end SnapshotDiff
+
+###################################################################################################
+# Name: diff_snapshots(snapshot_file, old, new, ignore)
+#   Compares snapshot old to snapshot new of a rf_store.SnapshotFile. Resources whose content
+#   hashes are equal are not read; a resource whose payload differs only in ignored properties is
+#   counted as unchanged.
+# Returns:
+#   SnapshotDiff
+###################################################################################################
+def diff_snapshots(snapshot_file, old, new, ignore = ()):
+    start = time.time()
+    diff = SnapshotDiff(old, new)
+    old_hashes = snapshot_file.hashes(old)
+    new_hashes = snapshot_file.hashes(new)
+    payload_diff = PayloadDiff(ignore)
+    for uri in sorted(new_hashes):
+        if uri not in old_hashes:
+            diff.added.append(uri)
+            continue
+        old_hash, old_row = old_hashes[uri]
+        new_hash, new_row = new_hashes[uri]
+        if old_hash != None and old_hash == new_hash:
+            diff.unchanged += 1
+            continue
+        diff.compared += 1
+        old_payload, old_headers, old_status = snapshot_file.read(old_row)
+        new_payload, new_headers, new_status = snapshot_file.read(new_row)
+        changes = payload_diff.compare(old_payload, new_payload)
+        if changes or old_status != new_status:
+            diff.changed.append((uri, (old_status, new_status), changes))
+        else:
+            diff.unchanged += 1
+    diff.removed = sorted([uri for uri in old_hashes if uri not in new_hashes])
+    diff.elapsed = time.time() - start
+    return diff
+
+###################################################################################################
+# Name: previous_snapshot_report(snapshot_file)
+#   Compares the snapshot of this run to the previous snapshot in the file
+# Returns:
+#   one line summary for the log (see SnapshotDiff.report()), None if this is the first snapshot
+###################################################################################################
+def previous_snapshot_report(snapshot_file):
+    previous = [snapshot[0] for snapshot in snapshot_file.snapshots() if snapshot[0] < snapshot_file.snapshot]
+    if not previous:
+        return None
+    return diff_snapshots(snapshot_file, previous[-1], snapshot_file.snapshot).report()
+
+if __name__ == "__main__":
+    arguments = sys.argv[1:]
+    ignore = ()
+    if '--ignore' in arguments:
+        position = arguments.index('--ignore')
+        ignore = [name for name in ''.join(arguments[position + 1:position + 2]).split(',') if name]
+        del arguments[position:position + 2]
+    if not arguments:
+        print('Usage: python rf_diff.py <snapshot file> [old snapshot] [new snapshot] [--ignore Property,...]')
+        sys.exit(1)
+    try:
+        snapshot_file = rf_store.SnapshotFile(arguments[0])
+    except IOError as e:
+        print(e)
+        sys.exit(1)
+    snapshots = snapshot_file.snapshots()
+    for snapshot, dns_name, display_name, started, resources in snapshots:
+        print('snapshot %s: %s (%s) started %s, %s resources' % (snapshot, display_name, dns_name, started, resources))
+    if len(arguments) >= 3:
+        old, new = int(arguments[1]), int(arguments[2])
+    elif len(snapshots) >= 2:
+        old, new = snapshots[-2][0], snapshots[-1][0]
+    else:
+        print('%s has less than two snapshots to compare' % arguments[0])
+        sys.exit(1)
+    for line in diff_snapshots(snapshot_file, old, new, ignore).lines():
+        print(line)
+    snapshot_file.close()
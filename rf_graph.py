@@ -0,0 +1,553 @@
+# Copyright Notice:
+# Copyright 2016 Distributed Management Task Force, Inc. All rights reserved.
+# License: BSD 3-Clause License. For full text see link: https://github.com/DMTF/Redfish-Service-Conformance-Check/LICENSE.md
+
+# File: rf_graph.py
+#   This module contains the graph of the resources found by the discovery of the relative uris
+#   (SUT.process_uri): a node per resource with its uri, @odata.type, parent (the resource it was
+#   found on) and allowed methods, indexed by type and by collection, so assertions can look up
+#   resources ("all Manager resources", "the Sessions collection") without searching relative_uris
+#   or GETting resources to learn their type.
+#   The resources are held in a compact UriTable: integer resource ids, uris as paths of interned
+#   segments and nested keys as parent ids plus a suffix, all in arrays, so a service with tens of
+#   thousands of resources takes a few dozen bytes per resource. SUT.relative_uris and
+#   SUT.relative_uris_no_members are read-only RelativeUris views of the table which rebuild the
+#   nested keys and uris as they are read
+
+import re
+from array import array
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
+# path segments which are stored as numbers instead of interned strings (member ids of collections)
+MAX_NUMERIC_SEGMENT = 1 << 30
+# a nested key suffix which ends with the number of a member: 'Members_12'
+COUNTED_SUFFIX = re.compile(r'^(.*)_([1-9][0-9]{0,8})$')
+
+###################################################################################################
+# Class: UriTable
+#   The uris and nested keys of the resources found by the discovery, by resource id (0, 1, ... in
+#   the order they were found).
+#   uris: the path segments ('redfish', 'v1', 'Systems', ...) are interned once (numbers are
+#       stored as numbers), each uri is a node of a tree of segments: the id of the parent path and
+#       the segment, found thru a hash table of path ids (open addressing with linear probing)
+#   nested keys: the id of the resource whose key it extends ('Root Service_Systems' extends
+#       'Root Service') and the interned rest of the key with the number of a member apart
+#       ('Members' and 12 for '_Members_12'), found thru a hash table of resource ids by (key
+#       parent, suffix, number); the resources extending a key are chained from their key parent
+#       (first child, next sibling), the last added first
+#   Resources are added by one thread; find() and the readers may run on other threads
+###################################################################################################
+class UriTable():
+    def __init__(self):
+        # interned strings: path segments and nested key suffixes
+        self.strings = list()
+        self.string_ids = dict()
+        # tree of path segments: parent path, segment code (see segment_code()) and resource id
+        # (-1 if no resource has the path) of each path
+        self.path_parent = array('i')
+        self.path_segment = array('I')
+        self.path_resource = array('i')
+        # hash table of the path ids by (parent path, segment code), -1 for an empty slot. The
+        # table is replaced when it grows, so find_path() may run on other threads while a path
+        # is added
+        self.paths = (1023, array('i', [-1]) * 1024)
+        # path of the directories of the uris looked up lately: most uris are next to the last one
+        self.directories = dict()
+        # resource id of the uris added or found lately: the links back to a resource (a member to
+        # its system) are looked up again and again
+        self.recent = dict()
+        # resources: path of the uri, key parent (-1 for none), interned key suffix, member number (0 for none)
+        self.resource_path = array('i')
+        self.key_parent = array('i')
+        self.key_suffix = array('i')
+        self.key_count = array('i')
+        # hash table of the resource ids by (key parent, key suffix, member number), as the one of
+        # the paths
+        self.keys = (1023, array('i', [-1]) * 1024)
+        # resources extending the nested key of a resource: the last added by key parent, the one
+        # added before by resource id (-1 for none)
+        self.first_child = array('i')
+        self.next_sibling = array('i')
+        # the resource added before with the same nested key by resource id (-1 for none)
+        self.same_key = array('i')
+
+    def __len__(self):
+        return len(self.resource_path)
+
+    def __contains__(self, uri):
+        return self.find(uri) != None
+
+    def intern(self, string):
+        string_id = self.string_ids.get(string)
+        if string_id == None:
+            string_id = len(self.strings)
+            self.strings.append(string)
+            self.string_ids[string] = string_id
+        return string_id
+
+    ###############################################################################################
+    # Name: segment_code(segment, add)
+    #   Returns the code of a path segment: 2 * number + 1 for a number, 2 * id + 0 for an interned
+    #   string; None if the segment was never interned and add is False
+    ###############################################################################################
+    def segment_code(self, segment, add):
+        if segment.isdigit() and (segment == '0' or segment[0] != '0') and len(segment) < 10 and int(segment) < MAX_NUMERIC_SEGMENT:
+            return 2 * int(segment) + 1
+        if add:
+            return 2 * self.intern(segment)
+        string_id = self.string_ids.get(segment)
+        return 2 * string_id if string_id != None else None
+
+    def segment(self, code):
+        if code & 1:
+            return str(code >> 1)
+        return self.strings[code >> 1]
+
+    ###############################################################################################
+    # Name: find_path(uri, add = False)
+    #   Returns the id of the path of uri in the segment tree, None if it is not in the tree (it is
+    #   added to the tree if add is True). The path of the directory of uri is looked up first
+    ###############################################################################################
+    def find_path(self, uri, add = False):
+        directory, separator, name = uri.rpartition('/')
+        path = self.directories.get(directory) if separator else -1
+        if path == None:
+            path = self.find_path(directory, add)
+            if path == None:
+                return None
+            if len(self.directories) > 1024:
+                self.directories.clear()
+            self.directories[directory] = path
+        code = self.segment_code(name, add)
+        if code == None:
+            return None
+        mask, slots = self.paths
+        index = (((path + 1) * 0x9E3779B1) ^ (code * 0x85EBCA77)) & mask
+        while slots[index] != -1:
+            child = slots[index]
+            if self.path_parent[child] == path and self.path_segment[child] == code:
+                return child
+            index = (index + 1) & mask
+        if not add:
+            return None
+        child = len(self.path_parent)
+        self.path_parent.append(path)
+        self.path_segment.append(code)
+        self.path_resource.append(-1)
+        if (child + 1) * 3 > (mask + 1) * 2:
+            self.grow_paths(mask * 2 + 1)
+        else:
+            slots[index] = child
+        return child
+
+    ###############################################################################################
+    # Name: grow_paths(mask)
+    #   Replaces the hash table of the paths by a table of mask + 1 slots with all paths
+    ###############################################################################################
+    def grow_paths(self, mask):
+        slots = array('i', [-1]) * (mask + 1)
+        for child in range(len(self.path_parent)):
+            index = (((self.path_parent[child] + 1) * 0x9E3779B1) ^ (self.path_segment[child] * 0x85EBCA77)) & mask
+            while slots[index] != -1:
+                index = (index + 1) & mask
+            slots[index] = child
+        self.paths = (mask, slots)
+
+    ###############################################################################################
+    # Name: find(uri)
+    #   Returns the resource id of uri, None if it is not in the table
+    ###############################################################################################
+    def find(self, uri):
+        resource = self.recent.get(uri)
+        if resource != None:
+            return resource
+        path = self.find_path(uri)
+        if path == None or self.path_resource[path] == -1:
+            return None
+        resource = self.path_resource[path]
+        self.remember(uri, resource)
+        return resource
+
+    def remember(self, uri, resource):
+        if len(self.recent) > 4096:
+            self.recent.clear()
+        self.recent[uri] = resource
+
+    ###############################################################################################
+    # Name: add(uri, nested_key, key_parent = None)
+    #   Adds a resource with its nested key; key_parent is the id of the resource whose nested key
+    #   the nested key extends, if any
+    # Returns:
+    #   id of the resource
+    ###############################################################################################
+    def add(self, uri, nested_key, key_parent = None):
+        resource = len(self.resource_path)
+        path = self.find_path(uri, add = True)
+        if self.path_resource[path] == -1:
+            self.path_resource[path] = resource
+            self.remember(uri, resource)
+        self.resource_path.append(path)
+
+        suffix, count = nested_key, 0
+        parent_key = self.nested_key(key_parent) + '_' if key_parent != None else None
+        if parent_key and nested_key.startswith(parent_key):
+            suffix = nested_key[len(parent_key):]
+        else:
+            key_parent = -1
+        counted = COUNTED_SUFFIX.match(suffix)
+        if counted:
+            suffix, count = counted.group(1), int(counted.group(2))
+        self.key_parent.append(key_parent)
+        self.key_suffix.append(self.intern(suffix))
+        self.key_count.append(count)
+        self.first_child.append(-1)
+        self.next_sibling.append(-1)
+        self.same_key.append(-1)
+        if key_parent != -1:
+            self.next_sibling[resource] = self.first_child[key_parent]
+            self.first_child[key_parent] = resource
+        self.add_key(resource)
+        return resource
+
+    def key_slot(self, key_parent, key_suffix, key_count, mask):
+        return (((key_parent + 1) * 0x9E3779B1) ^ (key_suffix * 0x85EBCA77) ^ (key_count * 0xC2B2AE3D)) & mask
+
+    ###############################################################################################
+    # Name: add_key(resource)
+    #   Adds the nested key of the resource id to the hash table of the keys. The links of a list
+    #   in an object share a key, so a key may be added more than once: the table holds the last
+    #   resource added with the key, chained to the ones before (same_key)
+    ###############################################################################################
+    def add_key(self, resource):
+        mask, slots = self.keys
+        index = self.key_slot(self.key_parent[resource], self.key_suffix[resource], self.key_count[resource], mask)
+        while slots[index] != -1:
+            other = slots[index]
+            if self.same_key_as(other, resource):
+                self.same_key[resource] = other
+                slots[index] = resource
+                return
+            index = (index + 1) & mask
+        if (resource + 1) * 3 > (mask + 1) * 2:
+            self.grow_keys(mask * 2 + 1)
+        else:
+            slots[index] = resource
+
+    def same_key_as(self, resource, other):
+        return self.key_parent[resource] == self.key_parent[other] and self.key_suffix[resource] == self.key_suffix[other] \
+            and self.key_count[resource] == self.key_count[other]
+
+    ###############################################################################################
+    # Name: grow_keys(mask)
+    #   Replaces the hash table of the nested keys by a table of mask + 1 slots with all keys
+    ###############################################################################################
+    def grow_keys(self, mask):
+        slots = array('i', [-1]) * (mask + 1)
+        for resource in range(len(self.key_parent)):
+            index = self.key_slot(self.key_parent[resource], self.key_suffix[resource], self.key_count[resource], mask)
+            while slots[index] != -1 and not self.same_key_as(slots[index], resource):
+                index = (index + 1) & mask
+            slots[index] = resource
+        self.keys = (mask, slots)
+
+    ###############################################################################################
+    # Name: find_key_part(key_parents, suffix, resources)
+    #   Appends to resources the resource ids whose nested key is the nested key of one of
+    #   key_parents (-1 for none) extended by suffix ('Members_12')
+    ###############################################################################################
+    def find_key_part(self, key_parents, suffix, resources):
+        count = 0
+        counted = COUNTED_SUFFIX.match(suffix)
+        if counted:
+            suffix, count = counted.group(1), int(counted.group(2))
+        key_suffix = self.string_ids.get(suffix)
+        if key_suffix == None:
+            return
+        mask, slots = self.keys
+        for key_parent in key_parents:
+            index = self.key_slot(key_parent, key_suffix, count, mask)
+            while slots[index] != -1:
+                resource = slots[index]
+                if self.key_parent[resource] == key_parent and self.key_suffix[resource] == key_suffix and self.key_count[resource] == count:
+                    while resource != -1:
+                        resources.append(resource)
+                        resource = self.same_key[resource]
+                    break
+                index = (index + 1) & mask
+
+    ###############################################################################################
+    # Name: find_key(nested_key, members = None)
+    #   Returns the resource id of the nested key, the last one added if the key was added more
+    #   than once (of the resources flagged 1 in members if given), None if it is not in the
+    #   table. The suffixes may hold '_' too, so the resources
+    #   of the prefixes of the key ending before a '_' are found from the shortest one: each is a
+    #   key without parent or extends a shorter prefix
+    ###############################################################################################
+    def find_key(self, nested_key, members = None):
+        ends = [end for end, character in enumerate(nested_key) if character == '_'] + [len(nested_key)]
+        prefixes = list()
+        for end in ends:
+            resources = list()
+            self.find_key_part((-1,), nested_key[:end], resources)
+            for start, key_parents in prefixes:
+                self.find_key_part(key_parents, nested_key[start + 1:end], resources)
+            if resources and end < len(nested_key):
+                prefixes.append((end, resources))
+        if members != None:
+            resources = [resource for resource in resources if members[resource]]
+        return max(resources) if resources else None
+
+    ###############################################################################################
+    # Name: children(resource)
+    # Returns:
+    #   list of the resource ids whose nested keys extend the nested key of the resource id
+    ###############################################################################################
+    def children(self, resource):
+        children = list()
+        child = self.first_child[resource]
+        while child != -1:
+            children.append(child)
+            child = self.next_sibling[child]
+        children.reverse()
+        return children
+
+    ###############################################################################################
+    # Name: uri(resource)
+    #   Returns the uri of the resource id
+    ###############################################################################################
+    def uri(self, resource):
+        return self.path_uri(self.resource_path[resource])
+
+    def path_uri(self, path):
+        segments = list()
+        while path != -1:
+            segments.append(self.segment(self.path_segment[path]))
+            path = self.path_parent[path]
+        segments.reverse()
+        return '/'.join(segments)
+
+    ###############################################################################################
+    # Name: nested_key(resource)
+    #   Returns the nested key of the resource id, as in relative_uris
+    ###############################################################################################
+    def nested_key(self, resource):
+        parts = list()
+        while resource != -1:
+            if self.key_count[resource]:
+                parts.append(str(self.key_count[resource]))
+            parts.append(self.strings[self.key_suffix[resource]])
+            resource = self.key_parent[resource]
+        parts.reverse()
+        return '_'.join(parts)
+
+###################################################################################################
+# Class: RelativeUris
+#   Read-only mapping of nested key : uri of the resources of a UriTable, in the order they were
+#   found, for SUT.relative_uris (all resources) and SUT.relative_uris_no_members (the resources
+#   of the members flags). The keys and uris are rebuilt as they are read; keys are looked up thru
+#   the hash table of the nested keys (see UriTable.find_key())
+###################################################################################################
+class RelativeUris(Mapping):
+    def __init__(self, table, members):
+        self.table = table
+        # for relative_uris_no_members: 1 for the resources in the view, by resource id
+        self.members = members
+
+    def ids(self):
+        if self.members == None:
+            return range(len(self.table))
+        return (resource for resource, member in enumerate(self.members) if member)
+
+    def __len__(self):
+        if self.members == None:
+            return len(self.table)
+        return self.members.count(1)
+
+    def __iter__(self):
+        for resource in self.ids():
+            yield self.table.nested_key(resource)
+
+    def __getitem__(self, key):
+        resource = self.table.find_key(key, self.members)
+        if resource == None:
+            raise KeyError(key)
+        return self.table.uri(resource)
+
+    def values(self):
+        return [self.table.uri(resource) for resource in self.ids()]
+
+    def items(self):
+        return [(self.table.nested_key(resource), self.table.uri(resource)) for resource in self.ids()]
+
+    def keys(self):
+        return [self.table.nested_key(resource) for resource in self.ids()]
+
+###################################################################################################
+# Name: type_name(odata_type)
+#   Takes an @odata.type: '#Manager.v1_0_0.Manager' or '#SessionCollection.SessionCollection'
+# Returns:
+#   the name of the type without namespace and version: 'Manager', 'SessionCollection'; None if
+#   odata_type is not a string
+###################################################################################################
+def type_name(odata_type):
+    try:
+        return odata_type.lstrip('#').split('.')[-1]
+    except AttributeError:
+        return None
+
+###################################################################################################
+# Class: ResourceNode
+#   A resource of the graph as returned by ResourceGraph.node()
+###################################################################################################
+class ResourceNode():
+    __slots__ = ('uri', 'nested_key', 'parent', 'odata_type', 'allowed_methods')
+
+    def __init__(self, uri, nested_key, parent, odata_type, allowed_methods):
+        self.uri = uri
+        # key of the resource in relative_uris
+        self.nested_key = nested_key
+        # uri of the resource the link to this resource was first found on, None for the service root
+        self.parent = parent
+        # None until the resource is GET
+        self.odata_type = odata_type
+        # methods of the Allow response header, None if the service did not return one
+        self.allowed_methods = allowed_methods
+
+    def __repr__(self):
+        return 'ResourceNode(%r, %r)' % (self.uri, self.odata_type)
+
+###################################################################################################
+# Class: ResourceGraph
+#   The resources found by the discovery, in the order they were found, in a UriTable and their
+#   indexes by resource id:
+#       by type: type name (see type_name()) : resources of the type
+#       by collection: collection : its Members (the members sampled, see rf_sut.CollectionSampler)
+#   The parent of a resource is the resource its nested key extends (see UriTable). The methods
+#   take and return uris. The graph is built by the crawler thread only
+###################################################################################################
+class ResourceGraph():
+    def __init__(self):
+        self.table = UriTable()
+        # 1 for the resources linked from a dict (not a list) for relative_uris_no_members
+        self.no_members = bytearray()
+        # interned @odata.type (-1 until the resource is GET) and Allow methods (-1 for none)
+        self.odata_type = array('i')
+        self.allowed_methods = array('i')
+        self.types = dict()
+        self.collections = dict()
+        # resource id of the parent last looked up by add_link()
+        self.last_parent = (None, None)
+
+    def __len__(self):
+        return len(self.table)
+
+    def __contains__(self, uri):
+        return self.table.find(uri) != None
+
+    ###############################################################################################
+    # Name: relative_uris(members = True)
+    #   Returns a RelativeUris view of the resources: all resources, or only the resources linked
+    #   from a dict (not from a list like 'Members') if members is False
+    ###############################################################################################
+    def relative_uris(self, members = True):
+        return RelativeUris(self.table, None if members else self.no_members)
+
+    ###############################################################################################
+    # Name: add_link(parent, uri, nested_key, in_list = False)
+    #   Adds the resource uri found on the resource parent (None for the service root) with its
+    #   key in relative_uris; in_list is True for a link found in a list
+    ###############################################################################################
+    def add_link(self, parent, uri, nested_key, in_list = False):
+        parent_id = None
+        if parent != None:
+            if self.last_parent[0] != parent:
+                self.last_parent = (parent, self.table.find(parent))
+            parent_id = self.last_parent[1]
+        self.table.add(uri, nested_key, parent_id)
+        self.no_members.append(0 if in_list else 1)
+        self.odata_type.append(-1)
+        self.allowed_methods.append(-1)
+
+    ###############################################################################################
+    # Name: set_resource(uri, json_payload, headers)
+    #   Sets the @odata.type and allowed methods of the resource uri from the response to its GET
+    ###############################################################################################
+    def set_resource(self, uri, json_payload, headers):
+        resource = self.table.find(uri)
+        if resource == None:
+            return
+        if headers and 'allow' in headers:
+            methods = ','.join([method.strip().upper() for method in headers['allow'].split(',') if method.strip()])
+            self.allowed_methods[resource] = self.table.intern(methods)
+        if isinstance(json_payload, dict):
+            name = type_name(json_payload.get('@odata.type'))
+            if name and self.odata_type[resource] == -1:
+                self.odata_type[resource] = self.table.intern(json_payload['@odata.type'])
+                self.types.setdefault(name, array('i')).append(resource)
+
+    ###############################################################################################
+    # Name: set_members(collection, uris)
+    #   Sets the Members of the collection uri to the uris of its members
+    ###############################################################################################
+    def set_members(self, collection, uris):
+        collection_id = self.table.find(collection)
+        if collection_id == None:
+            return
+        # the members are set before they are added to the graph, they are kept as paths
+        self.collections[collection_id] = array('i', [self.table.find_path(uri, add = True) for uri in uris])
+
+    ###############################################################################################
+    # Name: node(uri)
+    # Returns:
+    #   ResourceNode of uri, None if it was not found by the discovery
+    ###############################################################################################
+    def node(self, uri):
+        resource = self.table.find(uri)
+        if resource == None:
+            return None
+        parent = self.table.key_parent[resource]
+        odata_type = self.odata_type[resource]
+        allowed_methods = self.allowed_methods[resource]
+        return ResourceNode(self.table.uri(resource), self.table.nested_key(resource), self.table.uri(parent) if parent != -1 else None, \
+            self.table.strings[odata_type] if odata_type != -1 else None, \
+            tuple(self.table.strings[allowed_methods].split(',')) if allowed_methods != -1 else None)
+
+    ###############################################################################################
+    # Name: by_type(name)
+    #   Takes a type name without namespace and version, e.g. 'Manager'
+    # Returns:
+    #   list of the uris of the resources of the type, in the order they were GET
+    ###############################################################################################
+    def by_type(self, name):
+        return [self.table.uri(resource) for resource in self.types.get(name, ())]
+
+    ###############################################################################################
+    # Name: members(collection)
+    # Returns:
+    #   list of the uris of the Members of the collection uri
+    ###############################################################################################
+    def members(self, collection):
+        return [self.table.path_uri(path) for path in self.collections.get(self.table.find(collection), ())]
+
+    ###############################################################################################
+    # Name: children_of(uri)
+    # Returns:
+    #   list of the uris of the resources first found on the resource uri
+    ###############################################################################################
+    def children_of(self, uri):
+        parent = self.table.find(uri)
+        if parent == None:
+            return []
+        return [self.table.uri(resource) for resource in self.table.children(parent)]
+
+    ###############################################################################################
+    # Name: report()
+    #   Returns a one line summary of the graph for the log
+    ###############################################################################################
+    def report(self):
+        return ('Resource graph: %s resources of %s types, %s collections' % (len(self.table), len(self.types), len(self.collections)))
+#
+## end ResourceGraph
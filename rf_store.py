@@ -0,0 +1,783 @@
+# Copyright Notice:
+# Copyright 2016 Distributed Management Task Force, Inc. All rights reserved.
+# License: BSD 3-Clause License. For full text see link: https://github.com/DMTF/Redfish-Service-Conformance-Check/LICENSE.md
+
+# File: rf_store.py
+#   This module contains the per run store of the resources of a SUT: the payload, headers and
+#   status of each resource GET by the discovery of the relative uris (SUT.process_uri), so the
+#   read-only assertions can check the resources without GETting them again from the service.
+#   Resources changed by a request of the tool (POST, PATCH, PUT, DELETE) are dropped from the
+#   store and GET from the service again. The payloads are compacted and all but the last ones
+#   stored are compressed, so the store holds big services. The opt-in response cache serves the
+#   repeated GETs of the assertions from the store and from the responses cached since.
+#   The crawl cache saves the resources found by the discovery to disk, so the next run against
+#   the same service revalidates them with conditional GETs instead of GETting all of them.
+#   The snapshot file keeps the resources of each run in an sqlite file, for services bigger than
+#   the memory of the tool and for the analysis of the snapshots after the runs
+
+import sys
+import threading
+import copy
+import gzip
+import json
+import os
+import re
+import time
+import zlib
+import sqlite3
+import hashlib
+from collections import OrderedDict, deque
+import rf_utility
+
+# map python 2 vs 3 imports
+if (sys.version_info < (3, 0)):
+    str_types = (str, unicode)
+    from urllib import pathname2url
+else:
+    str_types = (str,)
+    from urllib.request import pathname2url
+
+# strings up to this length are held once by PayloadCompactor, longer ones (descriptions, messages)
+# seldom repeat
+MAX_SHARED_STRING = 64
+# strings and subtrees held by PayloadCompactor at most: the tables are emptied when they are full,
+# so they do not keep the parts of payloads which were compressed or dropped since
+MAX_SHARED_ITEMS = 8192
+# preset dictionaries of PayloadCompressor (zlib of python 3.3 and later): size (the zlib window)
+# and payloads compressed with each dictionary before it is replaced by one of the payloads since
+COMPRESSION_DICTIONARY_SIZE = 8192
+COMPRESSION_DICTIONARY_PAYLOADS = 4096
+compression_dictionaries = sys.version_info >= (3, 3)
+
+###################################################################################################
+# Name: changed_uris(uri)
+#   Takes the uri of a POST, PATCH, PUT or DELETE request
+# Returns:
+#   the uris of the resources the request may change: the resource, its parent (the collection a
+#   member is added to or deleted from) and, for an action, the resource of the action; with and
+#   without trailing slash, query string aside
+###################################################################################################
+def changed_uris(uri):
+    uri = uri.split('?')[0].rstrip('/')
+    uris = [uri, uri.rsplit('/', 1)[0]]
+    if '/Actions/' in uri:
+        uris.append(uri.split('/Actions/')[0])
+    return [changed for uri in uris for changed in (uri, uri + '/')]
+
+###################################################################################################
+# Class: PayloadCompactor
+#   Shares the parts of the payloads of a ResourceStore which repeat across resources: the keys and
+#   short strings ('@odata.id', 'Status', 'Enabled') are held once, and so are identical subtrees
+#   ({'State' : 'Enabled', 'Health' : 'OK'}), found by a hash of their content (the identity of
+#   the subtrees held for the children, the type and value of the other items). The payloads
+#   compacted must not be changed afterwards, the store returns copies of them
+###################################################################################################
+class PayloadCompactor():
+    def __init__(self):
+        # string : the same string
+        self.strings = dict()
+        # content hash : the subtree held for it
+        self.subtrees = dict()
+        self.stats = {'shared' : 0}
+
+    def string(self, value):
+        if len(value) > MAX_SHARED_STRING:
+            return value
+        if len(self.strings) >= MAX_SHARED_ITEMS:
+            self.strings = dict()
+        return self.strings.setdefault(value, value)
+
+    ###############################################################################################
+    # Name: compact(value, share = True)
+    # Returns:
+    #   value with its strings and subtrees replaced by the ones held for the same content; 
+    #   share = False for a whole payload, which is seldom the same as another one
+    ###############################################################################################
+    def compact(self, value, share = True):
+        if isinstance(value, dict):
+            compacted = dict()
+            tokens = list()
+            for key, child in value.items():
+                key = self.string(key) if isinstance(key, str_types) else key
+                compacted[key] = child = self.compact(child)
+                tokens.append((key, self.token(child)))
+            return self.share(compacted, ('d', tuple(tokens))) if share else compacted
+        if isinstance(value, list):
+            compacted = [self.compact(child) for child in value]
+            return self.share(compacted, ('l', tuple([self.token(child) for child in compacted]))) if share else compacted
+        if isinstance(value, str_types):
+            return self.string(value)
+        return value
+
+    # content of a compacted child: its identity for a subtree (held once), else type and value
+    def token(self, value):
+        if isinstance(value, (dict, list)):
+            return id(value)
+        return (value.__class__, value)
+
+    def share(self, value, tokens):
+        content = hash(tokens)
+        shared = self.subtrees.get(content)
+        if shared is None:
+            if len(self.subtrees) >= MAX_SHARED_ITEMS:
+                self.subtrees = dict()
+            self.subtrees[content] = value
+            return value
+        # the same hash for other content (or the same items in another order) is not shared
+        if type(shared) is type(value) and shared == value and (not isinstance(value, dict) or list(shared) == list(value)):
+            self.stats['shared'] += 1
+            return shared
+        return value
+
+    def clear(self):
+        self.strings = dict()
+        self.subtrees = dict()
+#
+## end PayloadCompactor
+
+###################################################################################################
+# Class: PayloadCompressor
+#   Compresses the JSON of the cold payloads of a ResourceStore. A payload of a few hundred bytes
+#   compresses poorly on its own, so it is compressed with a preset dictionary made of the payloads
+#   compressed just before it (the members of a collection look alike). The dictionaries are kept
+#   for the payloads they compressed. decompress() may run on any thread
+###################################################################################################
+class PayloadCompressor():
+    def __init__(self):
+        # held by the callers of compress(), which may run on several threads
+        self.lock = threading.Lock()
+        self.dictionaries = list()
+        # JSON of the payloads compressed lately, for the next dictionary
+        self.recent = deque()
+        self.recent_size = 0
+        self.count = 0
+
+    ###############################################################################################
+    # Name: compress(data)
+    # Returns:
+    #   index of the dictionary (-1 for none) and the compressed bytes of data
+    ###############################################################################################
+    def compress(self, data):
+        dictionary = -1
+        if compression_dictionaries and self.recent:
+            # new dictionaries while the first payloads are compressed, then once in a while
+            if self.count % COMPRESSION_DICTIONARY_PAYLOADS == 0 or (self.count < 64 and self.count & (self.count - 1) == 0):
+                self.dictionaries.append(b''.join(self.recent)[-COMPRESSION_DICTIONARY_SIZE:])
+            dictionary = len(self.dictionaries) - 1
+        self.count += 1
+        self.recent.append(data)
+        self.recent_size += len(data)
+        while self.recent_size - len(self.recent[0]) >= COMPRESSION_DICTIONARY_SIZE:
+            self.recent_size -= len(self.recent.popleft())
+        if dictionary == -1:
+            return dictionary, zlib.compress(data)
+        compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, zlib.MAX_WBITS, 9, zlib.Z_DEFAULT_STRATEGY, self.dictionaries[dictionary])
+        return dictionary, compressor.compress(data) + compressor.flush()
+
+    def decompress(self, dictionary, body):
+        if dictionary == -1:
+            return zlib.decompress(body)
+        decompressor = zlib.decompressobj(zlib.MAX_WBITS, self.dictionaries[dictionary])
+        return decompressor.decompress(body) + decompressor.flush()
+#
+## end PayloadCompressor
+
+###################################################################################################
+# Class: ResourceStore
+#   (json_payload, headers, status) of resources by uri, as returned by SUT.http_GET() with the
+#   default request headers and authorization 'on'. get() returns copies, so an assertion which
+#   changes a payload it got does not change the payload the next assertion gets.
+#   To hold the resources of a big service the payloads are compacted (see PayloadCompactor) and
+#   all but the hot_payloads resources stored last are kept as compressed JSON, decoded by get()
+#   (0 keeps all payloads decoded).
+#   The store is shared by the worker threads of the SUT requests
+###################################################################################################
+class ResourceStore():
+    def __init__(self, hot_payloads = 0):
+        self.lock = threading.Lock()
+        # uri : (json_payload, headers, status, location) of the resources. The headers of a cold
+        # resource are None, its location is (dictionary, compressed JSON of [json_payload, 
+        # headers]) or the row of the resource in the snapshot file; the location of a hot resource
+        # is None or its row in the snapshot file
+        self.resources = dict()
+        # uris of the hot resources, stored (or read from the snapshot file) last at the end
+        self.hot = OrderedDict()
+        self.hot_payloads = hot_payloads
+        self.compactor = PayloadCompactor()
+        self.compressor = PayloadCompressor()
+        # SnapshotFile the resources are written to, see open_snapshot()
+        self.snapshot = None
+        self.stats = {'stored' : 0, 'hits' : 0, 'misses' : 0, 'invalidated' : 0, 'compressed' : 0, 'compressed_bytes' : 0, 'read' : 0}
+
+    def __len__(self):
+        with self.lock:
+            return len(self.resources)
+
+    def __contains__(self, uri):
+        with self.lock:
+            return uri in self.resources
+
+    ###############################################################################################
+    # Name: open_snapshot(snapshot)
+    #   Takes a SnapshotFile; the resources stored from now on are written to it and their cold
+    #   payloads are read back from it instead of being kept compressed in memory
+    ###############################################################################################
+    def open_snapshot(self, snapshot):
+        self.snapshot = snapshot
+
+    ###############################################################################################
+    # Name: put(uri, json_payload, headers, status)
+    #   Stores the response of the GET of uri; compresses the resources which are no longer hot
+    #   (or writes the resource to the snapshot file)
+    ###############################################################################################
+    def put(self, uri, json_payload, headers, status):
+        # the compactor is only used by put(), which runs on the crawler thread
+        location = self.snapshot.append(uri, json_payload, headers, status) if self.snapshot else None
+        resource = (self.compactor.compact(json_payload, share = False), self.compactor.compact(headers, share = False), status, location)
+        with self.lock:
+            self.remove(uri)
+            self.resources[uri] = resource
+            self.hot[uri] = None
+            self.stats['stored'] += 1
+            cooling = self.cool()
+        self.compress(cooling)
+
+    # drops the decoded payloads of the resources beyond hot_payloads which are in the snapshot
+    # file; returns the others, to be compressed. The caller holds the lock
+    def cool(self):
+        cooling = list()
+        while self.hot_payloads and len(self.hot) > self.hot_payloads:
+            cold_uri = self.hot.popitem(last = False)[0]
+            json_payload, headers, status, location = self.resources[cold_uri]
+            if location != None:
+                self.resources[cold_uri] = (None, None, status, location)
+            else:
+                cooling.append((cold_uri, self.resources[cold_uri]))
+        return cooling
+
+    # compresses the (uri, resource) cooling, the caller does not hold the lock
+    def compress(self, cooling):
+        for cold_uri, resource in cooling:
+            json_payload, headers, status, location = resource
+            with self.compressor.lock:
+                location = self.compressor.compress(json.dumps([json_payload, headers], separators = (',', ':')).encode('utf-8'))
+            with self.lock:
+                # not replaced or dropped meanwhile
+                if self.resources.get(cold_uri) is resource:
+                    self.resources[cold_uri] = (None, None, status, location)
+                    self.stats['compressed'] += 1
+                    self.stats['compressed_bytes'] += len(location[1])
+
+    # drops uri, the caller holds the lock
+    def remove(self, uri):
+        resource = self.resources.pop(uri, None)
+        self.hot.pop(uri, None)
+        if resource != None and isinstance(resource[3], tuple):
+            self.stats['compressed'] -= 1
+            self.stats['compressed_bytes'] -= len(resource[3][1])
+        return resource
+
+    # (json_payload, headers) of the resource tuple, decoded if it is cold
+    def decode(self, resource):
+        json_payload, headers, status, location = resource
+        if headers != None:
+            return json_payload, headers
+        if isinstance(location, tuple):
+            return tuple(json.loads(self.compressor.decompress(*location).decode('utf-8')))
+        return self.snapshot.read(location)[:2]
+
+    ###############################################################################################
+    # Name: get(uri, read_body = True)
+    #   Takes a uri; read_body = False skips the copy of the payload (returned as None)
+    # Returns:
+    #   copy of the (json_payload, headers, status) stored for uri, None if it is not stored
+    ###############################################################################################
+    def get(self, uri, read_body = True):
+        with self.lock:
+            resource = self.resources.get(uri)
+            if resource == None:
+                self.stats['misses'] += 1
+                return None
+            self.stats['hits'] += 1
+            if uri in self.hot:
+                self.hot[uri] = self.hot.pop(uri)
+        json_payload, headers, status, location = resource
+        if headers == None and isinstance(location, tuple):
+            # decoded payloads are new objects, not copied
+            json_payload, headers = self.decode(resource)
+            return (json_payload if read_body else None), headers, status
+        if headers == None:
+            # read from the snapshot file, kept decoded while it is hot
+            json_payload, headers = self.decode(resource)
+            with self.lock:
+                self.stats['read'] += 1
+                cooling = list()
+                if self.resources.get(uri) is resource:
+                    self.resources[uri] = (json_payload, headers, status, location)
+                    self.hot[uri] = None
+                    cooling = self.cool()
+            self.compress(cooling)
+        return (copy.deepcopy(json_payload) if read_body else None), dict(headers), status
+
+    ###############################################################################################
+    # Name: items()
+    # Returns:
+    #   list of the (uri, (json_payload, headers, status)) stored, not copied (cold resources are
+    #   decoded)
+    ###############################################################################################
+    def items(self):
+        with self.lock:
+            resources = list(self.resources.items())
+        return [(uri, self.decode(resource) + (resource[2],)) for uri, resource in resources]
+
+    ###############################################################################################
+    # Name: missing(uris)
+    # Returns:
+    #   list of the uris (in order) which are not stored, to be GET from the service
+    ###############################################################################################
+    def missing(self, uris):
+        with self.lock:
+            missing = [uri for uri in uris if uri not in self.resources]
+            self.stats['misses'] += len(missing)
+        return missing
+
+    ###############################################################################################
+    # Name: invalidate(uri)
+    #   Drops the resources changed by a request to uri from the store, see changed_uris()
+    ###############################################################################################
+    def invalidate(self, uri):
+        with self.lock:
+            for stored_uri in changed_uris(uri):
+                if self.remove(stored_uri) != None:
+                    self.stats['invalidated'] += 1
+
+    ###############################################################################################
+    # Name: clear()
+    #   Drops all resources from the store
+    ###############################################################################################
+    def clear(self):
+        with self.lock:
+            self.resources = dict()
+            self.hot = OrderedDict()
+            self.stats['compressed'] = self.stats['compressed_bytes'] = 0
+        self.compactor.clear()
+
+    ###############################################################################################
+    # Name: report()
+    #   Returns a one line summary of the store for the log
+    ###############################################################################################
+    def report(self):
+        with self.lock:
+            stats = dict(self.stats)
+            resources = len(self.resources)
+        report = ('Resource store: %s resources stored by discovery, %s served from the store, %s GET from the service, %s dropped after changes (%s held at the end, %s compressed to %.1f MB, %s subtrees shared)' \
+            % (stats['stored'], stats['hits'], stats['misses'], stats['invalidated'], resources, stats['compressed'], stats['compressed_bytes'] / 1048576.0, self.compactor.stats['shared']))
+        if self.snapshot:
+            report += '; %s read back from the snapshot file' % stats['read']
+        return report
+#
+## end ResourceStore
+
+###################################################################################################
+# Class: ResponseCache
+#   Opt-in cache of the GET responses of a run ("Cache" connection settings, see SUT.http_GET()),
+#   for the assertions which GET the same resources again and again. A response is cached by its
+#   uri and request headers (the authorization headers aside: with authorization 'on' they are
+#   always the credentials or session of the tool) and dropped when a POST, PATCH, PUT or DELETE
+#   may change it (see changed_uris()). The responses to the default request headers of the
+#   resources found by the discovery are taken from the resource store, not cached twice.
+#   Requests which check how the service handles authorization, conditional or content
+#   negotiation headers are not served from the cache, see key().
+#   The cache is shared by the worker threads of the SUT requests
+###################################################################################################
+class ResponseCache():
+    def __init__(self, resource_store):
+        self.resource_store = resource_store
+        self.lock = threading.Lock()
+        # uri : {request headers key : (json_payload, headers, status, read_body)}
+        self.responses = dict()
+        self.default_headers = rf_utility.create_request_headers()
+        self.default_key = self.headers_key(self.default_headers)
+        # changes since the cache was created: a response GET while a request changed its
+        # resource is not cached
+        self.generation = 0
+        self.stats = {'hits' : 0, 'stored' : 0, 'misses' : 0, 'bypassed' : 0, 'invalidated' : 0}
+
+    def headers_key(self, rq_headers):
+        return tuple(sorted([(key.lower(), value) for key, value in rq_headers.items() if key.lower() not in rf_utility.cache_auth_headers]))
+
+    ###############################################################################################
+    # Name: key(uri, rq_headers, auth_on_off)
+    # Returns:
+    #   cache key of the GET of uri with the request headers and authorization, None if the GET is
+    #   not to be served from the cache: authorization not 'on', a conditional or Accept-Encoding 
+    #   request header or an Accept other than the default
+    ###############################################################################################
+    def key(self, uri, rq_headers, auth_on_off):
+        headers = set([key.lower() for key in rq_headers])
+        if auth_on_off != 'on' or headers.intersection(rf_utility.cache_bypass_headers) \
+            or rq_headers.get('Accept', self.default_headers['Accept']) != self.default_headers['Accept']:
+            with self.lock:
+                self.stats['bypassed'] += 1
+            return None
+        return uri, self.headers_key(rq_headers), self.generation
+
+    ###############################################################################################
+    # Name: get(key, read_body = True)
+    #   Takes a key from key(); read_body = False skips the copy of the payload (returned as None)
+    # Returns:
+    #   copy of the (json_payload, headers, status) cached for key, None if it is not cached
+    ###############################################################################################
+    def get(self, key, read_body = True):
+        uri, headers_key, generation = key
+        with self.lock:
+            response = self.responses.get(uri, dict()).get(headers_key)
+            if response != None and (response[3] or not read_body):
+                self.stats['hits'] += 1
+            else:
+                response = None
+        if response != None:
+            json_payload, headers, status, body = response
+            return (copy.deepcopy(json_payload) if read_body else None), dict(headers), status
+        if headers_key == self.default_key and uri in self.resource_store:
+            response = self.resource_store.get(uri, read_body)
+            if response != None:
+                with self.lock:
+                    self.stats['stored'] += 1
+                return response
+        with self.lock:
+            self.stats['misses'] += 1
+        return None
+
+    ###############################################################################################
+    # Name: put(key, response, read_body = True)
+    #   Caches the (json_payload, headers, status) response of the GET of key, if it is a 200 (OK)
+    #   and no request changed its resource since key() 
+    ###############################################################################################
+    def put(self, key, response, read_body = True):
+        uri, headers_key, generation = key
+        json_payload, headers, status = response
+        if status != rf_utility.HTTP_OK or not headers:
+            return
+        json_payload = copy.deepcopy(json_payload) if read_body else None
+        with self.lock:
+            if generation == self.generation:
+                self.responses.setdefault(uri, dict())[headers_key] = (json_payload, dict(headers), status, read_body)
+
+    ###############################################################################################
+    # Name: invalidate(uri)
+    #   Drops the responses changed by a request to uri from the cache, see changed_uris()
+    ###############################################################################################
+    def invalidate(self, uri):
+        with self.lock:
+            self.generation += 1
+            for cached_uri in changed_uris(uri):
+                self.stats['invalidated'] += len(self.responses.pop(cached_uri, ()))
+
+    ###############################################################################################
+    # Name: report()
+    #   Returns a one line summary of the cache for the log
+    ###############################################################################################
+    def report(self):
+        with self.lock:
+            stats = dict(self.stats)
+            responses = sum([len(cached) for cached in self.responses.values()])
+        return ('GET cache: %s served from the cache, %s from the resource store, %s GET from the service, %s bypassed (authorization, conditional or content negotiation headers), %s dropped after changes (%s held at the end)' \
+            % (stats['hits'], stats['stored'], stats['misses'], stats['bypassed'], stats['invalidated'], responses))
+#
+## end ResponseCache
+
+###################################################################################################
+# Name: crawl_cache_path(folder, dns_name, uuid)
+# Returns:
+#   path of the crawl cache file of the service with the DnsName and service root UUID in folder
+###################################################################################################
+def crawl_cache_path(folder, dns_name, uuid):
+    return os.path.join(folder, re.sub('[^A-Za-z0-9._-]', '_', 'crawl_%s_%s' % (dns_name, uuid)) + '.json.gz')
+
+###################################################################################################
+# Class: CrawlCache
+#   The resources found by the discovery of a service in a previous run, saved with their headers
+#   to the gzip compressed JSON file_path (see crawl_cache_path()). The crawler GETs the saved
+#   resources with the conditional request headers (If-None-Match with the ETag, If-Modified-Since
+#   with the Last-Modified of the saved resource) and revalidate() replaces a 304 (Not Modified)
+#   response by the saved resource, so an unchanged service is crawled without transferring its
+#   resources again. save() replaces the file with the resources of this run
+###################################################################################################
+class CrawlCache():
+    def __init__(self, file_path, sut_prop, uuid):
+        self.file_path = file_path
+        self.sut_prop = sut_prop
+        self.uuid = uuid
+        self.lock = threading.Lock()
+        # uri : {'Status' : status, 'Headers' : headers, 'Payload' : json_payload} of the saved resources
+        self.resources = dict()
+        self.stats = {'loaded' : 0, 'unchanged' : 0, 'changed' : 0, 'new' : 0, 'saved' : 0}
+        self.load()
+
+    ###############################################################################################
+    # Name: load()
+    #   Reads the resources saved by the previous run, if any. A file which cannot be read is 
+    #   ignored (all resources are GET)
+    ###############################################################################################
+    def load(self):
+        if not os.path.isfile(self.file_path):
+            return
+        try:
+            with gzip.open(self.file_path, 'rb') as cache_file:
+                cache = json.loads(cache_file.read().decode('utf-8'))
+        except (IOError, OSError, ValueError) as e:
+            print('Warning: crawl cache %s could not be read (%s), all resources are GET' % (self.file_path, e))
+            return
+        if cache.get('DnsName') != self.sut_prop['DnsName'] or cache.get('UUID') != self.uuid:
+            return
+        self.resources = cache.get('Resources', dict())
+        self.stats['loaded'] = len(self.resources)
+
+    ###############################################################################################
+    # Name: conditional_headers(uri)
+    # Returns:
+    #   dict of the conditional request headers of the GET of uri, empty if it is not saved
+    ###############################################################################################
+    def conditional_headers(self, uri):
+        rq_headers = dict()
+        resource = self.resources.get(uri)
+        if resource:
+            if 'etag' in resource['Headers']:
+                rq_headers['If-None-Match'] = resource['Headers']['etag']
+            if 'last-modified' in resource['Headers']:
+                rq_headers['If-Modified-Since'] = resource['Headers']['last-modified']
+        return rq_headers
+
+    ###############################################################################################
+    # Name: revalidate(uri, response)
+    #   Takes the uri and the (json_payload, headers, status) response of its conditional GET
+    # Returns:
+    #   the saved resource (its headers updated by the 304 response) if the service answered 304,
+    #   else the response
+    ###############################################################################################
+    def revalidate(self, uri, response):
+        json_payload, headers, status = response
+        resource = self.resources.get(uri)
+        if resource and status == rf_utility.HTTP_NOTMODIFIED:
+            saved_headers = dict(resource['Headers'])
+            saved_headers.update([(key, value) for key, value in headers.items() if key not in ('content-length', 'content-encoding', 'transfer-encoding')])
+            with self.lock:
+                self.stats['unchanged'] += 1
+            return resource['Payload'], saved_headers, resource['Status']
+        if headers and status:
+            with self.lock:
+                self.stats['changed' if resource else 'new'] += 1
+        return response
+
+    ###############################################################################################
+    # Name: save(relative_uris, resource_store)
+    #   Takes the relative uris found by the discovery and the ResourceStore of their responses;
+    #   writes the resources answered with 200 and an ETag or Last-Modified to the file
+    ###############################################################################################
+    def save(self, relative_uris, resource_store):
+        resources = dict()
+        for uri, (json_payload, headers, status) in resource_store.items():
+            if status == rf_utility.HTTP_OK and ('etag' in headers or 'last-modified' in headers) and isinstance(json_payload, (dict, list)):
+                resources[uri] = {'Status' : status, 'Headers' : headers, 'Payload' : json_payload}
+        cache = {'DnsName' : self.sut_prop['DnsName'], 'UUID' : self.uuid, 'Saved' : time.strftime('%Y-%m-%dT%H:%M:%S'), \
+            'RelativeUris' : list(relative_uris.items()), 'Resources' : resources}
+        # write a new file and replace the old one, so an interrupted run does not leave a partial file
+        temp_path = self.file_path + '.tmp'
+        try:
+            with gzip.open(temp_path, 'wb') as cache_file:
+                cache_file.write(json.dumps(cache).encode('utf-8'))
+            if os.path.exists(self.file_path):
+                os.remove(self.file_path)
+            os.rename(temp_path, self.file_path)
+        except (IOError, OSError) as e:
+            print('Warning: crawl cache %s could not be written (%s)' % (self.file_path, e))
+            return
+        self.stats['saved'] = len(resources)
+
+    ###############################################################################################
+    # Name: report()
+    #   Returns a one line summary of the crawl cache for the log
+    ###############################################################################################
+    def report(self):
+        with self.lock:
+            stats = dict(self.stats)
+        return ('Crawl cache: %s resources loaded, %s unchanged (304), %s changed, %s new, %s saved to %s' \
+            % (stats['loaded'], stats['unchanged'], stats['changed'], stats['new'], stats['saved'], self.file_path))
+#
+## end CrawlCache
+
+# tables of a snapshot file: a row per snapshot (run) and a row per response stored by the run,
+# the payload and headers as JSON text and the content hash of the status and payload (see
+# content_hash())
+SNAPSHOT_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (id INTEGER PRIMARY KEY, dns_name TEXT, display_name TEXT, started TEXT);
+CREATE TABLE IF NOT EXISTS resources (id INTEGER PRIMARY KEY, snapshot INTEGER, uri TEXT, status INTEGER, headers TEXT, payload TEXT, hash TEXT);
+CREATE INDEX IF NOT EXISTS resources_snapshot_uri ON resources (snapshot, uri);
+"""
+# rows written before they are committed to the file
+SNAPSHOT_COMMIT_ROWS = 256
+
+###################################################################################################
+# Name: content_hash(status, json_payload)
+# Returns:
+#   hex digest of the status and the payload (keys sorted, so the order of the properties does
+#   not matter): two responses with the same hash are the same resource content
+###################################################################################################
+def content_hash(status, json_payload):
+    return hashlib.sha1(json.dumps([status, json_payload], sort_keys = True, separators = (',', ':')).encode('utf-8')).hexdigest()
+
+###################################################################################################
+# Name: snapshot_path(folder, dns_name)
+# Returns:
+#   path of the snapshot file of the service with the DnsName in folder
+###################################################################################################
+def snapshot_path(folder, dns_name):
+    return os.path.join(folder, re.sub('[^A-Za-z0-9._-]', '_', 'snapshots_%s' % dns_name) + '.sqlite')
+
+###################################################################################################
+# Class: SnapshotFile
+#   sqlite file of the snapshots of the resources of a service ("Cache" SnapshotStore in 
+#   properties.json, see snapshot_path()). Each run adds a snapshot with a row per resource stored
+#   by its ResourceStore, rows are only appended: a resource GET again is a new row. The store reads
+#   the cold payloads back from the file by row, so it only holds the hot payloads in memory.
+#   Opened without sut_prop the file is read only, for the analysis of the snapshots, see 
+#   snapshots() and resources(): it is not changed (nor created, IOError is raised if it is
+#   missing or is not a snapshot file).
+#   The file is shared by the worker threads of the SUT requests
+###################################################################################################
+class SnapshotFile():
+    def __init__(self, file_path, sut_prop = None):
+        self.file_path = file_path
+        self.lock = threading.Lock()
+        self.connection = None
+        self.snapshot = None
+        self.rows = 0
+        self.pending = 0
+        if sut_prop == None:
+            self.open_read_only()
+            return
+        self.connection = sqlite3.connect(file_path, check_same_thread = False)
+        # appended rows are committed in batches, a crash of the tool loses the last batch at most
+        self.connection.execute('PRAGMA journal_mode = WAL')
+        self.connection.execute('PRAGMA synchronous = NORMAL')
+        self.connection.executescript(SNAPSHOT_SCHEMA)
+        # files written before the content hash was added get the column
+        if not self.has_hash():
+            self.connection.execute('ALTER TABLE resources ADD COLUMN hash TEXT')
+        cursor = self.connection.execute('INSERT INTO snapshots (dns_name, display_name, started) VALUES (?, ?, ?)', \
+            (sut_prop['DnsName'], sut_prop.get('DisplayName'), time.strftime('%Y-%m-%dT%H:%M:%S')))
+        self.snapshot = cursor.lastrowid
+        self.connection.commit()
+
+    ###############################################################################################
+    # Name: open_read_only()
+    #   Opens the file for reading (read only mode of sqlite on python 3), raises IOError if the
+    #   file is missing, empty or has no snapshots table
+    ###############################################################################################
+    def open_read_only(self):
+        if not os.path.isfile(self.file_path) or os.path.getsize(self.file_path) == 0:
+            raise IOError('snapshot file %s not found or empty' % self.file_path)
+        if sys.version_info >= (3, 4):
+            self.connection = sqlite3.connect('file:%s?mode=ro' % pathname2url(os.path.abspath(self.file_path)), uri = True, check_same_thread = False)
+        else:
+            self.connection = sqlite3.connect(self.file_path, check_same_thread = False)
+        try:
+            tables = [table[0] for table in self.connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'")]
+        except sqlite3.DatabaseError:
+            tables = []
+        if 'snapshots' not in tables or 'resources' not in tables:
+            self.connection.close()
+            self.connection = None
+            raise IOError('%s is not a snapshot file' % self.file_path)
+
+    def has_hash(self):
+        return 'hash' in [column[1] for column in self.connection.execute('PRAGMA table_info(resources)')]
+
+    ###############################################################################################
+    # Name: append(uri, json_payload, headers, status)
+    #   Writes the response of the GET of uri to the snapshot of this run
+    # Returns:
+    #   row of the resource, see read()
+    ###############################################################################################
+    def append(self, uri, json_payload, headers, status):
+        row = (self.snapshot, uri, status, json.dumps(headers), json.dumps(json_payload), content_hash(status, json_payload))
+        with self.lock:
+            cursor = self.connection.execute('INSERT INTO resources (snapshot, uri, status, headers, payload, hash) VALUES (?, ?, ?, ?, ?, ?)', row)
+            self.rows += 1
+            self.pending += 1
+            if self.pending >= SNAPSHOT_COMMIT_ROWS:
+                self.connection.commit()
+                self.pending = 0
+            return cursor.lastrowid
+
+    ###############################################################################################
+    # Name: read(row)
+    # Returns:
+    #   (json_payload, headers, status) of the row written by append()
+    ###############################################################################################
+    def read(self, row):
+        with self.lock:
+            headers, json_payload, status = self.connection.execute('SELECT headers, payload, status FROM resources WHERE id = ?', (row,)).fetchone()
+        return json.loads(json_payload), json.loads(headers), status
+
+    ###############################################################################################
+    # Name: snapshots()
+    # Returns:
+    #   list of (snapshot, DnsName, DisplayName, start time, number of resources) of the snapshots
+    #   in the file, oldest first
+    ###############################################################################################
+    def snapshots(self):
+        with self.lock:
+            return self.connection.execute('SELECT snapshots.id, dns_name, display_name, started, COUNT(DISTINCT resources.uri) FROM snapshots \
+                LEFT JOIN resources ON resources.snapshot = snapshots.id GROUP BY snapshots.id ORDER BY snapshots.id').fetchall()
+
+    ###############################################################################################
+    # Name: hashes(snapshot)
+    # Returns:
+    #   dict of uri : (content hash, row) of the last row of each resource of the snapshot, the
+    #   hash is None for a row written without one. The rows of a file written before the content
+    #   hash was added are hashed here
+    ###############################################################################################
+    def hashes(self, snapshot):
+        with self.lock:
+            if self.has_hash():
+                return dict([(uri, (content, row)) for uri, content, row in self.connection.execute( \
+                    'SELECT uri, hash, id FROM resources WHERE id IN (SELECT MAX(id) FROM resources WHERE snapshot = ? GROUP BY uri)', (snapshot,))])
+            return dict([(uri, (content_hash(status, json.loads(json_payload)), row)) for uri, status, json_payload, row in self.connection.execute( \
+                'SELECT uri, status, payload, id FROM resources WHERE id IN (SELECT MAX(id) FROM resources WHERE snapshot = ? GROUP BY uri)', (snapshot,))])
+
+    ###############################################################################################
+    # Name: resources(snapshot)
+    #   Yields:
+    #     (uri, json_payload, headers, status) of each resource of the snapshot (its last row if
+    #     it was GET more than once), in the order the resources were stored
+    ###############################################################################################
+    def resources(self, snapshot):
+        with self.lock:
+            rows = [row[0] for row in self.connection.execute('SELECT MAX(id) FROM resources WHERE snapshot = ? GROUP BY uri ORDER BY MIN(id)', (snapshot,))]
+        for row in rows:
+            with self.lock:
+                uri, headers, json_payload, status = self.connection.execute('SELECT uri, headers, payload, status FROM resources WHERE id = ?', (row,)).fetchone()
+            yield uri, json.loads(json_payload), json.loads(headers), status
+
+    ###############################################################################################
+    # Name: close()
+    #   Commits the rows written and closes the file
+    ###############################################################################################
+    def close(self):
+        with self.lock:
+            if self.connection != None:
+                if self.snapshot != None:
+                    self.connection.commit()
+                self.connection.close()
+                self.connection = None
+
+    ###############################################################################################
+    # Name: report()
+    #   Returns a one line summary of the snapshot file for the log
+    ###############################################################################################
+    def report(self):
+        return ('Snapshot file: %s resources written to snapshot %s of %s' % (self.rows, self.snapshot, self.file_path))
+#
+## end SnapshotFile
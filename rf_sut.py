@@ -10,7 +10,26 @@
 import sys
 from schema import SchemaModel
 import rf_utility
-from collections import OrderedDict
+import rf_store
+import rf_graph
+from collections import OrderedDict, deque
+import itertools
+import time
+import random
+import threading
+
+# concurrent.futures is part of python 3.2+, python 2 needs the 'futures' backport (pip install futures)
+# otherwise batch requests are issued serially
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:
+    ThreadPoolExecutor = None
+
+# the asyncio transport needs python 3.5+, the http_XXX_async() functions are not available otherwise
+try:
+    import rf_async
+except (ImportError, SyntaxError):
+    rf_async = None
 
 # map python 2 vs 3 imports
 if (sys.version_info < (3, 0)):
@@ -45,7 +64,220 @@ import zipfile
 
 
 ###################################################################################################
-# Class: SUT                                            
+# Class: UriPrefetcher
+#   Issues the GETs of resources ahead of a single threaded consumer (the crawler in 
+#   SUT.process_uri) on up to max_workers threads. Uris are added in the order they are expected 
+#   to be needed, the uris added last are fetched first (depth first) and at most 2 * max_workers
+#   responses are fetched ahead. Uris for which skip(uri) is True by the time they would be fetched
+#   are dropped. get() returns the response of a uri fetched ahead or GETs it
+###################################################################################################
+class UriPrefetcher():
+    def __init__(self, fetch, max_workers, skip):
+        self.fetch = fetch
+        self.skip = skip
+        self.window = 2 * max_workers
+        self.executor = None
+        if ThreadPoolExecutor != None and max_workers > 1:
+            self.executor = ThreadPoolExecutor(max_workers = max_workers)
+        # uri : future of the GETs issued ahead
+        self.in_flight = dict()
+        # lists of uris to fetch ahead, the list added last is fetched first
+        self.pending = list()
+
+    def add(self, uris):
+        if self.executor != None and uris:
+            self.pending.append(deque(uris))
+            self.top_up()
+
+    def top_up(self):
+        while self.pending and len(self.in_flight) < self.window:
+            uris = self.pending[-1]
+            uri = uris.popleft()
+            if not uris:
+                self.pending.pop()
+            if uri not in self.in_flight and not self.skip(uri):
+                self.in_flight[uri] = self.executor.submit(self.fetch, uri)
+
+    def get(self, uri):
+        future = self.in_flight.pop(uri, None)
+        response = future.result() if future != None else self.fetch(uri)
+        if self.executor != None:
+            self.top_up()
+        return response
+
+    def close(self):
+        for future in self.in_flight.values():
+            future.cancel()
+        self.in_flight = dict()
+        self.pending = list()
+        if self.executor != None:
+            self.executor.shutdown(wait = False)
+
+###################################################################################################
+# Class: CollectionSampler
+#   Sampling of the members of big collections ("Discovery" MaxMembersPerCollection and
+#   SamplingSeed in properties.json). The members of a collection with more than max_members 
+#   members are reduced to the first and the last member and a random sample of the others, 
+#   max_members in all (at least 2), in their order in the collection. The sample depends only on the seed and
+#   the collection uri, so each run with the same seed checks the same members. The members
+#   sampled from each collection are recorded for the log, see report_lines() and write_summary()
+###################################################################################################
+class CollectionSampler():
+    def __init__(self, max_members, seed):
+        self.max_members = max(max_members, 2) if max_members > 0 else 0
+        self.seed = seed
+        self.lock = threading.Lock()
+        # collection uri : {'Members' : number of members, 'Sampled' : [[index, member uri], ...]}
+        self.sampled = OrderedDict()
+
+    ###############################################################################################
+    # Name: sample_indices(collection_uri, total)
+    # Returns:
+    #   sorted list of the indices of the members sampled from a collection of total members, None
+    #   if the collection is not sampled
+    ###############################################################################################
+    def sample_indices(self, collection_uri, total):
+        if self.max_members <= 0 or total <= self.max_members:
+            return None
+        last = total - 1
+        rng = random.Random('%s:%s' % (self.seed, collection_uri))
+        return [0] + sorted(rng.sample(range(1, last), self.max_members - 2)) + [last]
+
+    ###############################################################################################
+    # Name: sample(collection_uri, members, total = None)
+    #   Takes the uri of a collection, an iterable of its 'Members' and the number of members if it
+    #   is known (Members@odata.count), else all members are read to count them
+    # Yields:
+    #   the members sampled, all members if the collection is not sampled
+    ###############################################################################################
+    def sample(self, collection_uri, members, total = None):
+        if self.max_members <= 0:
+            for member in members:
+                yield member
+            return
+        if total == None:
+            members = list(members)
+            total = len(members)
+        indices = self.sample_indices(collection_uri, total)
+        if indices == None:
+            for member in members:
+                yield member
+            return
+
+        sampled = list()
+        with self.lock:
+            self.sampled[collection_uri] = {'Members' : total, 'Sampled' : sampled}
+        indices = set(indices)
+        for index, member in enumerate(members):
+            if index in indices:
+                with self.lock:
+                    sampled.append([index, member.get('@odata.id') if isinstance(member, dict) else None])
+                yield member
+
+    ###############################################################################################
+    # Name: report_lines()
+    #   Returns a line for the log per collection sampled: the members sampled by their index
+    ###############################################################################################
+    def report_lines(self):
+        with self.lock:
+            sampled = list(self.sampled.items())
+        return ['Collection sampling: %s of %s members of %s checked (seed %s): members #%s' \
+            % (len(record['Sampled']), record['Members'], uri, self.seed, ', #'.join([str(index) for index, member in record['Sampled']])) for uri, record in sampled]
+
+    ###############################################################################################
+    # Name: write_summary(file_path)
+    #   Writes the members sampled from each collection with their uris to the json file_path
+    ###############################################################################################
+    def write_summary(self, file_path):
+        with self.lock:
+            summary = {'MaxMembersPerCollection' : self.max_members, 'SamplingSeed' : self.seed, 'Collections' : self.sampled}
+            with open(file_path, 'w') as summary_file:
+                json.dump(summary, summary_file, indent = 2)
+
+###################################################################################################
+# Class: PagingStats
+#   Counts of the collections whose Members are split in pages (Members@odata.nextLink) and the 
+#   seconds of the GETs of their next pages, see SUT.collection_pages(). wait is the time the
+#   consumers of the members waited for a next page which was not prefetched yet
+###################################################################################################
+class PagingStats():
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.stats = {'collections' : 0, 'pages' : 0, 'page_time' : 0.0, 'max_page_time' : 0.0, 'wait' : 0.0, 'failed' : 0}
+
+    def add_collection(self):
+        with self.lock:
+            self.stats['collections'] += 1
+
+    def add_page(self, page_time, failed = False):
+        with self.lock:
+            self.stats['pages'] += 1
+            self.stats['page_time'] += page_time
+            self.stats['max_page_time'] = max(self.stats['max_page_time'], page_time)
+            if failed:
+                self.stats['failed'] += 1
+
+    def add_wait(self, wait):
+        with self.lock:
+            self.stats['wait'] += wait
+
+    ###############################################################################################
+    # Name: report()
+    #   Returns a one line summary of the paging for the log
+    ###############################################################################################
+    def report(self):
+        with self.lock:
+            stats = dict(self.stats)
+        return ('Collection paging: %s collections with next pages, %s next pages GET (%s failed), average %.0f ms, max %.0f ms per page, %.1f s waited for pages not prefetched' \
+            % (stats['collections'], stats['pages'], stats['failed'], stats['page_time'] * 1000 / max(stats['pages'], 1), stats['max_page_time'] * 1000, stats['wait']))
+
+###################################################################################################
+# Class: AssertionLog
+#   The log an assertion run by SUT.visit_resources() is given instead of the logger.Log of the
+#   run: its assertion_log() calls are kept until flush() writes them to the log after a
+#   BEGIN_ASSERTION of the assertion, so the lines of the assertions checking the same resources
+#   are not mixed. Everything else (status values, status_fixup()...) is the log's. status is
+#   the status of the assertion for the resources checked so far
+###################################################################################################
+class AssertionLog():
+    def __init__(self, log, assertion_id):
+        self.log = log
+        self.AssertionID = assertion_id
+        self.status = log.PASS
+        self.lines = []
+
+    def __getattr__(self, name):
+        return getattr(self.log, name)
+
+    def assertion_log(self, log_control, log_string, SUT_prop = None, service_root = None):
+        self.lines.append((log_control, log_string))
+        return(1)
+
+    ###############################################################################################
+    # Name: flush()
+    #   Logs the assertion: BEGIN_ASSERTION, the lines kept and the status
+    # Returns:
+    #   status of the assertion
+    ###############################################################################################
+    def flush(self):
+        self.log.AssertionID = self.AssertionID
+        self.log.assertion_log('BEGIN_ASSERTION', None)
+        for log_control, log_string in self.lines:
+            self.log.assertion_log(log_control, log_string)
+        self.lines = []
+        self.log.assertion_log(self.status, None)
+        return self.status
+
+###################################################################################################
+# Name: assertion_id(assertion)
+# Returns:
+#   id of an assertion function from its name: Assertion_6_1_8_2 is assertion 6.1.8.2
+###################################################################################################
+def assertion_id(assertion):
+    return assertion.__name__.lstrip('_').replace('Assertion_', '', 1).replace('_', '.')
+
+###################################################################################################
+# Class: SUT                                        
 #  This class is a container for all SUT information. Initializes with a dictionary containing
 #  basic info the SUT provided in properties.json             
 ###################################################################################################
@@ -64,10 +296,30 @@ class SUT():
 
         # gets service top level entry points from OData Service Doc
         self.sut_toplevel_uris = dict()
-        # place holder for relative uris 
-        self.relative_uris = OrderedDict()
-        # placeholder for relative uris minus resource 'Members'
-        self.relative_uris_no_members = OrderedDict()
+        # graph of the resources found by process_uri(): uri, nested key, type, parent and allowed
+        # methods of each resource in a compact table (see rf_graph)
+        self.resource_graph = rf_graph.ResourceGraph()
+        # place holder for relative uris (read-only view of the resource graph)
+        self.relative_uris = self.resource_graph.relative_uris()
+        # placeholder for relative uris minus resource 'Members' (read-only view of the resource graph)
+        self.relative_uris_no_members = self.resource_graph.relative_uris(members = False)
+        # responses of the resources GET by process_uri(), read by the read-only assertions thru
+        # http_GET_stored_iter() instead of GETting the resources again
+        self.resource_store = rf_store.ResourceStore(rf_utility.payload_settings['HotPayloads'])
+        # rf_store.SnapshotFile the resource store writes to if SnapshotStore is enabled (see 
+        # open_snapshot())
+        self.snapshot = None
+        # rf_store.ResponseCache of the GETs of the assertions if CacheGET is enabled, created once
+        # the discovery has filled the resource store (see collect_relative_uris())
+        self.get_cache = None
+        # folder of the crawl cache files if incremental recrawl is enabled (see set_crawl_cache_folder())
+        # and the rf_store.CrawlCache of this service once its UUID is known
+        self.crawl_cache_folder = None
+        self.crawl_cache = None
+        # sampling of the members of big collections traversed by the discovery and get_resource_members()
+        self.sampler = CollectionSampler(rf_utility.sampling_settings['MaxMembersPerCollection'], rf_utility.sampling_settings['SamplingSeed'])
+        # next pages of the collections read thru collection_pages()
+        self.paging = PagingStats()
 
         #service root uri
         self.service_root = None
@@ -89,6 +341,42 @@ class SUT():
         self.cookie_detail = list()
         self.cookie_info = [False, self.cookie_detail, 0]
         #self.cookie_info = None
+        # max concurrent requests of batch requests like http_GET_many(), optional "MaxConcurrentRequests"
+        # in the SUT properties
+        self.max_workers = 8
+        if 'MaxConcurrentRequests' in sut_prop:
+            try:
+                self.max_workers = max(1, int(sut_prop['MaxConcurrentRequests']))
+            except ValueError:
+                print('Warning: MaxConcurrentRequests %s in properties.json is not a number, using %s' % (sut_prop['MaxConcurrentRequests'], self.max_workers))
+        # optional "ReplayCapture" in the SUT properties: path of a traffic capture (see start_recording())
+        # the requests are answered from instead of the SUT
+        self.replay = None
+        if sut_prop.get('ReplayCapture'):
+            self.replay = rf_utility.TrafficReplay(sut_prop['ReplayCapture'], sut_prop)
+            self.conn_pool = rf_utility.ReplayConnectionPool(sut_prop, self.replay, max_idle = self.max_workers)
+        else:
+            # persistent (keep-alive) connections shared by all http requests to this SUT
+            self.conn_pool = rf_utility.ConnectionPool(sut_prop, max_idle = self.max_workers)
+        # keep-alive streams and concurrency limit of the asyncio transport
+        self.async_pool = None
+        if rf_async:
+            self.async_pool = rf_async.AsyncConnectionPool(sut_prop, self.max_workers, rf_async.replay_opener(self.replay) if self.replay else None)
+            self.async_pool.metrics = self.conn_pool.metrics
+        # retried requests already reported by request_notes()
+        self.retries_noted = 0
+        # wall clock time all assertions of this SUT have to complete by, set by start_run()
+        self.run_deadline = None
+        # TrafficRecorder of the requests to this SUT if traffic capture is enabled, see start_recording()
+        self.recorder = None
+        # optional "AuthenticationMode": "Session" in the SUT properties -- authenticated requests use the
+        # X-Auth-Token of one Redfish session instead of Basic auth (default "Basic")
+        self.session_auth = None
+        if str(sut_prop.get('AuthenticationMode', 'Basic')).lower() == 'session':
+            self.session_auth = rf_utility.SessionAuth(sut_prop, self.conn_pool)
+            self.conn_pool.session_auth = self.session_auth
+            if self.async_pool:
+                self.async_pool.session_auth = self.session_auth
 
         # this gets set on a successful event subscription - Assertion 8.1.3
         # these get used by subsequent event subscription checks/assertions
@@ -118,25 +406,134 @@ class SUT():
         return rf_utility.create_request_headers()
 
     ###############################################################################################
-    # Name: http_GET(resource_uri, rq_headers, auth_on_off)                                              
+    # Name: http_GET(resource_uri, rq_headers, auth_on_off, read_body = True)                                              
     #   Issue a GET request for resource uri thru base HTTP__GET() in rf_utility by passing SUT
     #   HTTP connection properties to it.
-    #   Takes resource uri, request header dict, and authorization 'on' or 'off' option
+    #   Takes resource uri, request header dict, and authorization 'on' or 'off' option. 
+    #   read_body = False skips the response payload (returned as None) for assertions which only
+    #   check the status and headers. With the GET cache enabled the response may be taken from
+    #   the responses of this run, see rf_store.ResponseCache
     # Returns:
     #   - Response json_payload dict or string depending on 'content-type' in request header. If
     #       'application/json' then json_payload will be a dict. 
     #   - Response Headers dict: header keys in lower case
     #   - Response Status code: http status code returned from the request                                                 
     ###############################################################################################
-    def http_GET(self, resource_uri, rq_headers, auth_on_off) :      
+    def http_GET(self, resource_uri, rq_headers, auth_on_off, read_body = True) :      
         if (rq_headers == None):
             rq_headers = self.request_headers()
+        cache_key = self.get_cache.key(resource_uri, rq_headers, auth_on_off) if self.get_cache else None
+        if cache_key:
+            response = self.get_cache.get(cache_key, read_body)
+            if response != None:
+                return response
         # issue the GET on the resource...
-        return rf_utility.http__GET(self.SUT_prop, resource_uri, rq_headers, auth_on_off, self.cookie_info)
+        response = rf_utility.http__GET(self.SUT_prop, resource_uri, rq_headers, auth_on_off, self.cookie_info, self.conn_pool, read_body)
+        if cache_key:
+            self.get_cache.put(cache_key, response, read_body)
+        return response
                                                             
     #
     ## end http_GET
 
+    ###############################################################################################
+    # Name: http_GET_many_iter(uris, rq_headers, auth_on_off, max_workers = None, read_body = True)
+    #   Issue GET requests for a batch of resource uris thru http_GET() with up to max_workers 
+    #   requests in flight (default: MaxConcurrentRequests of the SUT). Requests are submitted in a 
+    #   bounded window ahead of the consumer so only a few responses are held at a time.
+    #   Takes iterable of resource uris, request header dict, and authorization 'on' or 'off' option
+    #   read_body = False skips the response payloads, see http_GET()
+    # Yields:
+    #   (json_payload, headers, status) tuple for each uri, in the order of uris
+    ###############################################################################################
+    def http_GET_many_iter(self, uris, rq_headers, auth_on_off, max_workers = None, read_body = True) :
+        if (rq_headers == None):
+            rq_headers = self.request_headers()
+        if max_workers == None:
+            max_workers = self.max_workers
+
+        if ThreadPoolExecutor == None or max_workers <= 1:
+            for uri in uris:
+                yield self.http_GET(uri, rq_headers, auth_on_off, read_body)
+            return
+
+        uris = iter(uris)
+        executor = ThreadPoolExecutor(max_workers = max_workers)
+        pending = deque()
+        try:
+            # each request gets its own copy of the headers: the authorization is set on them by the
+            # worker thread (and changed when the session is renewed) while other workers send theirs
+            for uri in itertools.islice(uris, 2 * max_workers):
+                pending.append(executor.submit(self.http_GET, uri, dict(rq_headers), auth_on_off, read_body))
+            while pending:
+                future = pending.popleft()
+                for uri in itertools.islice(uris, 1):
+                    pending.append(executor.submit(self.http_GET, uri, dict(rq_headers), auth_on_off, read_body))
+                yield future.result()
+        finally:
+            # consumer stopped early, drop the requests not yet started
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait = False)
+    #
+    ## end http_GET_many_iter
+
+    ###############################################################################################
+    # Name: http_GET_many(uris, rq_headers, auth_on_off, max_workers = None, read_body = True)
+    #   Issue GET requests for a batch of resource uris concurrently thru http_GET_many_iter()
+    # Returns:
+    #   list of (json_payload, headers, status) tuples in the order of uris
+    ###############################################################################################
+    def http_GET_many(self, uris, rq_headers, auth_on_off, max_workers = None, read_body = True) :
+        return list(self.http_GET_many_iter(uris, rq_headers, auth_on_off, max_workers, read_body))
+    #
+    ## end http_GET_many
+
+    ###############################################################################################
+    # Name: http_GET_stored_iter(uris, rq_headers, auth_on_off, read_body = True)
+    #   Same as http_GET_many_iter() for the read-only assertions: the responses of the resources
+    #   GET by the discovery of the relative uris are taken from the resource store of this run,
+    #   only the uris not stored (or changed by a request since) are GET from the service. The
+    #   store holds responses to the default request headers with authorization 'on', requests
+    #   with other headers or authorization all go to the service
+    # Yields:
+    #   (json_payload, headers, status) tuple for each uri, in the order of uris
+    ###############################################################################################
+    def http_GET_stored_iter(self, uris, rq_headers, auth_on_off, read_body = True) :
+        if (rq_headers == None):
+            rq_headers = self.request_headers()
+        headers = dict([(key, value) for key, value in rq_headers.items() if key not in ('Authorization', 'X-Auth-Token')])
+        if auth_on_off != 'on' or headers != self.request_headers():
+            for response in self.http_GET_many_iter(uris, rq_headers, auth_on_off, read_body = read_body):
+                yield response
+            return
+
+        uris = list(uris)
+        missing = self.resource_store.missing(uris)
+        responses = self.http_GET_many_iter(missing, rq_headers, auth_on_off, read_body = read_body)
+        missing = set(missing)
+        for uri in uris:
+            if uri in missing:
+                yield next(responses)
+                continue
+            response = self.resource_store.get(uri, read_body)
+            # changed by a request since the uris were checked
+            if response == None:
+                response = self.http_GET(uri, rq_headers, auth_on_off, read_body)
+            yield response
+    #
+    ## end http_GET_stored_iter
+
+    ###############################################################################################
+    # Name: invalidate_resource(resource_uri)
+    #   Drops the responses a POST, PATCH, PUT or DELETE to resource uri may change from the 
+    #   resource store and the GET cache, see rf_store.changed_uris()
+    ###############################################################################################
+    def invalidate_resource(self, resource_uri) :
+        self.resource_store.invalidate(resource_uri)
+        if self.get_cache:
+            self.get_cache.invalidate(resource_uri)
+
     ###############################################################################################
     # Name: http__POST(resource_uri, rq_headers, rq_body, auth_on_off)                                              
     #   Issue a POST request for resource uri thru base HTTP__POST() in rf_utility by passing SUT
@@ -151,8 +548,9 @@ class SUT():
     def http_POST(self, resource_uri, rq_headers, rq_body, auth_on_off) :
         if (rq_headers == None):
             rq_headers = self.request_headers()
+        self.invalidate_resource(resource_uri)
 
-        return(rf_utility.http__POST(self.SUT_prop, resource_uri, rq_headers, rq_body, auth_on_off))
+        return(rf_utility.http__POST(self.SUT_prop, resource_uri, rq_headers, rq_body, auth_on_off, self.conn_pool))
     #
     ## end http_POST
 
@@ -170,7 +568,7 @@ class SUT():
     def http_TRACE(self, resource_uri, rq_headers, rq_body, auth_on_off) :
         if (rq_headers == None):
             rq_headers = self.request_headers()
-        return(rf_utility.http__TRACE(self.SUT_prop, resource_uri, rq_headers, rq_body, auth_on_off, self.cookie_info ))
+        return(rf_utility.http__TRACE(self.SUT_prop, resource_uri, rq_headers, rq_body, auth_on_off, self.cookie_info, self.conn_pool))
     #
     ## end http_TRACE
 
@@ -188,7 +586,7 @@ class SUT():
     def http_OPTIONS(self, resource_uri, rq_headers, rq_body, auth_on_off) :
         if (rq_headers == None):
             rq_headers = self.request_headers()
-        return(rf_utility.http__OPTIONS(self.SUT_prop, resource_uri, rq_headers, rq_body, auth_on_off, self.cookie_info ))
+        return(rf_utility.http__OPTIONS(self.SUT_prop, resource_uri, rq_headers, rq_body, auth_on_off, self.cookie_info, self.conn_pool))
     #
     ## end http_OPTIONS
 
@@ -206,7 +604,8 @@ class SUT():
     def http_PATCH(self, resource_uri, rq_headers, rq_body, auth_on_off) :
         if (rq_headers == None):
             rq_headers = self.request_headers()
-        return(rf_utility.http__PATCH(self.SUT_prop, resource_uri, rq_headers, rq_body, auth_on_off))
+        self.invalidate_resource(resource_uri)
+        return(rf_utility.http__PATCH(self.SUT_prop, resource_uri, rq_headers, rq_body, auth_on_off, self.conn_pool))
     #
     ## end http_PATCH
 
@@ -224,7 +623,8 @@ class SUT():
     def http_PUT(self, resource_uri, rq_headers, rq_body, auth_on_off) :
         if (rq_headers == None):
             rq_headers = self.request_headers()
-        return(rf_utility.http__PUT(self.SUT_prop, resource_uri, rq_headers, rq_body, auth_on_off))
+        self.invalidate_resource(resource_uri)
+        return(rf_utility.http__PUT(self.SUT_prop, resource_uri, rq_headers, rq_body, auth_on_off, self.conn_pool))
     #
     ## end http_PUT
 
@@ -242,7 +642,7 @@ class SUT():
     def http_HEAD(self, resource_uri, rq_headers, auth_on_off) :
         if (rq_headers == None):
             rq_headers = self.request_headers()
-        return(rf_utility.http__HEAD(self.SUT_prop, resource_uri, rq_headers, auth_on_off, self.cookie_info))
+        return(rf_utility.http__HEAD(self.SUT_prop, resource_uri, rq_headers, auth_on_off, self.cookie_info, self.conn_pool))
     #
     ## end http_HEAD
 
@@ -260,10 +660,312 @@ class SUT():
     def http_DELETE(self, resource_uri, rq_headers, auth_on_off) :
         if (rq_headers == None):
             rq_headers = self.request_headers()
-        return(rf_utility.http__DELETE(self.SUT_prop, resource_uri, rq_headers, auth_on_off))
+        self.invalidate_resource(resource_uri)
+        return(rf_utility.http__DELETE(self.SUT_prop, resource_uri, rq_headers, auth_on_off, self.conn_pool))
     #
     ## end http_DELETE 
 
+    ###############################################################################################
+    # Name: http_GET_async(), http_HEAD_async(), http_OPTIONS_async(), http_TRACE_async(),
+    #       http_POST_async(), http_PATCH_async(), http_PUT_async(), http_DELETE_async()
+    #   Async variants of the http_XXX() requests thru the asyncio transport in rf_async (python 3.5+).
+    #   They take the same arguments as the http_XXX() requests and return awaitables of the same
+    #   (json_payload, headers, status) result; requests in flight are limited to 
+    #   MaxConcurrentRequests of the SUT. Usage: payload, headers, status = await sut.http_GET_async(...)
+    ###############################################################################################
+    def http_GET_async(self, resource_uri, rq_headers, auth_on_off) :
+        return rf_async.http__GET_async(self.SUT_prop, resource_uri, rq_headers, auth_on_off, self.cookie_info, self.async_pool)
+
+    def http_HEAD_async(self, resource_uri, rq_headers, auth_on_off) :
+        return rf_async.http__HEAD_async(self.SUT_prop, resource_uri, rq_headers, auth_on_off, self.cookie_info, self.async_pool)
+
+    def http_OPTIONS_async(self, resource_uri, rq_headers, rq_body, auth_on_off) :
+        return rf_async.http__OPTIONS_async(self.SUT_prop, resource_uri, rq_headers, rq_body, auth_on_off, self.cookie_info, self.async_pool)
+
+    def http_TRACE_async(self, resource_uri, rq_headers, rq_body, auth_on_off) :
+        return rf_async.http__TRACE_async(self.SUT_prop, resource_uri, rq_headers, rq_body, auth_on_off, self.cookie_info, self.async_pool)
+
+    def http_POST_async(self, resource_uri, rq_headers, rq_body, auth_on_off) :
+        self.invalidate_resource(resource_uri)
+        return rf_async.http__POST_async(self.SUT_prop, resource_uri, rq_headers, rq_body, auth_on_off, self.async_pool)
+
+    def http_PATCH_async(self, resource_uri, rq_headers, rq_body, auth_on_off) :
+        self.invalidate_resource(resource_uri)
+        return rf_async.http__PATCH_async(self.SUT_prop, resource_uri, rq_headers, rq_body, auth_on_off, self.async_pool)
+
+    def http_PUT_async(self, resource_uri, rq_headers, rq_body, auth_on_off) :
+        self.invalidate_resource(resource_uri)
+        return rf_async.http__PUT_async(self.SUT_prop, resource_uri, rq_headers, rq_body, auth_on_off, self.async_pool)
+
+    def http_DELETE_async(self, resource_uri, rq_headers, auth_on_off) :
+        self.invalidate_resource(resource_uri)
+        return rf_async.http__DELETE_async(self.SUT_prop, resource_uri, rq_headers, auth_on_off, self.async_pool)
+    #
+    ## end http_XXX_async
+
+    ###############################################################################################
+    # Name: request_notes(requests_of = 'this assertion')
+    #   Returns a note on the requests retried since the previous call (None if there are none),
+    #   logged with the status of each assertion thru logger.Log.request_notes
+    ###############################################################################################
+    def request_notes(self, requests_of = 'this assertion'):
+        retries = self.conn_pool.retry_count()
+        notes = None
+        if retries > self.retries_noted:
+            notes = '~ note: %s request(s) of %s were retried after failed requests or 503 responses' % (retries - self.retries_noted, requests_of)
+        self.retries_noted = retries
+        return notes
+
+    ###############################################################################################
+    # Name: start_run()
+    #   Starts the RunDeadline (properties.json "Timeouts") of the assertions of this SUT
+    ###############################################################################################
+    def start_run(self):
+        run_deadline = rf_utility.timeout_settings['RunDeadline']
+        self.run_deadline = time.time() + run_deadline if run_deadline else None
+
+    ###############################################################################################
+    # Name: set_deadline(deadline)
+    #   Sets the wall clock time (or None) the requests to this SUT have to be issued by, the 
+    #   requests raise rf_utility.DeadlineExceeded after it
+    ###############################################################################################
+    def set_deadline(self, deadline):
+        self.conn_pool.deadline = deadline
+        if self.async_pool:
+            self.async_pool.deadline = deadline
+
+    ###############################################################################################
+    # Name: without_deadline(request, *args)
+    #   Issues a request (e.g. self.http_DELETE) without the deadline of the assertion, for the
+    #   requests which clean up after the assertion (delete the session or account it created):
+    #   they are issued even if the deadline expired
+    # Returns:
+    #   the result of the request
+    ###############################################################################################
+    def without_deadline(self, request, *args):
+        deadline = self.conn_pool.deadline
+        self.set_deadline(None)
+        try:
+            return request(*args)
+        finally:
+            self.set_deadline(deadline)
+
+    ###############################################################################################
+    # Name: run_assertion(assertion, log, cleanup = False)
+    #   Runs the assertion function with the AssertionDeadline (properties.json "Timeouts"), limited
+    #   by the run deadline. If the deadline expires during a request of the assertion, the rest of
+    #   the assertion is skipped and it is logged as log.TIMEOUT; once the run deadline has expired
+    #   the remaining assertions are logged as log.TIMEOUT without being run. An assertion which
+    #   deletes what an earlier assertion created (cleanup True) is always run, without deadline
+    # Returns:
+    #   status of the assertion
+    ###############################################################################################
+    def run_assertion(self, assertion, log, cleanup = False):
+        now = time.time()
+        assertion_id_ = assertion_id(assertion)
+        if cleanup:
+            self.set_deadline(None)
+            self.set_assertion_id(assertion_id_)
+            try:
+                return assertion(self, log)
+            finally:
+                self.set_assertion_id(None)
+        if self.run_deadline != None and now >= self.run_deadline:
+            log.AssertionID = assertion_id_
+            log.assertion_log('BEGIN_ASSERTION', None)
+            log.assertion_log('line', '~ run deadline of %s seconds expired, assertion skipped' % rf_utility.timeout_settings['RunDeadline'])
+            log.assertion_log(log.TIMEOUT, None)
+            return log.TIMEOUT
+
+        deadline = self.run_deadline
+        assertion_deadline = rf_utility.timeout_settings['AssertionDeadline']
+        if assertion_deadline and (deadline == None or now + assertion_deadline < deadline):
+            deadline = now + assertion_deadline
+        self.set_deadline(deadline)
+        self.set_assertion_id(assertion_id_)
+        try:
+            return assertion(self, log)
+        except rf_utility.DeadlineExceeded as e:
+            log.assertion_log('line', '~ %s after %.0f seconds, rest of the assertion skipped' % (e, time.time() - now))
+            log.assertion_log(log.TIMEOUT, None)
+            return log.TIMEOUT
+        finally:
+            self.set_deadline(None)
+            self.set_assertion_id(None)
+
+    ###############################################################################################
+    # Name: visit_resources(assertions, log)
+    #   Runs the assertions which check each resource of relative_uris in one pass over the
+    #   resources: the response of each resource is taken from the resource store (or GET) once,
+    #   see http_GET_stored_iter(), and passed to every assertion function:
+    #   assertion(self, log, uri, json_payload, headers, status) checks the resource and returns
+    #   the status of the assertion for it; the payload is shared, the functions must not change
+    #   it. assertions is a list of (assertion function, members), members False for the
+    #   assertions of relative_uris_no_members. Each assertion logs to its own AssertionLog and is
+    #   logged with its status at the end of the pass (also if the pass raises), in the order of
+    #   assertions, as if it had been run alone. An assertion which raises for a resource is
+    #   logged as log.FAIL with the exception, the pass goes on with the other assertions and
+    #   resources. The requests retried during the pass are noted once, after the assertions.
+    #   The pass has the AssertionDeadline of every assertion (AssertionDeadline times the number
+    #   of assertions), limited by the run deadline; if it expires the assertions are logged as
+    #   log.TIMEOUT
+    # Returns:
+    #   list of the status of each assertion
+    ###############################################################################################
+    def visit_resources(self, assertions, log):
+        now = time.time()
+        visitors = [(assertion, members, AssertionLog(log, assertion_id(assertion))) for assertion, members in assertions]
+        if self.run_deadline != None and now >= self.run_deadline:
+            for assertion, members, assertion_log in visitors:
+                assertion_log.assertion_log('line', '~ run deadline of %s seconds expired, assertion skipped' % rf_utility.timeout_settings['RunDeadline'])
+                assertion_log.status = log.TIMEOUT
+            return self.flush_visitors(visitors, log)
+
+        deadline = self.run_deadline
+        assertion_deadline = rf_utility.timeout_settings['AssertionDeadline']
+        if assertion_deadline and (deadline == None or now + assertion_deadline * len(visitors) < deadline):
+            deadline = now + assertion_deadline * len(visitors)
+        self.set_deadline(deadline)
+        # the GETs of the pass are shared by the assertions
+        pass_id = '+'.join([assertion_log.AssertionID for assertion, members, assertion_log in visitors])
+        no_members = None
+        if not all([members for assertion, members, assertion_log in visitors]):
+            no_members = set(self.relative_uris_no_members.keys())
+        completed = False
+        try:
+            relative_uris = self.relative_uris.items()
+            responses = self.http_GET_stored_iter([uri for relative_uri, uri in relative_uris], self.request_headers(), 'on')
+            for relative_uri, uri in relative_uris:
+                self.set_assertion_id(pass_id)
+                json_payload, headers, status = next(responses)
+                for assertion, members, assertion_log in visitors:
+                    if members or relative_uri in no_members:
+                        self.set_assertion_id(assertion_log.AssertionID)
+                        try:
+                            assertion_status = assertion(self, assertion_log, uri, json_payload, headers, status)
+                        except rf_utility.DeadlineExceeded:
+                            raise
+                        except Exception as e:
+                            assertion_log.assertion_log('line', '~ assertion raised %s: %s for resource %s' % (type(e).__name__, e, uri))
+                            assertion_status = log.FAIL
+                        assertion_log.status = log.status_fixup(assertion_log.status, assertion_status)
+            completed = True
+        except rf_utility.DeadlineExceeded as e:
+            completed = True
+            for assertion, members, assertion_log in visitors:
+                assertion_log.assertion_log('line', '~ %s after %.0f seconds, rest of the assertion skipped' % (e, time.time() - now))
+                assertion_log.status = log.TIMEOUT
+        finally:
+            self.set_deadline(None)
+            self.set_assertion_id(None)
+            if not completed:
+                for assertion, members, assertion_log in visitors:
+                    assertion_log.assertion_log('line', '~ pass over the resources ended by an error, rest of the assertion skipped')
+                    assertion_log.status = log.FAIL
+            statuses = self.flush_visitors(visitors, log)
+        return statuses
+
+    ###############################################################################################
+    # Name: flush_visitors(visitors, log)
+    #   Logs the assertions of a visit_resources() pass, then the requests retried during the pass
+    #   once for all of them instead of with the first assertion logged
+    # Returns:
+    #   list of the status of each assertion
+    ###############################################################################################
+    def flush_visitors(self, visitors, log):
+        request_notes = self.request_notes('the pass over the resources of assertions %s' % \
+            ', '.join([assertion_log.AssertionID for assertion, members, assertion_log in visitors]))
+        log_request_notes = log.request_notes
+        log.request_notes = None
+        try:
+            statuses = [assertion_log.flush() for assertion, members, assertion_log in visitors]
+        finally:
+            log.request_notes = log_request_notes
+        if request_notes:
+            log.assertion_log('TX_COMMENT', request_notes)
+        return statuses
+
+    ###############################################################################################
+    # Name: set_assertion_id(assertion_id)
+    #   Sets the id of the assertion (or None) the requests to this SUT are issued for
+    ###############################################################################################
+    def set_assertion_id(self, assertion_id):
+        self.conn_pool.assertion_id = assertion_id
+        if self.async_pool:
+            self.async_pool.assertion_id = assertion_id
+
+    ###############################################################################################
+    # Name: start_recording(file_path)
+    #   Records all further requests to this SUT and their responses to the gzip compressed JSON
+    #   lines file_path, see rf_utility.TrafficRecorder. The file is closed by close()
+    ###############################################################################################
+    def start_recording(self, file_path):
+        self.recorder = rf_utility.TrafficRecorder(file_path, self.SUT_prop)
+        self.conn_pool.recorder = self.recorder
+        if self.async_pool:
+            self.async_pool.recorder = self.recorder
+
+    ###############################################################################################
+    # Name: set_crawl_cache_folder(folder)
+    #   Enables the incremental recrawl: collect_relative_uris() revalidates the resources saved in
+    #   the crawl cache file of this service in folder and saves the resources found to it, see
+    #   rf_store.CrawlCache
+    ###############################################################################################
+    def set_crawl_cache_folder(self, folder):
+        self.crawl_cache_folder = folder
+
+    ###############################################################################################
+    # Name: open_snapshot(folder)
+    #   Opens the snapshot file of this service (see rf_store.snapshot_path()) in folder and adds
+    #   a snapshot of this run to it: the resource store writes the resources it stores to the
+    #   file and reads the cold ones back from it
+    ###############################################################################################
+    def open_snapshot(self, folder):
+        self.snapshot = rf_store.SnapshotFile(rf_store.snapshot_path(folder, self.SUT_prop['DnsName']), self.SUT_prop)
+        self.resource_store.open_snapshot(self.snapshot)
+
+    ###############################################################################################
+    # Name: write_request_metrics(log_folder)
+    #   Writes the timing summary of the requests to this SUT (see rf_utility.RequestMetrics) to 
+    #   <date-time>_request_metrics.json in the log_folder
+    # Returns:
+    #   path of the summary file
+    ###############################################################################################
+    def write_request_metrics(self, log_folder):
+        dstr = str(datetime.now().strftime("%Y%m%d-%H%M%S"))
+        metrics_path = os.path.join(log_folder, dstr + '_request_metrics.json')
+        self.conn_pool.metrics.write_summary(metrics_path)
+        return metrics_path
+
+    ###############################################################################################
+    # Name: write_sampled_members(log_folder)
+    #   Writes the members sampled from the collections of this SUT (see CollectionSampler) to 
+    #   <date-time>_sampled_members.json in the log_folder
+    # Returns:
+    #   path of the file
+    ###############################################################################################
+    def write_sampled_members(self, log_folder):
+        dstr = str(datetime.now().strftime("%Y%m%d-%H%M%S"))
+        sampled_path = os.path.join(log_folder, dstr + '_sampled_members.json')
+        self.sampler.write_summary(sampled_path)
+        return sampled_path
+
+    ###############################################################################################
+    # Name: close()
+    #   Deletes the session of the tool, releases the http connections held for this SUT and closes
+    #   the traffic capture. Call once all requests to the SUT are done
+    ###############################################################################################
+    def close(self):
+        if self.session_auth:
+            self.session_auth.logout()
+        self.conn_pool.close_all()
+        if self.async_pool:
+            self.async_pool.close_all()
+        if self.recorder:
+            self.recorder.close()
+        if self.snapshot:
+            self.snapshot.close()
+
     ###############################################################################################
     # Name: set_redfish_defined_uris(service_root)                                          
     #   Takes sut's service root uri and sets the Redfish defined uris in SUT by concatenating them
@@ -271,6 +973,8 @@ class SUT():
     ###############################################################################################
     def set_redfish_defined_uris(self, service_root):
         self.Redfish_URIs['Service_Root'] = service_root
+        if self.session_auth:
+            self.session_auth.service_root = service_root
         self.Redfish_URIs['Service_Odata_Doc'] = service_root + 'odata'
         self.Redfish_URIs['Service_Metadata_Doc'] = service_root + '$metadata'
 
@@ -463,74 +1167,145 @@ class SUT():
 
     ###############################################################################################
     # Name: collect_relative_resources(service_root)
-    #   Takes service root uri and  triggers the recursive function process_uri starting with 
-    #   the service root to retrieve all the @odata.ids from the json_payload of each resource
+    #   Takes service root uri and  triggers process_uri starting with the service root to
+    #   retrieve all the @odata.ids from the json_payload of each resource. The GET cache of the
+    #   assertions, if enabled, starts with the resources found
     ###############################################################################################
     def collect_relative_uris(self, service_root):
         #start with rest/v1/
-        self.relative_uris['Root Service'] = service_root
-        self.relative_uris_no_members['Root Service'] = service_root
+        self.resource_graph.add_link(None, service_root, 'Root Service')
+        if self.crawl_cache_folder:
+            self.open_crawl_cache(service_root)
         self.process_uri(service_root, 'Root Service')
+        if self.crawl_cache:
+            self.crawl_cache.save(self.relative_uris, self.resource_store)
+        if rf_utility.cache_settings['CacheGET'] == 'yes':
+            self.get_cache = rf_store.ResponseCache(self.resource_store)
+
+    ###############################################################################################
+    # Name: open_crawl_cache(service_root)
+    #   GETs the service root for the UUID of the service and opens the crawl cache file of the
+    #   DnsName and UUID in the crawl cache folder. Without a UUID in the service root the service
+    #   cannot be told apart from another service at the same DnsName, it is crawled without cache
+    ###############################################################################################
+    def open_crawl_cache(self, service_root):
+        json_payload, headers, status = self.http_GET(service_root, self.request_headers(), 'on')
+        if status != rf_utility.HTTP_OK or not isinstance(json_payload, dict) or not json_payload.get('UUID'):
+            print('Note: no UUID found in the service root %s, the resources are crawled without the crawl cache' % service_root)
+            return
+        self.crawl_cache = rf_store.CrawlCache(rf_store.crawl_cache_path(self.crawl_cache_folder, self.SUT_prop['DnsName'], json_payload['UUID']), \
+            self.SUT_prop, json_payload['UUID'])
 
     ###############################################################################################
     # Name: process_uri(url, nested_key = None)
     #   Takes a resource uri and an optional nested key for resource record in relative_uris based 
     #   on resource name/level. It performs a GET on it, each key of the json_payload is either mapped
     #   to a dict or list if it contains '@odata.id', it retrieves the '@odata.id' by processing 
-    #   the dictionary or list recursively
+    #   the dictionary or list and processes each resource found the same way, depth first.
+    #   The resources are traversed iteratively with a stack of the resources being processed (no
+    #   recursion limit on deep trees), in the same order as the recursive traversal so the 
+    #   relative_uris found are the same in the same order. The GETs of the links found on a
+    #   resource are issued ahead by up to MaxConcurrentRequests worker threads, see UriPrefetcher
     ###############################################################################################
     def process_uri(self, url, nested_key = None):
-        rq_headers = self.request_headers()      
-        json_payload, headers, status = self.http_GET(url, rq_headers, 'on')
+        prefetcher = UriPrefetcher(self.crawl_GET, self.max_workers, lambda uri: uri in self.resource_graph)
+        try:
+            # links of the resources being processed, innermost resource last
+            frames = [self.process_resource_links(url, nested_key, prefetcher)]
+            while frames:
+                try:
+                    url_, nested_key_ = next(frames[-1])
+                except StopIteration:
+                    frames.pop()
+                    continue
+                frames.append(self.process_resource_links(url_, nested_key_, prefetcher))
+        finally:
+            prefetcher.close()
+
+    ###############################################################################################
+    # Name: crawl_GET(url)
+    #   GET of a resource for process_uri(); a resource saved in the crawl cache is GET with the 
+    #   conditional request headers and taken from the cache if the service answers 304
+    ###############################################################################################
+    def crawl_GET(self, url):
+        if self.crawl_cache == None:
+            return self.http_GET(url, self.request_headers(), 'on')
+        rq_headers = self.request_headers()
+        rq_headers.update(self.crawl_cache.conditional_headers(url))
+        return self.crawl_cache.revalidate(url, self.http_GET(url, rq_headers, 'on'))
+
+    ###############################################################################################
+    # Name: process_resource_links(url, nested_key, prefetcher)
+    #   Takes a resource uri, its nested key and the UriPrefetcher of process_uri(); GETs the 
+    #   resource, keeps the response in the resource store and records each link found on it which
+    #   has not been traversed yet in relative_uris. The members of all pages of a collection are
+    #   traversed, only the members sampled from a big collection, see collection_members(). The 
+    #   resource and its links are added to the resource graph
+    #   Yields:
+    #     url and nested key of each new link, the caller processes its resource before the 
+    #     next link is checked
+    ###############################################################################################
+    def process_resource_links(self, url, nested_key, prefetcher):
+        json_payload, headers, status = prefetcher.get(url)
         if not (headers and status):
             return
-        elif (status != rf_utility.HTTP_OK) :
+        self.resource_store.put(url, json_payload, headers, status)
+        self.resource_graph.set_resource(url, json_payload, headers)
+        if (status != rf_utility.HTTP_OK) :
             ('line', "~ GET %s : FAIL (HTTP status %s)" % (url, status))
         elif json_payload:
-            for key in json_payload:
-                if 'Oem' in key or 'JsonSchemas' in key: #pass all oems for now or add them to another list
-                    continue
+            if isinstance(json_payload, dict) and isinstance(json_payload.get('Members'), list):
+                # the links are taken from a copy with the members of all pages (only the members
+                # sampled from a big collection), the stored payload is kept as returned
+                members = list(self.collection_members(url, json_payload))
+                json_payload = dict(json_payload)
+                json_payload['Members'] = members
+                self.resource_graph.set_members(url, [member['@odata.id'] for member in members if isinstance(member, dict) and '@odata.id' in member])
+            # issue the GETs of the links not traversed yet ahead
+            links = list()
+            for key, urls in self.payload_links(json_payload, nested_key):
+                links.extend([url_ for url_, nested_key_ in urls if url_ not in self.resource_graph])
+            prefetcher.add(links)
+
+            for key, urls in self.payload_links(json_payload, nested_key):
                 if isinstance(json_payload[key], dict):
-                    if nested_key:
-                        nested_key_ = nested_key + '_' + key
-                    else:
-                        nested_key_ = key
-                    result = self.process_dict(json_payload[key], nested_key_)
-                    for url_, nested_key_ in result:
-                        skip = False
+                    for url_, nested_key_ in urls:
                         # make sure urls not already been traversed, if so skip it
-                        for relative_uri in self.relative_uris.values():
-                            if url_ == relative_uri:
-                                skip = True
-                                break
-                        if not skip:
-                            self.relative_uris[nested_key_] = url_
-                            self.relative_uris_no_members[nested_key_] = url_
+                        if url_ not in self.resource_graph:
+                            self.resource_graph.add_link(url, url_, nested_key_)
                             print('%s :%s' % (nested_key_, url_))
-                            self.process_uri(url_, nested_key_)
-
+                            yield url_, nested_key_
 
-                elif isinstance(json_payload[key], list):
-                    if nested_key:
-                        nested_key_ = nested_key + '_' + key
-                    else:
-                        nested_key_ = key
-                    url = self.process_list(json_payload[key], nested_key_)
+                else:
                     count = 0
-                    for url_, nested_key_ in url:
-                        skip = False
+                    for url_, nested_key_ in urls:
                         # make sure urls not already been traversed, if so skip it
-                        for relative_uri in self.relative_uris.values():
-                            if url_ == relative_uri:
-                                skip = True
-                                break
-                        if not skip:
+                        if url_ not in self.resource_graph:
                             count+=1
                             nested_key__ = nested_key_ + '_' + str(count)                       
-                            self.relative_uris[nested_key__] = url_
+                            self.resource_graph.add_link(url, url_, nested_key__, in_list = True)
                             print('%s :%s' % (nested_key__, url_))
-                            self.process_uri(url_, nested_key__)      
-                               
+                            yield url_, nested_key__
+
+    ###############################################################################################
+    # Name: payload_links(json_payload, nested_key)
+    #   Takes the json_payload of a resource and its nested key 
+    #   Yields:
+    #     each key of the json_payload mapped to a dict or list (except Oem and JsonSchemas) with
+    #     the (url, nested key) generator of the links in it, see process_dict() and process_list()
+    ###############################################################################################
+    def payload_links(self, json_payload, nested_key):
+        for key in json_payload:
+            if 'Oem' in key or 'JsonSchemas' in key: #pass all oems for now or add them to another list
+                continue
+            if nested_key:
+                nested_key_ = nested_key + '_' + key
+            else:
+                nested_key_ = key
+            if isinstance(json_payload[key], dict):
+                yield key, self.process_dict(json_payload[key], nested_key_)
+            elif isinstance(json_payload[key], list):
+                yield key, self.process_list(json_payload[key], nested_key_)
 
     ###############################################################################################
     # Name: process_dict(json_payload, nested_key)
@@ -594,7 +1369,9 @@ class SUT():
     ###############################################################################################
     # Name: get_resource_members(uri = None, rq_headers = None, json_payload = None)                                                 
     #   Takes a resource uri or json_payload, optionally request header to find 'Members' in 
-    #   json_payload and perform a GET on each memebr resource using id.
+    #   json_payload and perform a GET on each memebr resource using id. The next pages of the
+    #   members are GET as the members are consumed and only the members sampled from a big 
+    #   collection are returned, see collection_members()
     #   Yield:
     #     json_payload, headers on member resource                
     ###############################################################################################
@@ -612,8 +1389,8 @@ class SUT():
             elif json_payload:
                 #property name = 'Members' as mapped out by Redfish 1.01  
                 if 'Members' in json_payload:
-                    # iterate 
-                    for member in json_payload['Members']:
+                    # iterate over the members of all pages, only the members sampled from a big collection
+                    for member in self.collection_members(uri, json_payload, rq_headers, authorization):
                         mem_payload, headers, status = self.http_GET(member['@odata.id'], rq_headers, authorization)
                         if not (mem_payload and headers and status):
                             continue
@@ -624,6 +1401,99 @@ class SUT():
                             yield mem_payload, headers
 
 
+    ###############################################################################################
+    # Name: find_session_collection()
+    #   Looks up the Sessions collection in the resource graph (the resource of type 
+    #   SessionCollection). Resources without @odata.type are looked up by their key in relative_uris
+    # Returns:
+    #   uri of the Sessions collection, None if it was not found
+    ###############################################################################################
+    def find_session_collection(self):
+        session_uris = self.resource_graph.by_type('SessionCollection')
+        if session_uris:
+            return session_uris[0]
+        session_uri = None
+        for rel_uris in self.relative_uris:
+            if rel_uris.endswith('Sessions'):
+                session_uri = self.relative_uris[rel_uris]
+        return session_uri
+
+    ###############################################################################################
+    # Name: collection_members(uri, json_payload, rq_headers = None, auth_on_off = 'on')
+    #   Takes the uri of a collection and its json_payload (the first page of its members)
+    # Yields:
+    #   the 'Members' of all pages of the collection (see collection_pages()) sampled by the 
+    #   CollectionSampler
+    ###############################################################################################
+    def collection_members(self, uri, json_payload, rq_headers = None, auth_on_off = 'on'):
+        total = json_payload.get('Members@odata.count')
+        if not isinstance(total, int) or isinstance(total, bool):
+            total = None
+        members = (member for page in self.collection_pages(uri, json_payload, rq_headers, auth_on_off) for member in page.get('Members', list()))
+        return self.sampler.sample(uri, members, total)
+
+    ###############################################################################################
+    # Name: collection_pages(uri, json_payload, rq_headers = None, auth_on_off = 'on')
+    #   Takes the uri of a collection and its json_payload, the first page of its members. The next
+    #   page (Members@odata.nextLink) is GET on a worker thread while the members of a page are 
+    #   consumed, so the pages are only GET as far as the caller iterates. A page which cannot be 
+    #   retrieved ends the pages with a message. The pages are counted in self.paging
+    # Yields:
+    #   json_payload of each page of the collection, starting with json_payload
+    ###############################################################################################
+    def collection_pages(self, uri, json_payload, rq_headers = None, auth_on_off = 'on'):
+        if rq_headers == None:
+            rq_headers = self.request_headers()
+        pages = set([uri])
+        page = json_payload
+        executor = None
+        next_page = None
+        try:
+            while True:
+                next_link = page.get('Members@odata.nextLink')
+                if next_link in pages:
+                    print('~ Members@odata.nextLink %s of collection %s was already read, the rest of the pages are skipped' % (next_link, uri))
+                    next_link = None
+                if next_link:
+                    if len(pages) == 1:
+                        self.paging.add_collection()
+                    pages.add(next_link)
+                    # GET the next page while the members of this page are consumed
+                    if executor == None and ThreadPoolExecutor != None:
+                        executor = ThreadPoolExecutor(max_workers = 1)
+                    if executor != None:
+                        next_page = executor.submit(self.page_GET, next_link, dict(rq_headers), auth_on_off)
+                yield page
+                if not next_link:
+                    return
+                wait_start = time.time()
+                if next_page != None:
+                    json_payload_, headers, status = next_page.result()
+                    next_page = None
+                else:
+                    json_payload_, headers, status = self.page_GET(next_link, dict(rq_headers), auth_on_off)
+                self.paging.add_wait(time.time() - wait_start)
+                if status != rf_utility.HTTP_OK or not isinstance(json_payload_, dict):
+                    print('~ GET of page %s of collection %s failed (HTTP status %s), the rest of the pages are skipped' % (next_link, uri, status))
+                    return
+                page = json_payload_
+        finally:
+            # consumer stopped early, drop the next page
+            if next_page != None:
+                next_page.cancel()
+            if executor != None:
+                executor.shutdown(wait = False)
+
+    ###############################################################################################
+    # Name: page_GET(uri, rq_headers, auth_on_off)
+    #   GET of a next page for collection_pages(), timed in self.paging
+    ###############################################################################################
+    def page_GET(self, uri, rq_headers, auth_on_off):
+        start = time.time()
+        json_payload, headers, status = self.http_GET(uri, rq_headers, auth_on_off)
+        self.paging.add_page(time.time() - start, status != rf_utility.HTTP_OK)
+        return json_payload, headers, status
+
     #####################################################################################################
     # Name: response_status_check(resource_uri, response_status, log, expected_status = None, request_type = 'GET')
     #   Takes resource uri, response status, log instance and optionally an expected status and a 
@@ -17,7 +17,7 @@ if (sys.version_info < (3, 0)):
     Python3 = False
     from urlparse import urlparse
     from StringIO import StringIO
-    from httplib import HTTPSConnection, HTTPConnection, responses
+    from httplib import HTTPSConnection, HTTPConnection, HTTPException, BadStatusLine, responses
     import urllib2
     from urllib import URLopener
 
@@ -26,11 +26,17 @@ else:
     Python3 = True
     from urllib.parse import urlparse
     from io import StringIO, BytesIO
-    from http.client import HTTPSConnection, HTTPConnection, responses
+    from http.client import HTTPSConnection, HTTPConnection, HTTPException, BadStatusLine, responses
     import urllib.request
     from urllib.request import URLopener
 
 import ssl
+import socket
+import errno
+import threading
+import time
+import random
+import email.utils
 import json
 import argparse
 import base64
@@ -38,6 +44,7 @@ import warnings
 import shutil
 from datetime import datetime
 import gzip
+import zlib
 from xml.etree import ElementTree as ET
 import os
 import zipfile
@@ -75,23 +82,343 @@ HTTP_MOVEDPERMANENTLY = 301
 HTTP_MOVEDTEMPORARILY = 307
 HTTP_MEDIATYPENOTSUPPORTED = 415
 HTTP_NOTACCEPTABLE = 406
+HTTP_SERVICEUNAVAILABLE = 503
    
 default_odata_version = '4.0'
 
+# guards updates of the SUT cookie_info from concurrent requests
+cookie_info_lock = threading.Lock()
+
+# process wide ssl context shared by all https connections, see init_ssl_context()
+ssl_context = None
+ssl_context_lock = threading.Lock()
+# tls sessions of previous connections (host, port) : ssl.SSLSession, reused by new connections 
+# to the same host so that a reconnect skips the full tls handshake
+tls_sessions = dict()
+# tls handshake counters host : {'full' : n, 'resumed' : n}
+tls_session_stats = dict()
+tls_sessions_lock = threading.Lock()
+# tls session resumption requires python 3.6+ 
+TLSSessionResumption = hasattr(ssl, 'SSLSession')
+
+# properties.json MinimumTLSVersion values mapped to ssl.TLSVersion names and to the ssl options 
+# which disable older protocol versions (for python versions without ssl.TLSVersion)
+tls_versions = OrderedDict([\
+    ('tlsv1', ('TLSv1', [])),\
+    ('tlsv1.1', ('TLSv1_1', ['OP_NO_TLSv1'])),\
+    ('tlsv1.2', ('TLSv1_2', ['OP_NO_TLSv1', 'OP_NO_TLSv1_1'])),\
+    ('tlsv1.3', ('TLSv1_3', ['OP_NO_TLSv1', 'OP_NO_TLSv1_1', 'OP_NO_TLSv1_2']))\
+])
+
+# idempotent requests which are retried when they fail or the service answers 503
+retry_methods = ('GET', 'HEAD', 'OPTIONS')
+# retry settings, updated from properties.json by init_retry_settings()
+#   MaxRetries: retries of a request, BackoffBase/BackoffMax: seconds of the exponential backoff,
+#   RetryAfterMax: upper limit of the seconds waited for a Retry-After header of a 503 response
+retry_settings = {\
+    'MaxRetries' : 2,\
+    'BackoffBase' : 0.5,\
+    'BackoffMax' : 8,\
+    'RetryAfterMax' : 30\
+}
+
+# timeout settings in seconds (0: no timeout), updated from properties.json by init_timeout_settings()
+#   ConnectTimeout/ReadTimeout: socket timeouts of the tcp connect and of each socket read/write
+#   AssertionDeadline/RunDeadline: wall clock deadline of each assertion/of all assertions of a SUT
+timeout_settings = {\
+    'ConnectTimeout' : 30,\
+    'ReadTimeout' : 120,\
+    'AssertionDeadline' : 0,\
+    'RunDeadline' : 0\
+}
+
+# traffic capture settings, updated from properties.json by init_capture_settings()
+#   RecordTraffic: 'yes' to record all requests to a SUT and their responses, see TrafficRecorder
+capture_settings = {\
+    'RecordTraffic' : 'no'\
+}
+
+# resource discovery settings, updated from properties.json by init_discovery_settings()
+#   IncrementalRecrawl: 'yes' to save the resources found to a crawl cache per SUT and revalidate
+#       them with conditional GETs on the next run, see rf_store.CrawlCache
+discovery_settings = {\
+    'IncrementalRecrawl' : 'no'\
+}
+# collection sampling settings of the "Discovery" connection settings, see rf_sut.CollectionSampler
+#   MaxMembersPerCollection: members of a collection traversed/returned at most, 0 for all members;
+#       at least 2, the first and the last member are always kept
+#   SamplingSeed: seed of the members sampled, the same seed samples the same members
+sampling_settings = {\
+    'MaxMembersPerCollection' : 0,\
+    'SamplingSeed' : 0\
+}
+
+# run-scoped GET cache settings, updated from properties.json by init_cache_settings()
+#   CacheGET: 'yes' to serve the repeated GETs of the assertions from the responses of this run,
+#       see rf_store.ResponseCache
+#   SnapshotStore: 'yes' to write the resources stored by the discovery to a snapshot file per
+#       SUT and read the cold ones back from it, see rf_store.SnapshotFile
+cache_settings = {\
+    'CacheGET' : 'no',\
+    'SnapshotStore' : 'no'\
+}
+# resource store settings of the "Cache" connection settings, see rf_store.ResourceStore
+#   HotPayloads: resources stored last which are kept decoded, the others are kept compressed;
+#       0 keeps all resources decoded
+payload_settings = {\
+    'HotPayloads' : 1000\
+}
+# request headers (lower case) left out of the key of a cached GET response
+cache_auth_headers = ('authorization', 'x-auth-token')
+# request headers (lower case) of GETs which are not served from the cache
+cache_bypass_headers = ('if-none-match', 'if-match', 'if-modified-since', 'if-unmodified-since', 'if-range', 'range', 'accept-encoding')
+
+# request/response headers whose values are not written to a traffic capture
+capture_redacted_headers = ('authorization', 'x-auth-token', 'cookie', 'set-cookie')
+# request headers which select the recorded response of a request in a replay, see TrafficReplay
+replay_match_headers = ('accept', 'content-type', 'odata-version', 'if-match', 'if-none-match', 'if-modified-since')
+
+###############################################################################################
+# Class: DeadlineExceeded
+#   Raised by the requests of a SUT when the deadline of the current assertion or run has 
+#   expired, see SUT.run_assertion()
+###############################################################################################
+class DeadlineExceeded(Exception):
+    pass
+
+###############################################################################################
+# Name: init_ssl_context(tls_settings = None)                                               
+# Description:   
+#   Creates the ssl context shared by all https connections of this process. The context is 
+#   created only once, subsequent calls return the existing context.
+# Arguments:
+#   tls_settings: dict with TLS settings from properties.json
+#       VerifyCertificate: 'yes' to verify the service certificate, else verification is disabled
+#       CABundle: path of CA bundle file used for verification or 'none' for the system defaults
+#       MinimumTLSVersion: TLSv1, TLSv1.1, TLSv1.2, TLSv1.3 or 'none' for the ssl module default
+# Return:
+#   ssl context, None if this python version does not support ssl contexts
+###############################################################################################
+def init_ssl_context(tls_settings = None) :
+    global ssl_context
+
+    with ssl_context_lock:
+        if ssl_context is not None:
+            return ssl_context
+
+        # python prior to 2.7.9 does not support ssl contexts (or certificate verification) 
+        if not hasattr(ssl, 'create_default_context'):
+            return None
+
+        if tls_settings == None:
+            tls_settings = dict()
+
+        verify = str(tls_settings.get('VerifyCertificate', 'no')).lower() == 'yes'
+        ca_bundle = tls_settings.get('CABundle', 'none')
+        if not ca_bundle or ca_bundle.lower() == 'none':
+            ca_bundle = None
+        min_version = str(tls_settings.get('MinimumTLSVersion', 'none')).lower()
+
+        if verify:
+            context = ssl.create_default_context(cafile=ca_bundle)
+        else:
+            # SSL verification disabled for the test connections...
+            context = ssl._create_unverified_context()
+
+        if min_version in tls_versions:
+            version_name, no_version_options = tls_versions[min_version]
+            if hasattr(ssl, 'TLSVersion'):
+                context.minimum_version = getattr(ssl.TLSVersion, version_name)
+            else:
+                for option in no_version_options:
+                    context.options |= getattr(ssl, option, 0)
+        elif min_version != 'none':
+            print('Warning: MinimumTLSVersion %s in properties.json is not one of %s, using the ssl module default' % (min_version, ', '.join(tls_versions.keys())))
+
+        ssl_context = context
+        return ssl_context
+#
+## end init_ssl_context
+
+###############################################################################################
+# Name: update_settings(settings, settings_prop, section)
+# Description:   
+#   Updates the numeric settings dict from the settings_prop dict read from properties.json;
+#   missing or invalid values keep their default
+###############################################################################################
+def update_settings(settings, settings_prop, section) :
+    if settings_prop == None:
+        return
+    for key in settings.keys():
+        if key in settings_prop:
+            try:
+                settings[key] = max(0, float(settings_prop[key]))
+            except (TypeError, ValueError):
+                print('Warning: %s %s %s in properties.json is not a number, using %s' % (section, key, settings_prop[key], settings[key]))
+#
+## end update_settings
+
+###############################################################################################
+# Name: init_retry_settings(retry_settings_prop = None)
+# Description:   
+#   Updates the retry settings of the idempotent requests from the "Retry" connection settings
+#   in properties.json
+###############################################################################################
+def init_retry_settings(retry_settings_prop = None) :
+    update_settings(retry_settings, retry_settings_prop, 'Retry')
+    retry_settings['MaxRetries'] = int(retry_settings['MaxRetries'])
+#
+## end init_retry_settings
+
+###############################################################################################
+# Name: init_timeout_settings(timeout_settings_prop = None)
+# Description:   
+#   Updates the socket timeouts and the assertion/run deadlines from the "Timeouts" connection
+#   settings in properties.json
+###############################################################################################
+def init_timeout_settings(timeout_settings_prop = None) :
+    update_settings(timeout_settings, timeout_settings_prop, 'Timeouts')
+#
+## end init_timeout_settings
+
+###############################################################################################
+# Name: init_capture_settings(capture_settings_prop = None)
+# Description:   
+#   Updates the traffic capture settings from the "Capture" connection settings in properties.json
+###############################################################################################
+def init_capture_settings(capture_settings_prop = None) :
+    if capture_settings_prop == None:
+        return
+    record_traffic = str(capture_settings_prop.get('RecordTraffic', 'no')).lower()
+    if record_traffic not in ('yes', 'no'):
+        print('Warning: Capture RecordTraffic %s in properties.json is not yes or no, using %s' % (capture_settings_prop['RecordTraffic'], capture_settings['RecordTraffic']))
+        return
+    capture_settings['RecordTraffic'] = record_traffic
+#
+## end init_capture_settings
+
+###############################################################################################
+# Name: init_discovery_settings(discovery_settings_prop = None)
+# Description:   
+#   Updates the resource discovery settings from the "Discovery" connection settings in 
+#   properties.json
+###############################################################################################
+def init_discovery_settings(discovery_settings_prop = None) :
+    if discovery_settings_prop == None:
+        return
+    update_settings(sampling_settings, discovery_settings_prop, 'Discovery')
+    for key in sampling_settings:
+        sampling_settings[key] = int(sampling_settings[key])
+    if sampling_settings['MaxMembersPerCollection'] == 1:
+        print('Warning: Discovery MaxMembersPerCollection 1 in properties.json is less than 2 (the first and the last member), using 2')
+        sampling_settings['MaxMembersPerCollection'] = 2
+    incremental_recrawl = str(discovery_settings_prop.get('IncrementalRecrawl', 'no')).lower()
+    if incremental_recrawl not in ('yes', 'no'):
+        print('Warning: Discovery IncrementalRecrawl %s in properties.json is not yes or no, using %s' % (discovery_settings_prop['IncrementalRecrawl'], discovery_settings['IncrementalRecrawl']))
+    else:
+        discovery_settings['IncrementalRecrawl'] = incremental_recrawl
+#
+## end init_discovery_settings
+
+###############################################################################################
+# Name: init_cache_settings(cache_settings_prop = None)
+# Description:   
+#   Updates the run-scoped GET cache and the resource store settings from the "Cache" connection
+#   settings in properties.json
+###############################################################################################
+def init_cache_settings(cache_settings_prop = None) :
+    if cache_settings_prop == None:
+        return
+    update_settings(payload_settings, cache_settings_prop, 'Cache')
+    payload_settings['HotPayloads'] = int(payload_settings['HotPayloads'])
+    for key in cache_settings:
+        value = str(cache_settings_prop.get(key, cache_settings[key])).lower()
+        if value not in ('yes', 'no'):
+            print('Warning: Cache %s %s in properties.json is not yes or no, using %s' % (key, cache_settings_prop[key], cache_settings[key]))
+            continue
+        cache_settings[key] = value
+#
+## end init_cache_settings
+
+###############################################################################################
+# Name: get_ssl_context()                                               
+#   Returns the process wide ssl context, creates it with default settings (no verification) if
+#   init_ssl_context() has not been called
+###############################################################################################
+def get_ssl_context() :
+    if ssl_context is not None:
+        return ssl_context
+    return init_ssl_context()
+
+###############################################################################################
+# Name: tls_session_report(host)                                               
+#   Returns tls full/resumed handshake counters for host as a printable string
+###############################################################################################
+def tls_session_report(host) :
+    with tls_sessions_lock:
+        stats = dict(tls_session_stats.get(host, {'full' : 0, 'resumed' : 0}))
+    return ('TLS handshakes: %s full, %s resumed' % (stats['full'], stats['resumed']))
+
+###############################################################################################
+# Class: ResumableHTTPSConnection
+#   HTTPSConnection which offers the tls session of a previous connection to the same host when
+#   connecting, so the service can resume the session instead of doing a full handshake. The
+#   session is saved on connect and again when the connection is released/closed (TLS 1.3 
+#   session tickets arrive after the handshake).
+###############################################################################################
+class ResumableHTTPSConnection(HTTPSConnection):
+    def connect(self):
+        # tcp connect (and proxy tunnel, if any) 
+        HTTPConnection.connect(self)
+
+        if self._tunnel_host:
+            server_hostname = self._tunnel_host
+        else:
+            server_hostname = self.host
+
+        with tls_sessions_lock:
+            session = tls_sessions.get((self.host, self.port))
+
+        # seconds of the tls handshake, see http__issue_request()
+        start = time.time()
+        self.sock = self._context.wrap_socket(self.sock, server_hostname=server_hostname, session=session)
+        self.tls_time = time.time() - start
+
+        with tls_sessions_lock:
+            stats = tls_session_stats.setdefault(self.host, {'full' : 0, 'resumed' : 0})
+            if self.sock.session_reused:
+                stats['resumed'] += 1
+            else:
+                stats['full'] += 1
+        self.save_tls_session()
+
+    def save_tls_session(self):
+        if self.sock is not None and getattr(self.sock, 'session', None) is not None:
+            with tls_sessions_lock:
+                tls_sessions[(self.host, self.port)] = self.sock.session
+
+    def close(self):
+        try:
+            self.save_tls_session()
+        except:
+            pass
+        HTTPSConnection.close(self)
+#
+## end ResumableHTTPSConnection
+
 ###############################################################################################
 # Name: Connect_Server_NoSSL                                               
 # Description:   
-#   get an http(s) connection to a server (disabled SSL).
+#   get an http(s) connection to a server (SSL verification as configured in properties.json,
+#   disabled by default) using the process wide ssl context.
 #   if successful return the connection else return 0.
 #	        
 ###############################################################################################
 def Connect_Server_NoSSL(sut_prop, host_ip_addr) :
     if (sys.version_info.major == 2 and sys.version_info.minor == 7 and sys.version_info.micro >= 9) :
-        # python 2.7.9 enables SSL by default but it was not enabled prior 2.7.9...  - disable it for the test connection...
-        cont=ssl.SSLContext(ssl.PROTOCOL_TLSv1)
-        cont.verify_mode = ssl.CERT_NONE
+        # python 2.7.9 enables SSL by default but it was not enabled prior 2.7.9...  - use the shared context for the test connection...
         try:
-            svr_conn = HTTPSConnection(host=sut_prop['DnsName'], strict=True, context=cont)
+            svr_conn = HTTPSConnection(host=sut_prop['DnsName'], strict=True, context=get_ssl_context())
         except:
             exc_str = sys.exc_info()[0]
             svr_conn = 0 # failure
@@ -106,25 +433,60 @@ def Connect_Server_NoSSL(sut_prop, host_ip_addr) :
     elif (Python3 == True) :
         #if 3.4.2
         if (sys.version_info.major == 3 and sys.version_info.minor == 4 and sys.version_info.micro <= 3) :
-            cont=ssl.SSLContext(ssl.PROTOCOL_TLSv1)
-            cont.verify_mode = ssl.CERT_NONE
             try:
-                svr_conn = HTTPSConnection(host=host_ip_addr, context=cont)
+                svr_conn = HTTPSConnection(host=host_ip_addr, context=get_ssl_context())
             except:
                 exc_str = sys.exc_info()[0]
                 svr_conn = 0 # failure
         else:
             try:
-                cntxt = ssl._create_unverified_context()
+                if TLSSessionResumption:
+                    svr_conn = ResumableHTTPSConnection(sut_prop['DnsName'], context=get_ssl_context())
+                else:
+                    svr_conn = HTTPSConnection(sut_prop['DnsName'], context=get_ssl_context())
             except:
                 exc_str = sys.exc_info()[0]
                 svr_conn = 0 # failure
 
-            try:
-                svr_conn = HTTPSConnection(sut_prop['DnsName'], context=cntxt)
-            except:
-                exc_str = sys.exc_info()[0]
-                svr_conn = 0 # failure
+    if (svr_conn == 0) :
+        print("OPERATIONAL ERROR (%s) - Unable to  connect to the Server %s -- exiting test..." % (exc_str, sut_prop['DnsName']))
+        print("Check the parameters configured for %s in the properties.json file" % sut_prop['DisplayName'])
+        ## game over.
+        exit(0)
+
+    return(svr_conn)
+#
+## end Connect Server No SSL
+
+###############################################################################################
+# Name: Connect_Server_NoSSL_NoHTTPS                                               
+# Description:   
+#   get an http connection to a server (no SSL).
+#   if successful return the connection else return 0.
+#	        
+###############################################################################################
+def Connect_Server_NoSSL_NoHTTPS(sut_prop, host_ip_addr) :
+
+    if (sys.version_info.major == 2 and sys.version_info.minor == 7 and sys.version_info.micro >= 9) :
+        try:
+            svr_conn = HTTPConnection(host=sut_prop['DnsName'])
+        except:
+            exc_str = sys.exc_info()[0]
+            svr_conn = 0 # failure
+
+    elif (Python3 == False) : # Python 2 but prior to 2.7.9
+        try:
+            conn = HTTPConnection(host=host_ip_addr)
+        except:
+            exc_str = sys.exc_info()[0]
+            svr_conn = 0 # failure
+
+    elif (Python3 == True) :
+        try:
+            svr_conn = HTTPConnection(sut_prop['DnsName'])
+        except:
+            exc_str = sys.exc_info()[0]
+            svr_conn = 0 # failure
 
     if (svr_conn == 0) :
         print("OPERATIONAL ERROR (%s) - Unable to  connect to the Server %s -- exiting test..." % (exc_str, sut_prop['DnsName']))
@@ -186,7 +548,815 @@ def Connect_Server_NoSSL_NoHTTPS(sut_prop, host_ip_addr) :
 ## end Connect Server No SSL
 
 ###############################################################################################
-# Name: http__set_auth_header()                                              
+# Class: ConnectionPool
+#   Per SUT pool of persistent (keep-alive) http(s) connections keyed by (scheme, netloc).
+#   Connections are handed out by get_connection() and handed back by release() once the
+#   response has been read completely, so the next request to the same netloc skips the TCP and
+#   TLS handshake. A connection is closed instead of pooled if the service answers with
+#   'Connection: close' and a stale pooled socket (closed by the service while idle) is replaced
+#   by a fresh connection in http__send_request(). The pool is thread safe.
+###############################################################################################
+class ConnectionPool():
+    def __init__(self, sut_prop, max_idle = 8):
+        self.sut_prop = sut_prop
+        # max idle connections kept per (scheme, netloc)
+        self.max_idle = max_idle
+        # (scheme, netloc) : list of idle connections
+        self.idle_connections = dict()
+        self.lock = threading.Lock()
+        # connection reuse counters
+        self.stats = {\
+            'created' : 0,\
+            'reused' : 0,\
+            'reconnected' : 0,\
+            'closed_by_server' : 0,\
+            'retried_failures' : 0,\
+            'retried_unavailable' : 0\
+        }
+        # SessionAuth of the SUT if authenticated requests use a Redfish session instead of Basic auth
+        self.session_auth = None
+        # limits the requests in flight to the SUT, see ConcurrencyGovernor
+        self.governor = ConcurrencyGovernor(max_window = max_idle)
+        # wall clock time (time.time()) the current assertion of the SUT has to complete by, or None
+        self.deadline = None
+        # optional TrafficRecorder the requests to the SUT are written to
+        self.recorder = None
+        # id of the assertion currently issuing requests (recorded with them), set by SUT.run_assertion()
+        self.assertion_id = None
+        # timings of the requests to the SUT, see RequestMetrics
+        self.metrics = RequestMetrics()
+
+    ###############################################################################################
+    # Name: get_connection(scheme, netloc)
+    #   Takes url scheme and netloc, returns an idle pooled connection for it or a new one
+    # Return:
+    #   connection, True if the connection was reused from the pool else False
+    ###############################################################################################
+    def get_connection(self, scheme, netloc):
+        key = (scheme, netloc)
+        with self.lock:
+            idle = self.idle_connections.get(key)
+            if idle:
+                self.stats['reused'] += 1
+                return idle.pop(), True
+            self.stats['created'] += 1
+
+        if scheme == 'http':
+            return Connect_Server_NoSSL_NoHTTPS(self.sut_prop, netloc), False
+        return Connect_Server_NoSSL(self.sut_prop, netloc), False
+
+    ###############################################################################################
+    # Name: release(scheme, netloc, connection, response)
+    #   Takes back a connection after its response has been read. The connection is pooled for
+    #   reuse unless the service asked to close it or the pool for this netloc is full
+    ###############################################################################################
+    def release(self, scheme, netloc, connection, response):
+        if response is None or response.will_close or not response.isclosed():
+            if response is not None and response.will_close:
+                with self.lock:
+                    self.stats['closed_by_server'] += 1
+            self.discard(connection)
+            return
+
+        if hasattr(connection, 'save_tls_session'):
+            connection.save_tls_session()
+
+        key = (scheme, netloc)
+        with self.lock:
+            idle = self.idle_connections.setdefault(key, [])
+            if len(idle) < self.max_idle:
+                idle.append(connection)
+                return
+        self.discard(connection)
+
+    ###############################################################################################
+    # Name: discard(connection)
+    #   Closes a connection which can not be reused
+    ###############################################################################################
+    def discard(self, connection):
+        try:
+            connection.close()
+        except:
+            pass
+
+    ###############################################################################################
+    # Name: close_all()
+    #   Closes all idle connections in the pool
+    ###############################################################################################
+    def close_all(self):
+        with self.lock:
+            idle_connections = self.idle_connections
+            self.idle_connections = dict()
+        for idle in idle_connections.values():
+            for connection in idle:
+                self.discard(connection)
+
+    ###############################################################################################
+    # Name: report()
+    #   Returns connection reuse counters of the pool as a printable string
+    ###############################################################################################
+    def report(self):
+        with self.lock:
+            stats = dict(self.stats)
+        requests = stats['created'] + stats['reused']
+        return ('HTTP connections: %s requests, %s connections created, %s reused, %s reconnected after stale socket, %s closed by service. %s Retries: %s after failed requests, %s after 503 responses' \
+            % (requests, stats['created'], stats['reused'], stats['reconnected'], stats['closed_by_server'], tls_session_report(urlparse('//' + self.sut_prop['DnsName']).hostname), \
+            stats['retried_failures'], stats['retried_unavailable']))
+
+    ###############################################################################################
+    # Name: remaining()
+    #   Returns the seconds left until the deadline of the SUT requests, None if there is none
+    ###############################################################################################
+    def remaining(self):
+        deadline = self.deadline
+        if deadline == None:
+            return None
+        return deadline - time.time()
+
+    ###############################################################################################
+    # Name: count_retry(status)
+    #   Counts a retried request, status is the http status of the response or None if the 
+    #   request failed
+    ###############################################################################################
+    def count_retry(self, status):
+        with self.lock:
+            if status == None:
+                self.stats['retried_failures'] += 1
+            else:
+                self.stats['retried_unavailable'] += 1
+
+    ###############################################################################################
+    # Name: retry_count()
+    #   Returns the number of retried requests
+    ###############################################################################################
+    def retry_count(self):
+        with self.lock:
+            return self.stats['retried_failures'] + self.stats['retried_unavailable']
+#
+## end ConnectionPool
+
+###############################################################################################
+# Class: SessionAuth
+#   Per SUT Redfish session used to authenticate the requests when the SUT property 
+#   "AuthenticationMode" is "Session": one session is created thru the SessionService on the first
+#   authenticated request and its X-Auth-Token is sent instead of the Basic authorization header,
+#   so the service authenticates the credentials once instead of on every request. The session is
+#   created again when the service answers 401 for the token (session timed out or deleted) and
+#   deleted by logout() at the end of the run. If no session can be created the requests fall back
+#   to Basic authentication. The class is thread safe.
+###############################################################################################
+class SessionAuth():
+    def __init__(self, sut_prop, conn_pool = None):
+        self.sut_prop = sut_prop
+        # pool the session requests are issued thru
+        self.conn_pool = conn_pool
+        # service root used to find the Sessions collection, updated by SUT.set_redfish_defined_uris()
+        self.service_root = '/redfish/v1/'
+        self.token = None
+        self.location = None
+        # set when the service does not allow creating a session
+        self.failed = False
+        self.lock = threading.Lock()
+        self.stats = {\
+            'created' : 0,\
+            'renewed' : 0,\
+            'deleted' : 0\
+        }
+
+    ###############################################################################################
+    # Name: get_token()
+    #   Returns the session auth token, creating the session if required; None if no session
+    #   could be created
+    ###############################################################################################
+    def get_token(self):
+        with self.lock:
+            if self.token == None and not self.failed:
+                self.login()
+            return self.token
+
+    ###############################################################################################
+    # Name: renew(expired_token)
+    #   Creates a new session after the service rejected expired_token with 401. Requests which 
+    #   fail concurrently with the same token share one new session
+    # Return:
+    #   True if the request can be repeated with a new token
+    ###############################################################################################
+    def renew(self, expired_token):
+        with self.lock:
+            if self.token != expired_token:
+                # session renewed already by another request
+                return self.token != None
+            self.token = None
+            self.location = None
+            self.stats['renewed'] += 1
+            self.login()
+            return self.token != None
+
+    ###############################################################################################
+    # Name: login()
+    #   POST the credentials to the Sessions collection linked from the service root (the lock is
+    #   held by the caller). The POST is not authenticated as allowed for the session login
+    ###############################################################################################
+    def login(self):
+        sessions_uri = self.service_root + 'SessionService/Sessions'
+        json_payload, headers, status = http__GET(self.sut_prop, self.service_root, None, 'off', conn_pool = self.conn_pool)
+        try:
+            sessions_uri = json_payload['Links']['Sessions']['@odata.id']
+        except (TypeError, KeyError):
+            pass
+
+        rq_body = {'UserName': self.sut_prop['LoginName'], 'Password': self.sut_prop['Password']}
+        json_payload, headers, status = http__POST(self.sut_prop, sessions_uri, None, rq_body, 'off', self.conn_pool)
+        if status in (HTTP_CREATED, HTTP_OK) and headers and headers.get('x-auth-token'):
+            self.token = headers['x-auth-token']
+            self.location = headers.get('location')
+            self.stats['created'] += 1
+        else:
+            self.failed = True
+            print('Warning: could not create a session thru %s (status %s), requests use Basic authentication' % (sessions_uri, status))
+
+    ###############################################################################################
+    # Name: logout()
+    #   Deletes the session of the tool, call once all requests to the SUT are done
+    ###############################################################################################
+    def logout(self):
+        with self.lock:
+            token, location = self.token, self.location
+            self.token = None
+            self.location = None
+        if token and location:
+            rq_headers = create_request_headers()
+            rq_headers['X-Auth-Token'] = token
+            json_payload, headers, status = http__DELETE(self.sut_prop, location, rq_headers, 'off', self.conn_pool)
+            if status and status < 300:
+                with self.lock:
+                    self.stats['deleted'] += 1
+
+    ###############################################################################################
+    # Name: report()
+    #   Returns the session counters as a printable string
+    ###############################################################################################
+    def report(self):
+        with self.lock:
+            stats = dict(self.stats)
+        return ('Session authentication: %s sessions created, %s re-created after 401%s' \
+            % (stats['created'], stats['renewed'], ', fell back to Basic authentication' if self.failed else ''))
+#
+## end SessionAuth
+
+###############################################################################################
+# Class: ConcurrencyGovernor
+#   Per SUT AIMD (additive increase, multiplicative decrease) limit of the requests in flight,
+#   so a fragile service is not pushed harder than it can answer. The window starts at one
+#   request and grows by one per completed request (slow start) until the first congestion
+#   signal, then by one per window of completed requests. It is halved on a congestion signal:
+#   a 503 (Service Unavailable) response, a failed request (connection refused/reset, timeout)
+#   or a latency spike (a request taking spike_factor times the average latency). The window
+#   never exceeds max_window (MaxConcurrentRequests of the SUT). Requests issued by a thread
+#   which holds a slot already (session login, redirects) do not wait for another slot.
+###############################################################################################
+class ConcurrencyGovernor():
+    def __init__(self, max_window = 8, spike_factor = 3.0):
+        self.max_window = max(1, max_window)
+        self.spike_factor = spike_factor
+        self.window = 1.0
+        self.slow_start = True
+        self.in_flight = 0
+        # moving average of the request latency in seconds; spikes move it slowly, so a service
+        # which settles at a higher latency stops counting as a spike after a few responses
+        self.avg_latency = None
+        self.samples = 0
+        self.last_decrease = 0
+        self.condition = threading.Condition()
+        self.local = threading.local()
+        self.stats = {\
+            'requests' : 0,\
+            'decreases' : 0,\
+            'max_window' : 1,\
+            'max_in_flight' : 0\
+        }
+
+    ###############################################################################################
+    # Name: current_window()
+    #   Returns the number of requests currently allowed in flight
+    ###############################################################################################
+    def current_window(self):
+        with self.condition:
+            return int(self.window)
+
+    ###############################################################################################
+    # Name: acquire()
+    #   Waits for a slot in the window
+    # Return:
+    #   True if a slot was taken (to be given back with release()), False if the thread holds a 
+    #   slot already
+    ###############################################################################################
+    def acquire(self):
+        if getattr(self.local, 'holding', False):
+            return False
+        with self.condition:
+            while self.in_flight >= int(self.window):
+                self.condition.wait()
+            self.in_flight += 1
+            self.stats['max_in_flight'] = max(self.stats['max_in_flight'], self.in_flight)
+        self.local.holding = True
+        return True
+
+    ###############################################################################################
+    # Name: release(latency, status)
+    #   Gives back the slot of a completed request and adjusts the window. status is the http
+    #   status of the response or None if the request failed
+    ###############################################################################################
+    def release(self, latency, status):
+        self.local.holding = False
+        with self.condition:
+            self.in_flight -= 1
+            self.stats['requests'] += 1
+            spike = self.avg_latency != None and self.samples >= 5 and latency > self.spike_factor * self.avg_latency
+            if status == None or status == 503 or spike:
+                # at most one decrease per round trip, requests in flight at the time of a congestion 
+                # signal are likely to report it as well
+                now = time.time()
+                if now - self.last_decrease > (self.avg_latency or 0):
+                    self.last_decrease = now
+                    self.window = max(1.0, self.window / 2)
+                    self.slow_start = False
+                    self.stats['decreases'] += 1
+            else:
+                if self.slow_start:
+                    self.window = min(self.max_window, self.window + 1)
+                else:
+                    self.window = min(self.max_window, self.window + 1 / self.window)
+                self.stats['max_window'] = max(self.stats['max_window'], int(self.window))
+            if status != None:
+                weight = 0.05 if spike else 0.2
+                self.avg_latency = latency if self.avg_latency == None else (1 - weight) * self.avg_latency + weight * latency
+                self.samples += 1
+            self.condition.notify_all()
+
+    ###############################################################################################
+    # Name: abandon()
+    #   Gives back the slot of a request interrupted by an exception (the deadline of a nested
+    #   request, an interrupt...) before it had a response: the window is left as it is, there is
+    #   no response to adjust it to
+    ###############################################################################################
+    def abandon(self):
+        self.local.holding = False
+        with self.condition:
+            self.in_flight -= 1
+            self.condition.notify_all()
+
+    ###############################################################################################
+    # Name: report()
+    #   Returns the window counters as a printable string
+    ###############################################################################################
+    def report(self):
+        with self.condition:
+            return ('Concurrency governor: window %s of max %s (largest %s), %s decreases in %s requests, max %s requests in flight, average latency %s ms' \
+                % (int(self.window), self.max_window, self.stats['max_window'], self.stats['decreases'], self.stats['requests'], self.stats['max_in_flight'], \
+                int(self.avg_latency * 1000) if self.avg_latency != None else '-'))
+#
+## end ConcurrencyGovernor
+
+###############################################################################################
+# Class: RequestMetrics
+#   Timing breakdown of the requests to a SUT, to tell apart time spent by the service, the 
+#   network and the tool. The seconds of each request phase:
+#       connect: tcp connect of a new connection          tls: tls handshake of a new connection
+#       ttfb: request sent until the response headers     download: reading the response body
+#       decompress: un-gzip of the body                   parse: loading the json payload
+#   and the total seconds of the requests are summed up for all requests, per http method, per
+#   assertion id (requests outside of the assertions under '-') and per uri. summary() returns 
+#   them as a json serializable dict. The class is thread safe.
+###############################################################################################
+class RequestMetrics():
+    phases = ('connect', 'tls', 'ttfb', 'download', 'decompress', 'parse')
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.totals = self.new_aggregate()
+        self.by_method = dict()
+        self.by_assertion = dict()
+        self.by_uri = dict()
+
+    def new_aggregate(self):
+        aggregate = {'requests' : 0, 'failed' : 0, 'total' : 0.0, 'max' : 0.0}
+        for phase in self.phases:
+            aggregate[phase] = 0.0
+        return aggregate
+
+    ###############################################################################################
+    # Name: add(http_req, resource_uri, assertion_id, status, elapsed, timings)
+    #   Adds a request: status is its http status (None if it failed), elapsed its total seconds 
+    #   and timings the dict of seconds per phase
+    ###############################################################################################
+    def add(self, http_req, resource_uri, assertion_id, status, elapsed, timings):
+        if assertion_id == None:
+            assertion_id = '-'
+        with self.lock:
+            for aggregate in (self.totals, self.by_method.setdefault(http_req, self.new_aggregate()), \
+                self.by_assertion.setdefault(assertion_id, self.new_aggregate()), self.by_uri.setdefault(resource_uri, self.new_aggregate())):
+                aggregate['requests'] += 1
+                if status == None:
+                    aggregate['failed'] += 1
+                aggregate['total'] += elapsed
+                aggregate['max'] = max(aggregate['max'], elapsed)
+                for phase, seconds in timings.items():
+                    aggregate[phase] += seconds
+
+    ###############################################################################################
+    # Name: summary()
+    #   Returns the aggregates in milliseconds as a dict: totals, by_method, by_assertion and 
+    #   by_uri (uris ordered by their total time, slowest first)
+    ###############################################################################################
+    def summary(self):
+        def milliseconds(aggregate):
+            result = OrderedDict([('requests', aggregate['requests']), ('failed', aggregate['failed'])])
+            for key in ('total', 'max') + self.phases:
+                result[key + '_ms'] = round(aggregate[key] * 1000, 3)
+            return result
+
+        def ordered(aggregates):
+            keys = sorted(aggregates.keys(), key = lambda key: (-aggregates[key]['total'], str(key)))
+            return OrderedDict([(key, milliseconds(aggregates[key])) for key in keys])
+
+        with self.lock:
+            return OrderedDict([\
+                ('totals', milliseconds(self.totals)),\
+                ('by_method', ordered(self.by_method)),\
+                ('by_assertion', ordered(self.by_assertion)),\
+                ('by_uri', ordered(self.by_uri))\
+            ])
+
+    ###############################################################################################
+    # Name: write_summary(file_path)
+    #   Writes summary() as a json file
+    ###############################################################################################
+    def write_summary(self, file_path):
+        with open(file_path, 'w') as summary_file:
+            json.dump(self.summary(), summary_file, indent = 2)
+
+    ###############################################################################################
+    # Name: report()
+    #   Returns the totals as a printable string
+    ###############################################################################################
+    def report(self):
+        with self.lock:
+            totals = dict(self.totals)
+        return ('Request timings: %s requests (%s failed), %.1f s total: ' % (totals['requests'], totals['failed'], totals['total'])) + \
+            ', '.join(['%s %.1f s' % (phase, totals[phase]) for phase in self.phases])
+#
+## end RequestMetrics
+
+###############################################################################################
+# Name: capture_body(body, password = None)
+# Description:   
+#   Converts a request/response body for a traffic capture: utf-8 text with the password replaced
+#   by REDACTED, or base64 for a body which is not utf-8
+# Return:
+#   (text, 'text'), (base64 text, 'base64') or (None, None) for no body
+###############################################################################################
+def capture_body(body, password = None) :
+    if body == None:
+        return None, None
+    if not isinstance(body, bytes):
+        text = body
+    else:
+        try:
+            text = body.decode('utf-8')
+        except UnicodeDecodeError:
+            return base64.b64encode(body).decode('ascii'), 'base64'
+    if password:
+        text = text.replace(password, 'REDACTED')
+    return text, 'text'
+#
+## end capture_body
+
+###############################################################################################
+# Class: TrafficRecorder
+#   Writes every request to a SUT and its response to a gzip compressed JSON lines file, one JSON
+#   object per request attempt (retries and redirects are separate lines):
+#       seq, time (start, seconds since the epoch), elapsed (seconds until the body was read),
+#       timings (seconds of the request phases, see RequestMetrics), assertion (id of the assertion issuing the request), method, uri, retry (retries of the
+#       request so far), request {headers, body}, response {status, reason, headers, body,
+#       body_encoding, decompressed} or null, error (why there is no response) or null
+#   Bodies are utf-8 text or base64 (body_encoding 'text'/'base64'), a body which was not read 
+#   (read_body = False) or not recieved is null. decompressed is True if a gzip body was recorded 
+#   after decompressing it. The values of the headers in capture_redacted_headers and the SUT 
+#   password are replaced by REDACTED. Each line is written thru to the compressed stream, so the 
+#   memory used does not grow with the size of the capture. The class is thread safe.
+###############################################################################################
+class TrafficRecorder():
+    def __init__(self, file_path, sut_prop = None):
+        self.file_path = file_path
+        self.password = sut_prop.get('Password') if sut_prop else None
+        self.lock = threading.Lock()
+        self.handle = gzip.open(file_path, 'wb')
+        self.stats = {\
+            'records' : 0,\
+            'body_bytes' : 0\
+        }
+
+    ###############################################################################################
+    # Name: redact_headers(header_list)
+    #   Takes a dict or (name, value) pairs, returns a list of [name, value] with the values of the 
+    #   capture_redacted_headers replaced
+    ###############################################################################################
+    def redact_headers(self, header_list):
+        if header_list == None:
+            return list()
+        if isinstance(header_list, dict):
+            header_list = header_list.items()
+        return [[name, 'REDACTED' if name.lower() in capture_redacted_headers else value] for name, value in header_list]
+
+    ###############################################################################################
+    # Name: encode_body(body)
+    #   Returns the body as recorded, see capture_body()
+    ###############################################################################################
+    def encode_body(self, body):
+        return capture_body(body, self.password)
+
+    ###############################################################################################
+    # Name: record(http_req, resource_uri, rq_headers, rq_body, r_response, r_payload, start,
+    #   retries, assertion_id = None, decompressed = False, error = None, timings = None)
+    #   Writes one request attempt. r_response is the response (None if the request failed) and 
+    #   r_payload its body as read, start is the time.time() the request was issued at and timings
+    #   the seconds of its phases, see RequestMetrics
+    ###############################################################################################
+    def record(self, http_req, resource_uri, rq_headers, rq_body, r_response, r_payload, start, retries, assertion_id = None, decompressed = False, error = None, timings = None):
+        elapsed = time.time() - start
+        body, body_encoding = self.encode_body(rq_body)
+        entry = OrderedDict([\
+            ('seq', None),\
+            ('time', round(start, 6)),\
+            ('elapsed', round(elapsed, 6)),\
+            ('timings', dict((phase, round(seconds, 6)) for phase, seconds in timings.items()) if timings else None),\
+            ('assertion', assertion_id),\
+            ('method', http_req),\
+            ('uri', resource_uri),\
+            ('retry', retries),\
+            ('request', OrderedDict([('headers', self.redact_headers(rq_headers)), ('body', body)])),\
+            ('response', None),\
+            ('error', error)\
+        ])
+        if r_response != None:
+            body, body_encoding = self.encode_body(r_payload)
+            entry['response'] = OrderedDict([\
+                ('status', r_response.status),\
+                ('reason', r_response.reason),\
+                ('headers', self.redact_headers(r_response.getheaders())),\
+                ('body', body),\
+                ('body_encoding', body_encoding),\
+                ('decompressed', decompressed)\
+            ])
+        elif error == None:
+            entry['error'] = 'request failed'
+
+        with self.lock:
+            if self.handle == None:
+                return
+            entry['seq'] = self.stats['records']
+            self.stats['records'] += 1
+            self.stats['body_bytes'] += len(r_payload) if r_payload else 0
+            self.handle.write((json.dumps(entry) + '\n').encode('utf-8'))
+
+    ###############################################################################################
+    # Name: close()
+    #   Flushes and closes the capture file
+    ###############################################################################################
+    def close(self):
+        with self.lock:
+            if self.handle != None:
+                self.handle.close()
+                self.handle = None
+
+    ###############################################################################################
+    # Name: report()
+    #   Returns the capture counters as a printable string
+    ###############################################################################################
+    def report(self):
+        with self.lock:
+            return ('Traffic capture: %s requests with %s response body bytes recorded to %s' % (self.stats['records'], self.stats['body_bytes'], self.file_path))
+#
+## end TrafficRecorder
+
+###############################################################################################
+# Class: TrafficReplay
+#   Serves the responses of a traffic capture written by TrafficRecorder instead of a SUT, so the
+#   assertions can be rerun without the service. The capture is loaded into an in memory index:
+#   1. exact match: method, uri path, the request headers in replay_match_headers, whether the
+#      request is authenticated (Basic or session token) and the request body (json bodies 
+#      compared regardless of key order, the SUT password redacted as in the capture)
+#   2. fallback: method and uri path only, for requests whose headers or body changed
+#   Requests matching the same key are served the recorded responses of that key in capture order
+#   and the last one once they are used up, so a sequence which modifies a resource (GET, PATCH,
+#   GET) replays the same responses as recorded regardless of the timing of the requests. A 
+#   request without a match is answered with a 404 error response. Recorded failed requests 
+#   fail again. The class is thread safe.
+###############################################################################################
+class TrafficReplay():
+    def __init__(self, file_path, sut_prop = None):
+        self.file_path = file_path
+        self.password = sut_prop.get('Password') if sut_prop else None
+        self.lock = threading.Lock()
+        # recorded (request, response) pairs in capture order and the record numbers of each key
+        self.responses = list()
+        self.exact_index = dict()
+        self.uri_index = dict()
+        # next record of each key
+        self.cursors = dict()
+        self.stats = {\
+            'records' : 0,\
+            'exact' : 0,\
+            'fallback' : 0,\
+            'missing' : 0\
+        }
+        self.load()
+
+    ###############################################################################################
+    # Name: load()
+    #   Reads the capture file line by line and indexes its responses
+    ###############################################################################################
+    def load(self):
+        with gzip.open(self.file_path, 'rb') as handle:
+            for line in handle:
+                if not line.strip():
+                    continue
+                entry = json.loads(line.decode('utf-8'))
+                request = entry['request']
+                exact_key, uri_key = self.match_keys(entry['method'], entry['uri'], request['headers'], request['body'])
+                record = len(self.responses)
+                self.responses.append(entry['response'])
+                self.exact_index.setdefault(exact_key, list()).append(record)
+                self.uri_index.setdefault(uri_key, list()).append(record)
+        self.stats['records'] = len(self.responses)
+
+    ###############################################################################################
+    # Name: match_keys(http_req, resource_uri, rq_headers, rq_body)
+    #   Returns the exact and the fallback index keys of a request
+    ###############################################################################################
+    def match_keys(self, http_req, resource_uri, rq_headers, rq_body):
+        if rq_headers == None:
+            rq_headers = list()
+        elif isinstance(rq_headers, dict):
+            rq_headers = rq_headers.items()
+        headers = list()
+        authenticated = None
+        for name, value in rq_headers:
+            name = name.lower()
+            if name in replay_match_headers:
+                headers.append((name, value))
+            elif name == 'authorization':
+                authenticated = 'basic'
+            elif name == 'x-auth-token':
+                authenticated = 'session'
+        headers.sort()
+
+        body, body_encoding = capture_body(rq_body, self.password)
+        if body_encoding == 'text':
+            try:
+                body = json.dumps(json.loads(body), sort_keys = True)
+            except ValueError:
+                pass
+
+        uri_key = (http_req, urlparse(resource_uri).path)
+        return uri_key + (tuple(headers), authenticated, body), uri_key
+
+    ###############################################################################################
+    # Name: next_record(key, records)
+    #   Returns the next record of a key, the last one once all are used up
+    ###############################################################################################
+    def next_record(self, key, records):
+        cursor = self.cursors.get(key, 0)
+        if cursor < len(records) - 1:
+            self.cursors[key] = cursor + 1
+        return records[cursor]
+
+    ###############################################################################################
+    # Name: match(http_req, resource_uri, rq_headers, rq_body)
+    #   Finds the recorded response of a request
+    # Return:
+    #   (status, reason, header_list, body) of the response, body as bytes; None for a request 
+    #   which failed when it was recorded
+    ###############################################################################################
+    def match(self, http_req, resource_uri, rq_headers, rq_body):
+        exact_key, uri_key = self.match_keys(http_req, resource_uri, rq_headers, rq_body)
+        with self.lock:
+            if exact_key in self.exact_index:
+                self.stats['exact'] += 1
+                response = self.responses[self.next_record(exact_key, self.exact_index[exact_key])]
+            elif uri_key in self.uri_index:
+                self.stats['fallback'] += 1
+                response = self.responses[self.next_record(uri_key, self.uri_index[uri_key])]
+            else:
+                self.stats['missing'] += 1
+                body = json.dumps({'error' : {'code' : 'Base.1.0.GeneralError', 'message' : 'No response for %s %s in the traffic capture %s' % (http_req, resource_uri, self.file_path)}})
+                return HTTP_NOT_FOUND, 'Not Found', [('Content-Type', 'application/json')], body.encode('utf-8')
+
+        if response == None:
+            return None
+
+        body = response['body']
+        if body == None:
+            body = b''
+        elif response['body_encoding'] == 'base64':
+            body = base64.b64decode(body)
+        else:
+            body = body.encode('utf-8')
+        # the body was recorded after decompressing it, serve it without the gzip encoding
+        header_list = list()
+        for name, value in response['headers']:
+            if name.lower() in ('content-length', 'transfer-encoding') or (response['decompressed'] and name.lower() == 'content-encoding'):
+                continue
+            header_list.append((name, value))
+        header_list.append(('Content-Length', str(len(body))))
+        return response['status'], response['reason'], header_list, body
+
+    ###############################################################################################
+    # Name: report()
+    #   Returns the replay counters as a printable string
+    ###############################################################################################
+    def report(self):
+        with self.lock:
+            return ('Traffic replay from %s: %s recorded requests, %s requests replayed with an exact match, %s with a method and uri match, %s not found in the capture' \
+                % (self.file_path, self.stats['records'], self.stats['exact'], self.stats['fallback'], self.stats['missing']))
+#
+## end TrafficReplay
+
+###############################################################################################
+# Class: ReplayResponse
+#   http.client response like object of a replayed response
+###############################################################################################
+class ReplayResponse():
+    def __init__(self, status, reason, header_list, body):
+        self.status = status
+        self.reason = reason
+        self.header_list = header_list
+        self.body = BytesIO(body) if Python3 else StringIO(body)
+        self.will_close = False
+
+    def read(self, amt = None):
+        return self.body.read() if amt == None else self.body.read(amt)
+
+    def isclosed(self):
+        return True
+
+    def getheaders(self):
+        return self.header_list
+
+    def getheader(self, name, default = None):
+        for key, value in self.header_list:
+            if key.lower() == name.lower():
+                return value
+        return default
+
+###############################################################################################
+# Class: ReplayConnection
+#   http.client connection like object which answers the requests from a TrafficReplay
+###############################################################################################
+class ReplayConnection():
+    def __init__(self, replay):
+        self.replay = replay
+        self.sock = None
+        self.timeout = None
+        self.response = None
+
+    def connect(self):
+        pass
+
+    def request(self, method, url, body = None, headers = None):
+        self.response = self.replay.match(method, url, headers, body)
+
+    def getresponse(self):
+        response, self.response = self.response, None
+        if response == None:
+            raise socket.error('request failed when it was recorded')
+        return ReplayResponse(*response)
+
+    def close(self):
+        pass
+
+###############################################################################################
+# Class: ReplayConnectionPool
+#   ConnectionPool whose connections answer the requests from a TrafficReplay instead of the SUT
+###############################################################################################
+class ReplayConnectionPool(ConnectionPool):
+    def __init__(self, sut_prop, replay, max_idle = 8):
+        ConnectionPool.__init__(self, sut_prop, max_idle)
+        self.replay = replay
+
+    def get_connection(self, scheme, netloc):
+        with self.lock:
+            self.stats['created'] += 1
+        return ReplayConnection(self.replay), False
+
+    def release(self, scheme, netloc, connection, response):
+        pass
+#
+## end ReplayConnectionPool
+
+###############################################################################################
+# Name: http__set_auth_header()                                            
 # Description:  
 #  common code for the http requests -- this function:
 #  sets up the authorization header and centralizes code to ease
@@ -210,6 +1380,35 @@ def http__set_auth_header(rq_headers, login, password) :
 #
 ## end http__set_auth_header
 
+###############################################################################################
+# Name: http__set_request_auth(sut_prop, rq_headers, auth_on_off, conn_pool = None)
+# Description:  
+#  sets up the authentication of a request according to auth_on_off:
+#   'on': X-Auth-Token of the SUT session if the conn_pool has a SessionAuth, else Basic auth
+#   'basic': always Basic auth (for assertions that verify Basic authentication)
+#   any other value: the request headers are left as they are
+#
+# Returns:
+#   the session token set in rq_headers, None if the request does not use the SUT session
+###############################################################################################
+def http__set_request_auth(sut_prop, rq_headers, auth_on_off, conn_pool = None) :
+    session_auth = conn_pool.session_auth if conn_pool else None
+    if (auth_on_off == 'on') and session_auth:
+        token = session_auth.get_token()
+        if token:
+            if 'Authorization' in rq_headers:
+                del rq_headers['Authorization']
+            rq_headers['X-Auth-Token'] = token
+            return token
+
+    if (auth_on_off == 'on') or (auth_on_off == 'basic'):
+        if session_auth and 'X-Auth-Token' in rq_headers and rq_headers['X-Auth-Token'] == session_auth.token:
+            del rq_headers['X-Auth-Token']
+        http__set_auth_header(rq_headers, sut_prop['LoginName'], sut_prop['Password'])
+    return None
+#
+## end http__set_request_auth
+
 ###############################################################################################
 # Name: get_auth_encoded                                            
 # Description:  
@@ -237,12 +1436,102 @@ def get_auth_encoded(login, password) :
 
 
 ###############################################################################################
-# Name: http__req_resp()                                              
+# Name: http__check_deadline(conn_pool, http_req, resource_uri)
+# Description:  
+#  raises DeadlineExceeded if the deadline of the requests in conn_pool has expired
+#
+# Returns:
+#   seconds left until the deadline, None if there is no deadline
+###############################################################################################
+def http__check_deadline(conn_pool, http_req, resource_uri) :
+    remaining = conn_pool.remaining() if conn_pool else None
+    if remaining != None and remaining <= 0:
+        raise DeadlineExceeded('deadline expired before %s %s' % (http_req, resource_uri))
+    return remaining
+#
+## end http__check_deadline
+
+###############################################################################################
+# Name: http__timeouts(conn_pool = None)
+# Description:  
+#  socket timeouts of a request: ConnectTimeout and ReadTimeout, both limited to the time left
+#  until the deadline of conn_pool
+#
+# Returns:
+#   connect_timeout, read_timeout: seconds, None for no timeout
+###############################################################################################
+def http__timeouts(conn_pool = None) :
+    connect_timeout = timeout_settings['ConnectTimeout'] or None
+    read_timeout = timeout_settings['ReadTimeout'] or None
+    remaining = conn_pool.remaining() if conn_pool else None
+    if remaining != None:
+        remaining = max(remaining, 0.001)
+        connect_timeout = min(connect_timeout or remaining, remaining)
+        read_timeout = min(read_timeout or remaining, remaining)
+    return connect_timeout, read_timeout
+#
+## end http__timeouts
+
+###############################################################################################
+# Name: http__issue_request(server_connection, http_req, url_path, rq_headers, rq_body, conn_pool = None, timings = None)
+# Description:  
+#  sends the request on the connection and recieves the response with the ConnectTimeout for
+#  a new connection and the ReadTimeout for the socket reads, see http__timeouts().
+#  If a timings dict is given the seconds of the tcp connect ('connect') and the tls handshake
+#  ('tls') of a new connection and until the response headers were recieved ('ttfb') are set in it
+#
+# Returns:
+#   response: the response recieved; socket.error/HTTPException on failure or timeout
+###############################################################################################
+def http__issue_request(server_connection, http_req, url_path, rq_headers, rq_body, conn_pool = None, timings = None) :
+    connect_timeout, read_timeout = http__timeouts(conn_pool)
+    if server_connection.sock is None:
+        server_connection.timeout = connect_timeout
+        if timings != None:
+            # connect ahead of the request to time it apart from the request
+            start = time.time()
+            server_connection.connect()
+            tls_time = getattr(server_connection, 'tls_time', 0)
+            timings['connect'] = time.time() - start - tls_time
+            timings['tls'] = tls_time
+    start = time.time()
+    server_connection.request(http_req, url_path, headers=rq_headers, body=rq_body)
+    if server_connection.sock is not None:
+        server_connection.sock.settimeout(read_timeout)
+    # receive the response and payload
+    response = server_connection.getresponse()
+    if timings != None:
+        timings['ttfb'] = time.time() - start
+    return response
+#
+## end http__issue_request
+
+# methods re-sent on a new connection when a pooled connection turns out to be stale: a request
+# which changes the service is never sent twice
+IDEMPOTENT_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+###############################################################################################
+# Name: stale_connection_error(error)
+# Returns:
+#   True if the request failed because the service closed the pooled connection while it was
+#   idle: the socket was reset or closed before any response. A timeout is not, the service may
+#   be processing the request
+###############################################################################################
+def stale_connection_error(error):
+    if isinstance(error, socket.timeout):
+        return False
+    if isinstance(error, BadStatusLine):
+        return True
+    return isinstance(error, socket.error) and getattr(error, 'errno', None) in (errno.ECONNRESET, errno.EPIPE, errno.ECONNABORTED)
+
+###############################################################################################
+# Name: http__send_request()                                              
 # Description:  
 #  common code for the http requests -- this function:
-#   1. sets up the authorization header
-#   2. posts the requests
-#   3. recieves the response
+#   1. gets a connection to the server (from conn_pool if provided, else a fresh connection)
+#   2. sets up the authorization header
+#   3. posts the requests
+#   4. recieves the response
 #  
 # Arguments:
 #   http_req:  the request type (GET, DELETE... etc)
@@ -250,14 +1539,22 @@ def get_auth_encoded(login, password) :
 #   rq_headers: the reqeuest headers
 #   rq_body: the body of the request in json format
 #   auth_on_off: if set to 'on' then authorization is enabled for the request 
-#       by adding the 'Authorization' header to the request; else the request
+#       by adding the 'Authorization' header (or the X-Auth-Token of the SUT session) to the 
+#       request; 'basic' always adds the Basic 'Authorization' header; else the request
 #       is made without this function adding authorization parameters into 
 #       the request headers
+#   conn_pool: optional ConnectionPool of the SUT. If a pooled connection turns out to be stale
+#       (closed by the service while idle, see stale_connection_error()) a GET, HEAD or OPTIONS
+#       request is re-issued once on a new connection; other methods fail
+#   retry_auth: re-issue the request once with a new session if the session token is rejected
+#   timings: optional dict the connect/tls/ttfb seconds are set in, see http__issue_request()
 #
 # Returns:
-#   response:  the response recieved                                                  
+#   url: the parsed url of the request
+#   server_connection: the connection the request was made on, None on failure
+#   response:  the response recieved, None on failure                                                  
 ###############################################################################################
-def http__req_resp(sut_prop, http_req, resource_uri, rq_headers, rq_body, auth_on_off) :
+def http__send_request(sut_prop, http_req, resource_uri, rq_headers, rq_body, auth_on_off, conn_pool = None, retry_auth = True, timings = None) :
 
     if (rq_headers == None):
         rq_headers = create_request_headers()
@@ -274,9 +1571,14 @@ def http__req_resp(sut_prop, http_req, resource_uri, rq_headers, rq_body, auth_o
         exit(0)
     else:
         url_ip = url.netloc
-        url_path = url.path
-
-        if url.scheme == 'https':
+        # keep the query of the uri, for example the $skip of a Members@odata.nextLink
+        url_path = url.path + ('?' + url.query if url.query else '')
+
+        reused = False
+        if conn_pool:
+            ### get pooled connection
+            server_connection, reused = conn_pool.get_connection(url.scheme, url_ip)
+        elif url.scheme == 'https':
         ### get fresh connection
             server_connection = Connect_Server_NoSSL(sut_prop, url_ip)
             # handle http, for conformance test purpose, sometimes we use http
@@ -285,31 +1587,312 @@ def http__req_resp(sut_prop, http_req, resource_uri, rq_headers, rq_body, auth_o
         else:
             server_connection = Connect_Server_NoSSL(sut_prop, url_ip)
 
-        # setup auth header: set login name and password for the sut_prop...
-        if (auth_on_off == 'on'):
-            http__set_auth_header(rq_headers, sut_prop['LoginName'], sut_prop['Password'])
+        # setup auth header: session token or login name and password for the sut_prop...
+        session_token = http__set_request_auth(sut_prop, rq_headers, auth_on_off, conn_pool)
 
         # issue the http request
         try:
-            server_connection.request(http_req, url_path, headers=rq_headers, body=rq_body)
+            response = http__issue_request(server_connection, http_req, url_path, rq_headers, rq_body, conn_pool, timings)
+        except (socket.error, HTTPException) as e:
+            if not reused or http_req.upper() not in IDEMPOTENT_METHODS or not stale_connection_error(e):
+                exc_str = sys.exc_info()[0]
+                print ('OPERATIONAL ERROR: %s Request for %s FAILED with exeption: %s' % (http_req, url_path, exc_str)) 
+                if conn_pool:
+                    conn_pool.discard(server_connection)
+                return url, None, None
+            # pooled connection was closed by the service while idle, re-send the idempotent request
+            # once on a new connection
+            conn_pool.discard(server_connection)
+            with conn_pool.lock:
+                conn_pool.stats['reconnected'] += 1
+            if url.scheme == 'http':
+                server_connection = Connect_Server_NoSSL_NoHTTPS(sut_prop, url_ip)
+            else:
+                server_connection = Connect_Server_NoSSL(sut_prop, url_ip)
+            try:
+                response = http__issue_request(server_connection, http_req, url_path, rq_headers, rq_body, conn_pool, timings)
+            except:
+                exc_str = sys.exc_info()[0]
+                print ('OPERATIONAL ERROR: %s Request for %s FAILED with exeption: %s' % (http_req, url_path, exc_str)) 
+                conn_pool.discard(server_connection)
+                return url, None, None
         except:
             exc_str = sys.exc_info()[0]
             print ('OPERATIONAL ERROR: %s Request for %s FAILED with exeption: %s' % (http_req, url_path, exc_str)) 
-            return     
-        else:
-            # receive the response and payload
+            if conn_pool:
+                conn_pool.discard(server_connection)
+            return url, None, None
+
+        # the session of the SUT timed out or was deleted, re-issue the request once with a new session
+        if session_token and retry_auth and response.status == HTTP_UNAUTHORIZED and conn_pool.session_auth.renew(session_token):
             try:
-                response = server_connection.getresponse()
+                response.read()
+                conn_pool.release(url.scheme, url_ip, server_connection, response)
             except:
-                exc_str = sys.exc_info()[0]
-                print ('OPERATIONAL ERROR: %s getresponse() for %s failed with exeption: %s - exiting test..' % (http_req, url_path, exc_str))
-                return
-            else:
-                return(response)
+                conn_pool.discard(server_connection)
+            return http__send_request(sut_prop, http_req, resource_uri, rq_headers, rq_body, auth_on_off, conn_pool, retry_auth = False, timings = timings)
+
+        return url, server_connection, response
+#
+## end http__send_request
+
+###############################################################################################
+# Name: http__req_resp()                                              
+# Description:  
+#  common code for the http requests -- issues the request thru http__send_request() and
+#  returns the response. The response is not read here, so a connection taken from conn_pool
+#  is not returned to the pool; use http__req_common() for pooled requests
+#  
+# Arguments:
+#   http_req:  the request type (GET, DELETE... etc)
+#   resource_uri: the uri of the redfish resource
+#   rq_headers: the reqeuest headers
+#   rq_body: the body of the request in json format
+#   auth_on_off: if set to 'on' then authorization is enabled for the request 
+#       by adding the 'Authorization' header to the request; else the request
+#       is made without this function adding authorization parameters into 
+#       the request headers
+#
+# Returns:
+#   response:  the response recieved                                                  
+###############################################################################################
+def http__req_resp(sut_prop, http_req, resource_uri, rq_headers, rq_body, auth_on_off) :
+    url, server_connection, response = http__send_request(sut_prop, http_req, resource_uri, rq_headers, rq_body, auth_on_off)
+    return(response)
 #
 ## end http__req_resp
 
 
+###############################################################################################
+# Name: http__response_headers(header_list)
+# Description:  
+#  build the response header dictionary from the (name, value) pairs recieved;
+#  the keys are converted to lowercase so that string searches can be made w/o concern for case
+#
+# Returns:
+#   r_headers: response headers dictionary
+###############################################################################################
+def http__response_headers(header_list) :
+    r_headers = dict()
+    for key, value in header_list:
+        r_headers[key.lower()] = value
+    return r_headers
+#
+## end http__response_headers
+
+###############################################################################################
+# Name: http__redirect_path(r_headers, status, resource_uri)
+# Description:  
+#  check the response for a http redirect (3xx with a location header pointing to a
+#  different resource)
+#
+# Returns:
+#   the path of the redirected resource or None if the response is not a redirect
+###############################################################################################
+def http__redirect_path(r_headers, status, resource_uri) :
+    if ("location" in r_headers.keys()) and (r_headers['location'] != resource_uri and status >= 300 and status < 400):
+        return urlparse(r_headers['location']).path
+    return None
+#
+## end http__redirect_path
+
+###############################################################################################
+# Name: http__track_cookie(cookie_info, r_headers, http_req, resource_uri)
+# Description:  
+#  record the request in the SUT cookie tracking list if the service returned a cookie
+#  (the service is not expected to return Cookies in the header)
+#
+# Arguments:
+#   cookie_info: cookie tracking list of the SUT; [found, [(http_req, uri)...], count]
+###############################################################################################
+def http__track_cookie(cookie_info, r_headers, http_req, resource_uri) :
+    if cookie_info:
+        cookie_detail = tuple()
+        #set cookie True if Set-Cookie is found, service is not expected to return Cookies in the header
+        if 'set-cookie' in r_headers.keys():
+            # requests of a SUT may run concurrently
+            with cookie_info_lock:
+                cookie_info[0] = True
+                cookie_info[2] += 1
+                # set details of request type and url where cookie was found
+                cookie_detail = (http_req , resource_uri)
+                cookie_info[1].append(cookie_detail)
+#
+## end http__track_cookie
+
+###############################################################################################
+# Name: http__read_body(r_response, chunk_size = 65536)
+# Description:  
+#  reads the body of the response; a gzip encoded body is decompressed with zlib chunk by chunk
+#  while it is read from the socket, so the compressed body is never held completely in memory
+#  and is not copied into a file object for gzip.GzipFile. A body that is labelled gzip but does
+#  not start with the gzip magic bytes or can not be decompressed is returned as recieved
+#
+#  The seconds spent decompressing are added to timings['decompress'] if a timings dict is given
+#
+# Returns:
+#   r_payload: the (decompressed) body
+#   decompressed: True if the gzip encoding was handled here (no further un-gzip required)
+###############################################################################################
+def http__read_body(r_response, chunk_size = 65536, timings = None) :
+    content_encoding = r_response.getheader('Content-Encoding')
+    if not content_encoding or content_encoding.lower() != 'gzip':
+        return r_response.read(), False
+
+    chunk = r_response.read(chunk_size)
+    if not chunk:
+        return chunk, False
+    if not chunk.startswith(b'\x1f\x8b'):
+        print("Error trying to un-gzip payload: body is not gzip encoded")
+        return chunk + r_response.read(), True
+
+    # 16 + MAX_WBITS: expect gzip header and trailer
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    chunks = list()
+    # the body as recieved, returned if it can not be decompressed
+    raw_chunks = list()
+    decompress_time = 0
+    try:
+        while chunk:
+            raw_chunks.append(chunk)
+            start = time.time()
+            chunks.append(decompressor.decompress(chunk))
+            decompress_time += time.time() - start
+            chunk = r_response.read(chunk_size)
+        start = time.time()
+        chunks.append(decompressor.flush())
+        decompress_time += time.time() - start
+        r_payload = b''.join(chunks)
+    except zlib.error:
+        # the time of the failed decompression is a decompress phase too
+        decompress_time += time.time() - start
+        exc_str = sys.exc_info()[1]
+        print("Error trying to un-gzip payload: %s" % exc_str)
+        # read the rest of the response so the connection can be reused
+        while chunk:
+            chunk = r_response.read(chunk_size)
+            raw_chunks.append(chunk)
+        r_payload = b''.join(raw_chunks)
+    if timings != None:
+        timings['decompress'] = timings.get('decompress', 0) + decompress_time
+    return r_payload, True
+#
+## end http__read_body
+
+###############################################################################################
+# Name: http__skip_body(r_response, max_drain = 65536)
+# Description:  
+#  skips the body of a response whose payload is not needed: a small body is read and dropped 
+#  so the connection can be reused, a larger one is left unread and the connection is closed
+#  by ConnectionPool.release() instead of reading it from the service
+###############################################################################################
+def http__skip_body(r_response, max_drain = 65536) :
+    content_length = r_response.getheader('Content-Length')
+    try:
+        if content_length != None and int(content_length) <= max_drain:
+            r_response.read()
+    except ValueError:
+        pass
+#
+## end http__skip_body
+
+###############################################################################################
+# Name: http__decode_payload(r_payload, r_headers, resource_uri, decompressed = False)
+# Description:  
+#  un-gzip the payload if the response headers specify gzip encoding (unless it was decompressed
+#  while reading it) and load it into a json dictionary if the content type is application/json.
+#  json is loaded directly from the bytes recieved (python 3.6+), without a separate decoded copy.
+#  The seconds spent decompressing/loading json are added to timings['decompress']/['parse'] if
+#  a timings dict is given
+#
+# Returns:
+#   r_payload: the decoded payload, or the payload as recieved if it could not be decoded
+###############################################################################################
+def http__decode_payload(r_payload, r_headers, resource_uri, decompressed = False, timings = None) :
+    if timings == None:
+        timings = dict()
+    # check to  see if the payload is gzip'd - if so un-gzip it
+    if r_payload and not decompressed and ('content-encoding' in r_headers.keys()):
+        if (r_headers['content-encoding'].lower() == 'gzip'):
+            #un-gzip the payload
+            start = time.time()
+            try:
+                r_payload = zlib.decompress(r_payload, 16 + zlib.MAX_WBITS)
+            except zlib.error:
+                exc_str = sys.exc_info()[1]
+                print("Error trying to un-gzip payload: %s" % exc_str)
+            timings['decompress'] = timings.get('decompress', 0) + time.time() - start
+
+    # if a payload is returned in json format then load it into a json dictionary here...
+    if 'content-type' in r_headers.keys() :
+        if ('application/json' in r_headers['content-type']):
+            if (r_payload) : # if there is a resp payload ...
+                start = time.time()
+                try:
+                    if sys.version_info < (3, 6):
+                        r_payload = r_payload.decode('utf-8')
+                    r_payload = json.loads(r_payload)
+                except:
+                    exc_str = sys.exc_info()[0]
+                    print ("Error trying load %s payload to JSON: %s" % (resource_uri, exc_str))
+                timings['parse'] = time.time() - start
+
+    return r_payload
+#
+## end http__decode_payload
+
+###############################################################################################
+# Name: http__retry_after(retry_after)
+# Description:  
+#  parses the value of a Retry-After response header, either seconds or a http date
+#
+# Returns:
+#   seconds to wait, None if the header is missing or invalid
+###############################################################################################
+def http__retry_after(retry_after) :
+    if not retry_after:
+        return None
+    try:
+        return max(0, int(retry_after))
+    except ValueError:
+        pass
+    retry_date = email.utils.parsedate_tz(retry_after)
+    if retry_date:
+        return max(0, email.utils.mktime_tz(retry_date) - time.time())
+    return None
+#
+## end http__retry_after
+
+###############################################################################################
+# Name: http__retry_delay(http_req, status, retry_after, retries)
+# Description:  
+#  decides if a request is retried: idempotent requests (GET, HEAD, OPTIONS) are retried up to
+#  MaxRetries times when they fail or the service answers 503 (Service Unavailable). The delay
+#  is the Retry-After of a 503 response (up to RetryAfterMax) or an exponential backoff with
+#  full jitter: random between 0 and min(BackoffMax, BackoffBase * 2^retries) seconds
+#
+# Arguments:
+#   status: http status of the response, None if the request failed
+#   retry_after: Retry-After header value of the response or None
+#   retries: retries of the request so far
+#
+# Returns:
+#   seconds to wait before the retry, None if the request is not retried
+###############################################################################################
+def http__retry_delay(http_req, status, retry_after, retries) :
+    if (http_req not in retry_methods) or (retries >= retry_settings['MaxRetries']):
+        return None
+    if status != None and status != HTTP_SERVICEUNAVAILABLE:
+        return None
+
+    if status == HTTP_SERVICEUNAVAILABLE:
+        retry_after = http__retry_after(retry_after)
+        if retry_after != None:
+            return min(retry_after, retry_settings['RetryAfterMax'])
+    return random.uniform(0, min(retry_settings['BackoffMax'], retry_settings['BackoffBase'] * (2 ** retries)))
+#
+## end http__retry_delay
+
 ###############################################################################################
 # Name: http__req_common()                                              
 # Description:  
@@ -325,101 +1908,118 @@ def http__req_resp(sut_prop, http_req, resource_uri, rq_headers, rq_body, auth_o
 #       by adding the 'Authorization' header to the request; else the request
 #       is made without this function adding authorization parameters into 
 #       the request headers
+#   cookie_info: optional cookie tracking list of the SUT
+#   conn_pool: optional ConnectionPool of the SUT; the connection is returned to the pool
+#       once the response has been read
+#   read_body: False to skip the response body for requests which only need the status and
+#       headers, the payload returned is None
+#  Failed GET/HEAD/OPTIONS requests and 503 responses to them are retried, see http__retry_delay()
+#  DeadlineExceeded is raised if the deadline of conn_pool expires before the request is issued
+#  The timings of each request are added to the RequestMetrics of conn_pool
 #
 # Returns:
 #   r_payload: this is the response payload.  If the response headers specify
-#       gzip encoding then the payload is un-gzip'd prior to return - otherwise
+#       gzip encoding then the payload is un-gzip'd while it is read - otherwise
 #       it is returned as recieved from the server
 #   r_headers: response headers (keys converted to lower case)
 #   response.status:  the http status code returned from the request                                                 
 ###############################################################################################
-def http__req_common(sut_prop, http_req, resource_uri, rq_headers, rq_body, auth_on_off, cookie_info = None) :
-    ## issue the base request/get the response
-    r_response = http__req_resp(sut_prop, http_req, resource_uri, rq_headers, rq_body, auth_on_off)
-    if r_response:
+def http__req_common(sut_prop, http_req, resource_uri, rq_headers, rq_body, auth_on_off, cookie_info = None, conn_pool = None, read_body = True) :
+    retries = 0
+    while True:
+        http__check_deadline(conn_pool, http_req, resource_uri)
+        # wait for a slot of the SUT concurrency window
+        governor = conn_pool.governor if conn_pool else None
+        governed = governor.acquire() if governor else False
         try:
-            r_payload = r_response.read()
-        except:
-            exc_str = sys.exc_info()[0]
-            print("Error trying to read http response: %s" % exc_str)
-        else:
-            # get the headers associated with the resp
-            # convert the keys to lowercase so that string searches can be made w/o concern for case..    
-            r_headers = dict()
-            for key, value in r_response.getheaders():
-                r_headers[key.lower()] = value
-
-            #handle any http redirect... recursive call here...  
-            if ("location" in r_headers.keys()) and (r_headers['location'] != resource_uri and r_response.status>= 300 and r_response.status < 400):
-                redirected_resource_uri = urlparse(r_headers['location'])
-                return(http__req_common(sut_prop, http_req, redirected_resource_uri.path, rq_headers, rq_body, auth_on_off, cookie_info))
-
-            if not r_response.status:
-                print('SERVICE ERROR: No Response Status found for request %s:%s' % (http_req, resource_uri))
-
-            if cookie_info:
-                cookie_detail = tuple()
-                #set cookie True if Set-Cookie is found, service is not expected to return Cookies in the header
-                if 'set-cookie' in r_headers.keys():
-                    cookie_info[0] = True
-                    cookie_info[2] += 1
-                    # set details of request type and url where cookie was found
-                    cookie_detail = (http_req , resource_uri)
-                    cookie_info[1].append(cookie_detail)
-        
-
-            # check to  see if the payload is gzip'd - if so un-gzip it
-            if ('content-encoding' in r_headers.keys()):
-                if (r_headers['content-encoding'] == 'gzip'):
-                    #un-gzip the payload
-                    try:
-                        if (Python3 == True):
-                            gz_payload = gzip.GzipFile(fileobj=BytesIO(r_payload))
-
-                        else: # Python2
-                            gz_payload = gzip.GzipFile(fileobj=StringIO(r_payload))
-                
-                        r_payload = gz_payload.read()
-
-                    except:
-                        exc_str = sys.exc_info()[0]
-                        print("Error trying to un-gzip payload: %s" % exc_str)
-
-            # if a payload is returned in json format then load it into a json dictionary here...
-            is_json = False
-            if 'content-type' in r_headers.keys() :
-                if ('application/json' in r_headers['content-type']):
-                    is_json = True
-                    if (r_payload) : # if there is a resp payload ...
-                        try:
-                            r_payload = json.loads(r_payload.decode('utf-8'))
-                        except:
-                            exc_str = sys.exc_info()[0]
-                            print ("Error trying load %s payload to JSON: %s" % (resource_uri, exc_str))
-            ''' 
-            #log dump                   
-                # dump the response headers and payload to the text log file
-                if (is_json == True):
-                    if (r_payload):
-                        print("response: %s %s" % (json_string(r_headers), json_string(r_payload)) )
+            start = time.time()
+            timings = dict()
+            ## issue the base request/get the response
+            url, server_connection, r_response = http__send_request(sut_prop, http_req, resource_uri, rq_headers, rq_body, auth_on_off, conn_pool, timings = timings)
+            r_payload, decompressed = None, False
+            if r_response:
+                read_start = time.time()
+                try:
+                    if read_body:
+                        r_payload, decompressed = http__read_body(r_response, timings = timings)
                     else:
-                        print("response: %s" % json_string(r_headers) )
- 
+                        http__skip_body(r_response)
+                except:
+                    exc_str = sys.exc_info()[0]
+                    print("Error trying to read http response: %s" % exc_str)
+                    if conn_pool:
+                        conn_pool.discard(server_connection)
+                    r_response = None
                 else:
-                    if (r_payload):
-                        print("response: %s %s" % (r_headers, r_payload))                                                                                      
-                    else:
-                        print("response: %s" % r_headers)   
-            '''
-
-            return (r_payload, r_headers, r_response.status)
-
-    else:
+                    # response is read completely, the connection can be reused
+                    if conn_pool:
+                        conn_pool.release(url.scheme, url.netloc, server_connection, r_response)
+                timings['download'] = time.time() - read_start - timings.get('decompress', 0)
+            status = r_response.status if r_response else None
+            elapsed = time.time() - start
+            if governed:
+                governor.release(elapsed, status)
+                governed = False
+        finally:
+            # the request raised (e.g. DeadlineExceeded of the session login of http__set_request_auth())
+            if governed:
+                governor.abandon()
+        if conn_pool and conn_pool.recorder:
+            conn_pool.recorder.record(http_req, resource_uri, rq_headers, rq_body, r_response, r_payload, start, retries, conn_pool.assertion_id, decompressed, timings = timings)
+
+        # retry idempotent requests which failed or were answered with 503
+        delay = http__retry_delay(http_req, status, r_response.getheader('Retry-After') if r_response else None, retries)
+        if delay == None:
+            break
+        http__add_metrics(conn_pool, http_req, resource_uri, status, elapsed, timings)
+        remaining = http__check_deadline(conn_pool, http_req, resource_uri)
+        if remaining != None and delay >= remaining:
+            raise DeadlineExceeded('deadline expires before the retry of %s %s' % (http_req, resource_uri))
+        retries += 1
+        if conn_pool:
+            conn_pool.count_retry(status)
+        print('Retrying %s %s in %.1f seconds (retry %s of %s, %s)' % (http_req, resource_uri, delay, retries, retry_settings['MaxRetries'], 'HTTP status %s' % status if status else 'request failed'))
+        time.sleep(delay)
+
+    if not r_response:
         #print('WARN: No response retreived from %s' %(resource_uri))
+        http__add_metrics(conn_pool, http_req, resource_uri, None, elapsed, timings)
         return None, None, None
+
+    # get the headers associated with the resp (keys converted to lower case)
+    r_headers = http__response_headers(r_response.getheaders())
+
+    #handle any http redirect... recursive call here...  
+    redirected_resource_uri = http__redirect_path(r_headers, r_response.status, resource_uri)
+    if redirected_resource_uri:
+        http__add_metrics(conn_pool, http_req, resource_uri, r_response.status, elapsed, timings)
+        return(http__req_common(sut_prop, http_req, redirected_resource_uri, rq_headers, rq_body, auth_on_off, cookie_info, conn_pool, read_body))
+
+    if not r_response.status:
+        print('SERVICE ERROR: No Response Status found for request %s:%s' % (http_req, resource_uri))
+
+    http__track_cookie(cookie_info, r_headers, http_req, resource_uri)
+
+    decode_start = time.time()
+    r_payload = http__decode_payload(r_payload, r_headers, resource_uri, decompressed, timings)
+    http__add_metrics(conn_pool, http_req, resource_uri, r_response.status, elapsed + time.time() - decode_start, timings)
+
+    return (r_payload, r_headers, r_response.status)
 #
 ## end http__req_common
 
+###############################################################################################
+# Name: http__add_metrics(conn_pool, http_req, resource_uri, status, elapsed, timings)
+# Description:  
+#  adds the timings of a request to the RequestMetrics of conn_pool (if any), for the assertion
+#  currently issuing requests
+###############################################################################################
+def http__add_metrics(conn_pool, http_req, resource_uri, status, elapsed, timings) :
+    if conn_pool and conn_pool.metrics:
+        conn_pool.metrics.add(http_req, resource_uri, conn_pool.assertion_id, status, elapsed, timings)
+#
+## end http__add_metrics
+
 ###############################################################################################
 # Name: http__modify_resource()                                              
 # Description: issue a request to the server connection/URI which
@@ -441,7 +2041,7 @@ def http__req_common(sut_prop, http_req, resource_uri, rq_headers, rq_body, auth
 #   r_headers: response headers (keys converted to lower case)
 #   r_status:  the http status code returned from the request
 ###############################################################################################
-def http__modify_resource(sut_prop, rq_type, resource_uri, rq_headers, rq_body, auth_on_off) :
+def http__modify_resource(sut_prop, rq_type, resource_uri, rq_headers, rq_body, auth_on_off, conn_pool = None) :
 
     if (rq_headers == None):
         rq_headers = create_request_headers()
@@ -451,33 +2051,34 @@ def http__modify_resource(sut_prop, rq_type, resource_uri, rq_headers, rq_body,
     rq_body = json.dumps(rq_body)        
 
     # issue the request
-    return(http__req_common(sut_prop, rq_type, resource_uri, rq_headers, rq_body, auth_on_off ))
+    return(http__req_common(sut_prop, rq_type, resource_uri, rq_headers, rq_body, auth_on_off, conn_pool = conn_pool))
 
 #
 ## end http__modify_resource
 
 ###############################################################################################
-# Name: http__GET(sut_prop, resource_uri, rq_headers, auth_on_off, cookie_info = None)                                              
+# Name: http__GET(sut_prop, resource_uri, rq_headers, auth_on_off, cookie_info = None, conn_pool = None, read_body = True)                                              
 #   Issue a GET request for resource uri thru base http__req_common() 
 #   Takes service connection prop, resource uri, request header dict, authorization 'on' or 'off'
-#   optional cookie info to track cookies in request response
+#   optional cookie info to track cookies in request response, read_body False to skip the 
+#   response payload when only the status and headers are needed
 # Returns:
 #   - Response payload dict or string depending on 'content-type' in request header. If
 #       'application/json' then payload will be a dict. 
 #   - Response Headers dict: header keys in lower case
 #   - Response Status code: http status code returned from the request                                        
 ###############################################################################################
-def http__GET(sut_prop, resource_uri, rq_headers, auth_on_off, cookie_info = None ) :      
+def http__GET(sut_prop, resource_uri, rq_headers, auth_on_off, cookie_info = None, conn_pool = None, read_body = True) :      
     if (rq_headers == None):
         rq_headers = create_request_headers()
     # issue the GET on the resource...
-    return (http__req_common(sut_prop, "GET", resource_uri, rq_headers, None, auth_on_off, cookie_info))
+    return (http__req_common(sut_prop, "GET", resource_uri, rq_headers, None, auth_on_off, cookie_info, conn_pool, read_body))
 
 #
 ## end http__GET
 
 ###############################################################################################
-# Name: http__POST(sut_prop, resource_uri, rq_headers, rq_body, auth_on_off)                                              
+# Name: http__POST(sut_prop, resource_uri, rq_headers, rq_body, auth_on_off, conn_pool = None)                                              
 #   Issue a POST request for resource uri thru base http__req_common() 
 #   Takes service connection prop, resource uri, request header dict, request body authorization 
 #   'on' or 'off'
@@ -487,16 +2088,16 @@ def http__GET(sut_prop, resource_uri, rq_headers, auth_on_off, cookie_info = Non
 #   - Response Headers dict: header keys in lower case
 #   - Response Status code: http status code returned from the request     
 ###############################################################################################
-def http__POST(sut_prop, resource_uri, rq_headers, rq_body, auth_on_off) :
+def http__POST(sut_prop, resource_uri, rq_headers, rq_body, auth_on_off, conn_pool = None) :
     if (rq_headers == None):
         rq_headers = create_request_headers()
-    return(http__modify_resource(sut_prop, "POST", resource_uri, rq_headers, rq_body, auth_on_off))
+    return(http__modify_resource(sut_prop, "POST", resource_uri, rq_headers, rq_body, auth_on_off, conn_pool))
 
 #
 ## end http__POST
 
 ###############################################################################################
-# Name: http__TRACE(sut_prop, resource_uri, rq_headers, rq_body, auth_on_off, cookie_info = None)                                              
+# Name: http__TRACE(sut_prop, resource_uri, rq_headers, rq_body, auth_on_off, cookie_info = None, conn_pool = None)                                              
 #   Issue a TRACE request for resource uri thru base http__req_common() 
 #   Takes service connection prop, resource uri, request header dict, request body authorization 
 #   'on' or 'off'. optional cookie info to track cookies in request response
@@ -506,16 +2107,16 @@ def http__POST(sut_prop, resource_uri, rq_headers, rq_body, auth_on_off) :
 #   - Response Headers dict: header keys in lower case
 #   - Response Status code: http status code returned from the request  
 ###############################################################################################
-def http__TRACE(sut_prop, resource_uri, rq_headers, rq_body, auth_on_off, cookie_info = None) :
+def http__TRACE(sut_prop, resource_uri, rq_headers, rq_body, auth_on_off, cookie_info = None, conn_pool = None) :
     if (rq_headers == None):
         rq_headers = create_request_headers()
-    return(http__req_common(sut_prop, "TRACE", resource_uri, rq_headers, rq_body, auth_on_off, cookie_info ))
+    return(http__req_common(sut_prop, "TRACE", resource_uri, rq_headers, rq_body, auth_on_off, cookie_info, conn_pool))
 
 #
 ## end http__TRACE
 
 ###############################################################################################
-# Name: http__OPTIONS(sut_prop, resource_uri, rq_headers, rq_body, auth_on_off)                                              
+# Name: http__OPTIONS(sut_prop, resource_uri, rq_headers, rq_body, auth_on_off, conn_pool = None)                                              
 #   Issue a OPTIONS request for resource uri thru base http__req_common() 
 #   Takes service connection prop, resource uri, request header dict, request body authorization 
 #   'on' or 'off'. optional cookie info to track cookies in request response
@@ -525,16 +2126,16 @@ def http__TRACE(sut_prop, resource_uri, rq_headers, rq_body, auth_on_off, cookie
 #   - Response Headers dict: header keys in lower case
 #   - Response Status code: http status code returned from the request  
 ###############################################################################################
-def http__OPTIONS(sut_prop, resource_uri, rq_headers, rq_body, auth_on_off, cookie_info = None) :
+def http__OPTIONS(sut_prop, resource_uri, rq_headers, rq_body, auth_on_off, cookie_info = None, conn_pool = None) :
     if (rq_headers == None):
         rq_headers = create_request_headers()
-    return(http__req_common(sut_prop, "OPTIONS", resource_uri, rq_headers, rq_body, auth_on_off, cookie_info ))
+    return(http__req_common(sut_prop, "OPTIONS", resource_uri, rq_headers, rq_body, auth_on_off, cookie_info, conn_pool))
 
 #
 ## end http__OPTIONS
 
 ###############################################################################################
-# Name: http__PATCH(sut_prop, resource_uri, rq_headers, rq_body, auth_on_off)                                              
+# Name: http__PATCH(sut_prop, resource_uri, rq_headers, rq_body, auth_on_off, conn_pool = None)                                              
 #   Issue a PATCH request for resource uri thru base http__req_common() 
 #   Takes service connection prop, resource uri, request header dict, request body authorization 
 #   'on' or 'off'
@@ -544,15 +2145,15 @@ def http__OPTIONS(sut_prop, resource_uri, rq_headers, rq_body, auth_on_off, cook
 #   - Response Headers dict: header keys in lower case
 #   - Response Status code: http status code returned from the request           
 ###############################################################################################
-def http__PATCH(sut_prop, resource_uri, rq_headers, rq_body, auth_on_off) :
+def http__PATCH(sut_prop, resource_uri, rq_headers, rq_body, auth_on_off, conn_pool = None) :
     if (rq_headers == None):
         rq_headers = create_request_headers()
-    return(http__modify_resource(sut_prop, "PATCH", resource_uri, rq_headers, rq_body, auth_on_off))
+    return(http__modify_resource(sut_prop, "PATCH", resource_uri, rq_headers, rq_body, auth_on_off, conn_pool))
 #
 ## end http__PATCH
 
 ###############################################################################################
-# Name: http__PUT(sut_prop, resource_uri, rq_headers, rq_body, auth_on_off)                                              
+# Name: http__PUT(sut_prop, resource_uri, rq_headers, rq_body, auth_on_off, conn_pool = None)                                              
 #   Issue a PUT request for resource uri thru base http__req_common() 
 #   Takes service connection prop, resource uri, request header dict, request body authorization 
 #   'on' or 'off'
@@ -562,16 +2163,16 @@ def http__PATCH(sut_prop, resource_uri, rq_headers, rq_body, auth_on_off) :
 #   - Response Headers dict: header keys in lower case
 #   - Response Status code: http status code returned from the request          
 ###############################################################################################
-def http__PUT(sut_prop, resource_uri, rq_headers, rq_body, auth_on_off) :
+def http__PUT(sut_prop, resource_uri, rq_headers, rq_body, auth_on_off, conn_pool = None) :
     if (rq_headers == None):
         rq_headers = create_request_headers()
-    return(http__modify_resource(sut_prop, "PUT", resource_uri, rq_headers, rq_body, auth_on_off))
+    return(http__modify_resource(sut_prop, "PUT", resource_uri, rq_headers, rq_body, auth_on_off, conn_pool))
 
 #
 ## end http__PUT
 
 ###############################################################################################
-# Name: http__HEAD(sut_prop, resource_uri, rq_headers, auth_on_off, cookie_info = None)                                              
+# Name: http__HEAD(sut_prop, resource_uri, rq_headers, auth_on_off, cookie_info = None, conn_pool = None)                                              
 #   Issue a HEAD request for resource uri thru base http__req_common() 
 #   Takes service connection prop, resource uri, request header dict, authorization 'on' or 'off'
 #   optional cookie info to track cookies in request response
@@ -581,16 +2182,16 @@ def http__PUT(sut_prop, resource_uri, rq_headers, rq_body, auth_on_off) :
 #   - Response Headers dict: header keys in lower case
 #   - Response Status code: http status code returned from the request                
 ###############################################################################################
-def http__HEAD(sut_prop, resource_uri, rq_headers, auth_on_off, cookie_info = None) :
+def http__HEAD(sut_prop, resource_uri, rq_headers, auth_on_off, cookie_info = None, conn_pool = None) :
     if (rq_headers == None):
         rq_headers = create_request_headers()
-    return(http__req_common(sut_prop, "HEAD", resource_uri, rq_headers, None, auth_on_off, cookie_info))
+    return(http__req_common(sut_prop, "HEAD", resource_uri, rq_headers, None, auth_on_off, cookie_info, conn_pool))
 #
 ## end http__HEAD
 
 
 ###############################################################################################
-# Name: http__DELETE(sut_prop, resource_uri, rq_headers, auth_on_off)                                              
+# Name: http__DELETE(sut_prop, resource_uri, rq_headers, auth_on_off, conn_pool = None)                                              
 #   Issue a DELETE request for resource uri thru base http__req_common() 
 #   Takes service connection prop, resource uri, request header dict, authorization 'on' or 'off'
 # Returns:
@@ -599,10 +2200,10 @@ def http__HEAD(sut_prop, resource_uri, rq_headers, auth_on_off, cookie_info = No
 #   - Response Headers dict: header keys in lower case
 #   - Response Status code: http status code returned from the request  
 ###############################################################################################
-def http__DELETE(sut_prop, resource_uri, rq_headers, auth_on_off) :
+def http__DELETE(sut_prop, resource_uri, rq_headers, auth_on_off, conn_pool = None) :
     if (rq_headers == None):
         rq_headers = create_request_headers()
-    return(http__modify_resource(sut_prop, "DELETE", resource_uri, rq_headers, None, auth_on_off))
+    return(http__modify_resource(sut_prop, "DELETE", resource_uri, rq_headers, None, auth_on_off, conn_pool))
 
 #
 ## end http__DELETE
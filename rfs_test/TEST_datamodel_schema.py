@@ -82,7 +82,7 @@ def Assertion_7_0_1(self, log):
 ## end Assertion_7_0_1
 
 ###################################################################################################
-# Name: Assertion_7_1_1(self, log)  Type Identifiers in JSON                                
+# Name: Assertion_7_1_1(self, log, uri, json_payload, headers, status)  Type Identifiers in JSON                                
 # Assertion text: 
 #  Types used within a JSON payload shall be defined in, or referenced, by the metadata document. 
 #  metadata document is the document retreived from $metadata 
@@ -93,44 +93,35 @@ def Assertion_7_0_1(self, log):
 #             referenced in the $metadata and try to find it within the References element of each
 #             schema file.
 ###################################################################################################
-def Assertion_7_1_1(self, log):
-    log.AssertionID = '7.1.1'
+def Assertion_7_1_1(self, log, uri, json_payload, headers, status):
     assertion_status =  log.PASS
-    log.assertion_log('BEGIN_ASSERTION', None)
-    authorization = 'on'
-
-    rq_headers = self.request_headers()
 
     csdl_schema_model = self.csdl_schema_model
-    relative_uris = self.relative_uris # contains all the urls found in every navigation property of all schemas
-    
-    for relative_uri in relative_uris:
-        json_payload, headers, status = self.http_GET(relative_uris[relative_uri], rq_headers, authorization)
-        assertion_status_ = self.response_status_check(relative_uris[relative_uri], status, log)      
+
+    assertion_status_ = self.response_status_check(uri, status, log)      
+    # manage assertion status
+    assertion_status = log.status_fixup(assertion_status,assertion_status_)
+    if assertion_status_ != log.PASS: 
+        return (assertion_status)
+    elif not json_payload:
+        assertion_status_ = log.WARN
         # manage assertion status
         assertion_status = log.status_fixup(assertion_status,assertion_status_)
-        if assertion_status_ != log.PASS: 
-            continue
-        elif not json_payload:
-            assertion_status_ = log.WARN
-            # manage assertion status
-            assertion_status = log.status_fixup(assertion_status,assertion_status_)
-            log.assertion_log('line', 'No response body returned for resource %s. This assertion for the resource could not be completed' % (relative_uris[relative_uri]))
-        else:
-            if '@odata.type' in json_payload:
-                namespace, typename = rf_utility.parse_odata_type(json_payload['@odata.type'])
-                if namespace and typename:
-                    if self.metadata_document_structure:
-                        # we already have a metadata document mapped out in metadata_document_structure for this service in rf_utility
-                        type_found = csdl_schema_model.verify_resource_metadata_reference(namespace, typename, self.metadata_document_structure)
-                        if not type_found:
-                            assertion_status = log.FAIL
-                            log.assertion_log('line', "Type used within json payload for resource: %s, '@odata.type': %s is not defined in or referenced by the service's $metadata document: %s as expected" % (relative_uris[relative_uri], json_payload['@odata.type'], self.Redfish_URIs['Service_Metadata_Doc']))  
-                    else:
-                        assertion_status = log.WARN
-                        log.assertion_log('line', 'Service $metadata document %s not found' % (self.Redfish_URIs['Service_Metadata_Doc']))
+        log.assertion_log('line', 'No response body returned for resource %s. This assertion for the resource could not be completed' % (uri))
+    else:
+        if '@odata.type' in json_payload:
+            namespace, typename = rf_utility.parse_odata_type(json_payload['@odata.type'])
+            if namespace and typename:
+                if self.metadata_document_structure:
+                    # we already have a metadata document mapped out in metadata_document_structure for this service in rf_utility
+                    type_found = csdl_schema_model.verify_resource_metadata_reference(namespace, typename, self.metadata_document_structure)
+                    if not type_found:
+                        assertion_status = log.FAIL
+                        log.assertion_log('line', "Type used within json payload for resource: %s, '@odata.type': %s is not defined in or referenced by the service's $metadata document: %s as expected" % (uri, json_payload['@odata.type'], self.Redfish_URIs['Service_Metadata_Doc']))  
+                else:
+                    assertion_status = log.WARN
+                    log.assertion_log('line', 'Service $metadata document %s not found' % (self.Redfish_URIs['Service_Metadata_Doc']))
 
-    log.assertion_log(assertion_status, None)
     return (assertion_status)
 #
 ## end Assertion 7.1.1
@@ -396,8 +387,9 @@ def _Assertion_7_4_11(self, log):
     relative_uris = self.relative_uris
     #find alias in Include first?
 
-    for relative_uri in relative_uris:
-        json_payload, headers, status = self.http_GET(relative_uris[relative_uri], rq_headers, authorization)
+    # responses of the relative uris from the resource store (GET concurrently if not stored), processed in order
+    responses = self.http_GET_stored_iter(relative_uris.values(), rq_headers, authorization)
+    for relative_uri, (json_payload, headers, status) in zip(relative_uris, responses):
         assertion_status_ = self.response_status_check(relative_uris[relative_uri], status, log)      
         # manage assertion status
         assertion_status = log.status_fixup(assertion_status,assertion_status_)
@@ -447,7 +439,7 @@ def verify_typename_in_json_metadata(typename, json_metadata):
     return False
            
 ###################################################################################################
-# Name: Assertion_7_4_11(self, log)  Additional Properties   - checked via json metadata                                        
+# Name: Assertion_7_4_11(self, log, uri, json_payload, headers, status)  Additional Properties   - checked via json metadata                                        
 # Assertion text: 
 # The AdditionalProperties annotation term is used to specify whether a type can contain additional 
 # properties outside of those defined. Types annotated with the AdditionalProperties annotation with 
@@ -458,49 +450,38 @@ def verify_typename_in_json_metadata(typename, json_metadata):
 # String="Instances of this type may contain properties in addition to those declared in $metadata", 
 # does it mean the context url of the resource?
 ###################################################################################################
-def Assertion_7_4_11(self, log):
-    log.AssertionID = '7.4.11'
+def Assertion_7_4_11(self, log, uri, json_payload, headers, status):
     assertion_status =  log.PASS
-    log.assertion_log('BEGIN_ASSERTION', None)
-
-    authorization = 'on'
-    rq_headers = self.request_headers()
-
-    csdl_schema_model = self.csdl_schema_model
-    relative_uris = self.relative_uris
-    #find alias in Include first?
 
     #camelcased? need to verify this...
     annotation_term = 'additionalProperties'
 
-    for relative_uri in relative_uris:
-        json_payload, headers, status = self.http_GET(relative_uris[relative_uri], rq_headers, authorization)
-        assertion_status_ = self.response_status_check(relative_uris[relative_uri], status, log)      
+    assertion_status_ = self.response_status_check(uri, status, log)      
+    # manage assertion status
+    assertion_status = log.status_fixup(assertion_status,assertion_status_)
+    if assertion_status_ != log.PASS: 
+        return (assertion_status)
+    elif not json_payload:
+        assertion_status_ = log.WARN
         # manage assertion status
         assertion_status = log.status_fixup(assertion_status,assertion_status_)
-        if assertion_status_ != log.PASS: 
-            continue
-        elif not json_payload:
-            assertion_status_ = log.WARN
-            # manage assertion status
-            assertion_status = log.status_fixup(assertion_status,assertion_status_)
-            log.assertion_log('line', 'No response body returned for resource %s. This assertion for the resource could not be completed' % (relative_uris[relative_uri]))
-        else:
-            if '@odata.type' in json_payload:
-                namespace, typename = rf_utility.parse_odata_type(json_payload['@odata.type'])
-                if namespace and typename:
-                    json_metadata, schema_file = rf_utility.get_resource_json_metadata(namespace, self.json_directory)     
-                    if json_metadata and schema_file:           
-                        if verify_typename_in_json_metadata(typename, json_metadata):
-                            if annotation_term in json_metadata['definitions'][typename]:
-                                if not json_metadata['definitions'][typename][annotation_term]:
-                                    # if value is False then check if there are any additional properties, which it shouldnt
-                                    if 'properties' in json_metadata['definitions'][typename]:
-                                        for property_key in json_payload:
-                                            if property_key not in json_metadata['definitions'][typename]['properties']:
-                                                assertion_status = log.FAIL
-                                                log.assertion_log('line', "~ Resource: %s of type: %s has Annotation: '%s' set to 'False' in its schema document %s, but additional property: %s found in resource payload" % (json_payload['@odata.id'], namespace, annotation_term, schema_file, property_key))  
-    log.assertion_log(assertion_status, None)
+        log.assertion_log('line', 'No response body returned for resource %s. This assertion for the resource could not be completed' % (uri))
+    else:
+        if '@odata.type' in json_payload:
+            namespace, typename = rf_utility.parse_odata_type(json_payload['@odata.type'])
+            if namespace and typename:
+                json_metadata, schema_file = rf_utility.get_resource_json_metadata(namespace, self.json_directory)     
+                if json_metadata and schema_file:           
+                    if verify_typename_in_json_metadata(typename, json_metadata):
+                        if annotation_term in json_metadata['definitions'][typename]:
+                            if not json_metadata['definitions'][typename][annotation_term]:
+                                # if value is False then check if there are any additional properties, which it shouldnt
+                                if 'properties' in json_metadata['definitions'][typename]:
+                                    for property_key in json_payload:
+                                        if property_key not in json_metadata['definitions'][typename]['properties']:
+                                            assertion_status = log.FAIL
+                                            log.assertion_log('line', "~ Resource: %s of type: %s has Annotation: '%s' set to 'False' in its schema document %s, but additional property: %s found in resource payload" % (json_payload['@odata.id'], namespace, annotation_term, schema_file, property_key))  
+
     return (assertion_status)
 
 ###################################################################################################
@@ -534,8 +515,9 @@ def _Assertion_7_4_13(self, log):
     relative_uris = self.relative_uris
     #find alias in Include first?
 
-    for relative_uri in relative_uris:
-        json_payload, headers, status = self.http_GET(relative_uris[relative_uri], rq_headers, authorization)
+    # responses of the relative uris from the resource store (GET concurrently if not stored), processed in order
+    responses = self.http_GET_stored_iter(relative_uris.values(), rq_headers, authorization)
+    for relative_uri, (json_payload, headers, status) in zip(relative_uris, responses):
         assertion_status_ = self.response_status_check(relative_uris[relative_uri], status, log)      
         # manage assertion status
         assertion_status = log.status_fixup(assertion_status,assertion_status_)
@@ -576,43 +558,34 @@ def _Assertion_7_4_13(self, log):
 # If a value is unknown, then null is an acceptable values in most cases. 
 # required is True by default, so unless it is a False, it should be in the payload with a value or null
 ###################################################################################################
-def Assertion_7_4_13(self, log):
-    log.AssertionID = '7.4.13'
+def Assertion_7_4_13(self, log, uri, json_payload, headers, status):
     assertion_status =  log.PASS
-    log.assertion_log('BEGIN_ASSERTION', None)
-
-    authorization = 'on'
-    rq_headers = self.request_headers()
 
-    csdl_schema_model = self.csdl_schema_model
-    relative_uris = self.relative_uris
     annotation_term = 'required'
 
-    for relative_uri in relative_uris:
-        json_payload, headers, status = self.http_GET(relative_uris[relative_uri], rq_headers, authorization)
-        assertion_status_ = self.response_status_check(relative_uris[relative_uri], status, log)      
+    assertion_status_ = self.response_status_check(uri, status, log)      
+    # manage assertion status
+    assertion_status = log.status_fixup(assertion_status,assertion_status_)
+    if assertion_status_ != log.PASS: 
+        return (assertion_status)
+    elif not json_payload:
+        assertion_status_ = log.WARN
         # manage assertion status
         assertion_status = log.status_fixup(assertion_status,assertion_status_)
-        if assertion_status_ != log.PASS: 
-            continue
-        elif not json_payload:
-            assertion_status_ = log.WARN
-            # manage assertion status
-            assertion_status = log.status_fixup(assertion_status,assertion_status_)
-            log.assertion_log('line', 'No response body returned for resource %s. This assertion for the resource could not be completed' % (relative_uris[relative_uri]))
-        else:
-            if '@odata.type' in json_payload:
-                namespace, typename = rf_utility.parse_odata_type(json_payload['@odata.type'])
-                if namespace and typename:
-                    json_metadata, schema_file = rf_utility.get_resource_json_metadata(namespace, self.json_directory)     
-                    if json_metadata and schema_file:           
-                        if verify_typename_in_json_metadata(typename, json_metadata):
-                            if annotation_term in json_metadata['definitions'][typename]:
-                                for req_prop in json_metadata['definitions'][typename][annotation_term]:                                       
-                                    if req_prop not in json_payload.keys():
-                                        assertion_status = log.FAIL
-                                        log.assertion_log('line', "~ Resource: %s of type: %s has Annotation: '\%s'\ for property: %s in its schema document %s, but property not found in resource payload" % (json_payload['@odata.id'], namespace, annotation_term, req_prop, schema_file))                     
-    log.assertion_log(assertion_status, None)
+        log.assertion_log('line', 'No response body returned for resource %s. This assertion for the resource could not be completed' % (uri))
+    else:
+        if '@odata.type' in json_payload:
+            namespace, typename = rf_utility.parse_odata_type(json_payload['@odata.type'])
+            if namespace and typename:
+                json_metadata, schema_file = rf_utility.get_resource_json_metadata(namespace, self.json_directory)     
+                if json_metadata and schema_file:           
+                    if verify_typename_in_json_metadata(typename, json_metadata):
+                        if annotation_term in json_metadata['definitions'][typename]:
+                            for req_prop in json_metadata['definitions'][typename][annotation_term]:                                       
+                                if req_prop not in json_payload.keys():
+                                    assertion_status = log.FAIL
+                                    log.assertion_log('line', "~ Resource: %s of type: %s has Annotation: '\%s'\ for property: %s in its schema document %s, but property not found in resource payload" % (json_payload['@odata.id'], namespace, annotation_term, req_prop, schema_file))                     
+
     return (assertion_status)
 
 ###################################################################################################
@@ -628,55 +601,45 @@ def check_property_in_payload(property, json_payload):
     return True
 
 ###################################################################################################
-# Name: Assertion_7_4_14(self, log)  Required Properties  - checked via xml schema                                     
+# Name: Assertion_7_4_14(self, log, uri, json_payload, headers, status)  Required Properties  - checked via xml schema                                     
 # Description: 
 # Assertion text: required property should be annotated with Nullable = False
 # cannot contain null values, (not necc to have the property in the payload?)
 ###################################################################################################
-def Assertion_7_4_14(self, log):
-    log.AssertionID = '7.4.14'
+def Assertion_7_4_14(self, log, uri, json_payload, headers, status):
     assertion_status =  log.PASS
-    log.assertion_log('BEGIN_ASSERTION', None)
-
-    authorization = 'on'
-    rq_headers = self.request_headers()
 
     csdl_schema_model = self.csdl_schema_model
-    relative_uris = self.relative_uris
-    #find alias in Include first?
 
-    for relative_uri in relative_uris:
-        json_payload, headers, status = self.http_GET(relative_uris[relative_uri], rq_headers, authorization)
-        assertion_status_ = self.response_status_check(relative_uris[relative_uri], status, log)      
+    assertion_status_ = self.response_status_check(uri, status, log)      
+    # manage assertion status
+    assertion_status = log.status_fixup(assertion_status,assertion_status_)
+    if assertion_status_ != log.PASS: 
+        return (assertion_status)
+    elif not json_payload:
+        assertion_status_ = log.WARN
         # manage assertion status
         assertion_status = log.status_fixup(assertion_status,assertion_status_)
-        if assertion_status_ != log.PASS: 
-            continue
-        elif not json_payload:
-            assertion_status_ = log.WARN
-            # manage assertion status
-            assertion_status = log.status_fixup(assertion_status,assertion_status_)
-            log.assertion_log('line', 'No response body returned for resource %s. This assertion for the resource could not be completed' % (relative_uris[relative_uri]))
-        else:
-            if '@odata.type' in json_payload:
-                namespace, typename = csdl_schema_model.get_resource_namespace_typename(json_payload['@odata.type'])
-                if namespace and typename:
-                    #structural property
-                    for property in typename.Properties:
-                        if property.Nullable == 'false':
-                            #check if the payload contains the key and its value
-                            if not check_property_in_payload(property, json_payload):
-                                assertion_status = log.FAIL
-                                log.assertion_log('line', "Resource %s contains a Property: %s which has Annotation 'Nullable' set to 'false' but property's value is null in its resource urls payload %s" % (typename.Name, property.Name, relative_uris[relative_uri]))
-                                
-                    for navproperty in typename.NavigationProperties:
-                        if navproperty.Nullable == 'false':
-                            #check if the payload contains the key and its value
-                            if not check_property_in_payload(navproperty, json_payload):
-                                assertion_status = log.FAIL
-                                log.assertion_log('line', "Resource %s contains a Navigation Property: %s which has Annotation 'Nullable' set to 'false' but property's value is null in its resource urls payload %s" % (typename.Name, property.Name, relative_uris[relative_uri]))
-                                
-    log.assertion_log(assertion_status, None)
+        log.assertion_log('line', 'No response body returned for resource %s. This assertion for the resource could not be completed' % (uri))
+    else:
+        if '@odata.type' in json_payload:
+            namespace, typename = csdl_schema_model.get_resource_namespace_typename(json_payload['@odata.type'])
+            if namespace and typename:
+                #structural property
+                for property in typename.Properties:
+                    if property.Nullable == 'false':
+                        #check if the payload contains the key and its value
+                        if not check_property_in_payload(property, json_payload):
+                            assertion_status = log.FAIL
+                            log.assertion_log('line', "Resource %s contains a Property: %s which has Annotation 'Nullable' set to 'false' but property's value is null in its resource urls payload %s" % (typename.Name, property.Name, uri))
+
+                for navproperty in typename.NavigationProperties:
+                    if navproperty.Nullable == 'false':
+                        #check if the payload contains the key and its value
+                        if not check_property_in_payload(navproperty, json_payload):
+                            assertion_status = log.FAIL
+                            log.assertion_log('line', "Resource %s contains a Navigation Property: %s which has Annotation 'Nullable' set to 'false' but property's value is null in its resource urls payload %s" % (typename.Name, property.Name, uri))
+
     return (assertion_status)
 
 ###################################################################################################
@@ -698,8 +661,9 @@ def _Assertion_7_4_14(self, log):
     annotation_term = 'required'
     nullable_term = 'nullable'
 
-    for relative_uri in relative_uris:
-        json_payload, headers, status = self.http_GET(relative_uris[relative_uri], rq_headers, authorization)
+    # responses of the relative uris from the resource store (GET concurrently if not stored), processed in order
+    responses = self.http_GET_stored_iter(relative_uris.values(), rq_headers, authorization)
+    for relative_uri, (json_payload, headers, status) in zip(relative_uris, responses):
         assertion_status_ = self.response_status_check(relative_uris[relative_uri], status, log)      
         # manage assertion status
         assertion_status = log.status_fixup(assertion_status,assertion_status_)
@@ -872,8 +836,9 @@ def Assertion_7_4_18(self, log):
     relative_uris = self.relative_uris
     #find alias in Include first?
 
-    for relative_uri in relative_uris:
-        json_payload, headers, status = self.http_GET(relative_uris[relative_uri], rq_headers, authorization)
+    # responses of the relative uris from the resource store (GET concurrently if not stored), processed in order
+    responses = self.http_GET_stored_iter(relative_uris.values(), rq_headers, authorization)
+    for relative_uri, (json_payload, headers, status) in zip(relative_uris, responses):
         assertion_status_ = self.response_status_check(relative_uris[relative_uri], status, log)      
         # manage assertion status
         assertion_status = log.status_fixup(assertion_status,assertion_status_)
@@ -923,8 +888,9 @@ def Assertion_7_4_18_1(self, log):
     relative_uris = self.relative_uris
     #find alias in Include first?
 
-    for relative_uri in relative_uris:
-        json_payload, headers, status = self.http_GET(relative_uris[relative_uri], rq_headers, authorization)
+    # responses of the relative uris from the resource store (GET concurrently if not stored), processed in order
+    responses = self.http_GET_stored_iter(relative_uris.values(), rq_headers, authorization)
+    for relative_uri, (json_payload, headers, status) in zip(relative_uris, responses):
         assertion_status_ = self.response_status_check(relative_uris[relative_uri], status, log)      
         # manage assertion status
         assertion_status = log.status_fixup(assertion_status,assertion_status_)
@@ -975,8 +941,9 @@ def Assertion_7_4_18_2(self, log):
     relative_uris = self.relative_uris
     #find alias in Include first?
 
-    for relative_uri in relative_uris:
-        json_payload, headers, status = self.http_GET(relative_uris[relative_uri], rq_headers, authorization)
+    # responses of the relative uris from the resource store (GET concurrently if not stored), processed in order
+    responses = self.http_GET_stored_iter(relative_uris.values(), rq_headers, authorization)
+    for relative_uri, (json_payload, headers, status) in zip(relative_uris, responses):
         assertion_status_ = self.response_status_check(relative_uris[relative_uri], status, log)      
         # manage assertion status
         assertion_status = log.status_fixup(assertion_status,assertion_status_)
@@ -1171,29 +1138,38 @@ def Assertion_7_5_1_3(self, log):
     return (assertion_status)
 ## end Assertion 7_5_1_3
 
+###################################################################################################
+# resource_assertions: the assertions which check each resource, (assertion, members) with
+# members False for the assertions of relative_uris_no_members. rfs_test.run() runs them with the
+# resource assertions of the other modules in one pass over the resources, see
+# SUT.visit_resources()
+###################################################################################################
+resource_assertions = [
+    (Assertion_7_1_1, True),
+    (Assertion_7_4_11, True),
+    (Assertion_7_4_13, True),
+    (Assertion_7_4_14, True)
+]
+
 ###################################################################################################
 # run(self, log):
 # Takes sut obj and logger obj 
 ###################################################################################################
 def run(self, log):
     #Section 7
-    assertion_status = Assertion_7_0_1(self, log)
-    assertion_status = Assertion_7_1_1(self, log)
-    assertion_status = Assertion_7_4_3(self, log)
-    assertion_status = Assertion_7_4_4(self, log)
-    assertion_status = Assertion_7_4_6(self, log)
-    assertion_status = Assertion_7_4_8(self, log)
-    assertion_status = Assertion_7_4_9(self, log)
-    assertion_status = Assertion_7_4_10(self, log)      
-    assertion_status = Assertion_7_4_11(self, log)
-    assertion_status = Assertion_7_4_13(self, log)        
-    assertion_status = Assertion_7_4_14(self, log)
-    assertion_status = Assertion_7_4_16(self, log)
+    assertion_status = self.run_assertion(Assertion_7_0_1, log)
+    assertion_status = self.run_assertion(Assertion_7_4_3, log)
+    assertion_status = self.run_assertion(Assertion_7_4_4, log)
+    assertion_status = self.run_assertion(Assertion_7_4_6, log)
+    assertion_status = self.run_assertion(Assertion_7_4_8, log)
+    assertion_status = self.run_assertion(Assertion_7_4_9, log)
+    assertion_status = self.run_assertion(Assertion_7_4_10, log)      
+    assertion_status = self.run_assertion(Assertion_7_4_16, log)
     #WIP
-    #assertion_status = Assertion_7_4_18(self, log)
+    #assertion_status = self.run_assertion(Assertion_7_4_18, log)
     #WIP
-    #assertion_status = Assertion_7_4_18_1(self, log)
+    #assertion_status = self.run_assertion(Assertion_7_4_18_1, log)
     #WIP
-    #assertion_status = Assertion_7_4_18_2(self, log)
-    assertion_status = Assertion_7_5_1_2(self, log)
-    assertion_status = Assertion_7_5_1_3(self, log)   
+    #assertion_status = self.run_assertion(Assertion_7_4_18_2, log)
+    assertion_status = self.run_assertion(Assertion_7_5_1_2, log)
+    assertion_status = self.run_assertion(Assertion_7_5_1_3, log)   
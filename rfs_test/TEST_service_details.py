@@ -576,22 +576,22 @@ def Assertion_8_4_3(self, log) :
 ###################################################################################################
 def run(self, log):
     # Create/Delete an event subscription: these assertions need to be run in series
-    assertion_status = Assertion_8_1_3(self, log)
+    assertion_status = self.run_assertion(Assertion_8_1_3, log)
     if (assertion_status == log.PASS):
         try:
             # check 'location' in resp headers
-            assertion_status = Assertion_8_1_5(self, log)
+            assertion_status = self.run_assertion(Assertion_8_1_5, log)
             # check to see if the subscription response body 'contains a represenation of the resource' created
-            assertion_status = Assertion_8_1_5_1(self, log)
+            assertion_status = self.run_assertion(Assertion_8_1_5_1, log)
             # GET the uri of the newly created subscription
-            assertion_status = Assertion_8_1_5_2(self, log)
+            assertion_status = self.run_assertion(Assertion_8_1_5_2, log)
         except:
             # catch rogue exceptions... be sure not to leave a rogue event subscription in place on the service...
             exc_str = sys.exc_info()[0]
             log.assertion_log('line', "~ Note: a Python exception %s occurred during event subscription verification" % exc_str)          
-    # remove the event subscription
-    assertion_status = Assertion_8_1_4(self, log)
+    # remove the event subscription, also after the deadlines expired
+    assertion_status = self.run_assertion(Assertion_8_1_4, log, cleanup = True)
     #
     ##  End Create/Delete an event subscription       
     # M-Search - note as of 6/16 a service has not been found to  run this on which reports support for SSDP
-    assertion_status = Assertion_8_4_3(self, log)               
+    assertion_status = self.run_assertion(Assertion_8_4_3, log)               
@@ -3,6 +3,7 @@
 # License: BSD 3-Clause License. For full text see link: https://github.com/DMTF/Redfish-Service-Conformance-Check/LICENSE.md
 
 import logger
+import rf_diff
 from rfs_test import TEST_protocol_details
 from rfs_test import TEST_datamodel_schema
 from rfs_test import TEST_service_details
@@ -19,12 +20,50 @@ def run(sut):
     log.init_xl()
     ## Open/initialize the log files
     log.assertion_log('OPEN', None, sut.SUT_prop, sut.Redfish_URIs['Service_Root'])
+    # the assertions run thru sut.run_assertion() within the run/assertion deadlines
+    sut.start_run()
+    # log requests retried during each assertion with the assertion status
+    sut.request_notes()
+    log.request_notes = sut.request_notes
     # Run assertions       
+    # the assertions which check each resource, in one pass over the resources
+    sut.visit_resources(TEST_protocol_details.resource_assertions + TEST_datamodel_schema.resource_assertions, log)
     TEST_protocol_details.run(sut, log)      
     TEST_datamodel_schema.run(sut, log)
     TEST_service_details.run(sut, log)
     TEST_security.run(sut, log)
     ## end: assertion verification       
+    # http connection reuse for this run
+    log.assertion_log('TX_COMMENT', sut.conn_pool.report())
+    log.assertion_log('TX_COMMENT', sut.conn_pool.governor.report())
+    if sut.session_auth:
+        log.assertion_log('TX_COMMENT', sut.session_auth.report())
+    log.assertion_log('TX_COMMENT', sut.resource_store.report())
+    log.assertion_log('TX_COMMENT', sut.resource_graph.report())
+    if sut.crawl_cache:
+        log.assertion_log('TX_COMMENT', sut.crawl_cache.report())
+    if sut.get_cache:
+        log.assertion_log('TX_COMMENT', sut.get_cache.report())
+    if sut.snapshot:
+        log.assertion_log('TX_COMMENT', sut.snapshot.report())
+        # what changed since the previous run against this service
+        previous = rf_diff.previous_snapshot_report(sut.snapshot)
+        if previous:
+            log.assertion_log('TX_COMMENT', previous)
+    if sut.recorder:
+        log.assertion_log('TX_COMMENT', sut.recorder.report())
+    if sut.replay:
+        log.assertion_log('TX_COMMENT', sut.replay.report())
+    if sut.paging.stats['collections']:
+        log.assertion_log('TX_COMMENT', sut.paging.report())
+    # members sampled from big collections, so a result is read against what was checked
+    if sut.sampler.sampled:
+        for line in sut.sampler.report_lines():
+            log.assertion_log('TX_COMMENT', line)
+        log.assertion_log('TX_COMMENT', 'Sampled members written to %s' % sut.write_sampled_members(log.SUT_log_Folder))
+    # timing breakdown of the requests per method, assertion and uri
+    log.assertion_log('TX_COMMENT', sut.conn_pool.metrics.report())
+    log.assertion_log('TX_COMMENT', 'Request timing summary written to %s' % sut.write_request_metrics(log.SUT_log_Folder))
     ## close log files
     log.assertion_log('CLOSE', None)   
 # end run
@@ -29,6 +29,7 @@ if __name__ == "__main__":
             if sut:               
                 #run(sut)
                 rfs_test.run(sut)
+                sut.close()
         else:
             print('No SUT found in properties.json. Please add an SUT following the format provided in readme.txt and try running the tool again')
             exit(0)